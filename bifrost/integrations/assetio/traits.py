@@ -12,6 +12,7 @@ including trait conversion, validation, and discovery.
 """
 
 import logging
+import operator
 from typing import Dict, List, Optional, Set, Any, Tuple, Union
 
 # Import OpenAssetIO modules if available
@@ -28,6 +29,9 @@ from ...core.config import get_config
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Fetches the relationship fields of a dependency in a single call
+_get_dependency_fields = operator.attrgetter('dependency_type', 'dependent_asset_id', 'optional')
+
 
 class BifrostTraitHandler:
     """
@@ -37,32 +41,32 @@ class BifrostTraitHandler:
     and OpenAssetIO traits, as well as discovering and validating traits.
     """
     
-    # Define standard trait sets used by Bifrost
+    # Define standard trait sets used by Bifrost (immutable, merged by set union)
     STANDARD_TRAIT_SETS = {
-        "basic": [
+        "basic": frozenset({
             "locatableContent",
             "defaultName"
-        ],
-        "versioned": [
+        }),
+        "versioned": frozenset({
             "locatableContent",
             "defaultName",
             "versionedContent"
-        ],
-        "media": [
+        }),
+        "media": frozenset({
             "locatableContent",
             "defaultName",
             "versionedContent",
             "mediaSource",
             "thumbnailable"
-        ],
-        "publish": [
+        }),
+        "publish": frozenset({
             "locatableContent",
             "defaultName",
             "versionedContent",
             "publishableContent",
             "managementPolicy"
-        ],
-        "full": [
+        }),
+        "full": frozenset({
             "locatableContent",
             "defaultName",
             "versionedContent",
@@ -74,7 +78,7 @@ class BifrostTraitHandler:
             "relationshipManagement",
             "metadataQuerying",
             "statusTracking"
-        ]
+        })
     }
     
     def __init__(self):
@@ -127,6 +131,9 @@ class BifrostTraitHandler:
             "relationshipManagement": self._handle_relationship_trait,
         }
         
+        # Converters generated for each standard trait set
+        self._specialized = self._build_specialized_converters()
+        
     def _build_reverse_map(self) -> Dict[Tuple[str, str], str]:
         """
         Build a reverse mapping from trait properties to asset attributes.
@@ -141,6 +148,44 @@ class BifrostTraitHandler:
             
         return reverse_map
     
+    def _build_specialized_converters(self) -> Dict[str, Any]:
+        """
+        Generate a direct-mapping converter function for each standard trait set.
+        
+        Each generated function reads exactly the attributes its trait set needs
+        and writes them with literal keys, so no map iteration or path splitting
+        happens per asset.
+        
+        Returns:
+            A dictionary mapping standard set name to converter function
+        """
+        converters = {}
+        
+        for set_name in self.STANDARD_TRAIT_SETS:
+            expanded = self._expand_trait_set([set_name])
+            lines = [f"def _convert_{set_name}(asset, result):"]
+            
+            for asset_attr, (trait_name, prop_path) in self.asset_to_trait_map.items():
+                if trait_name not in expanded:
+                    continue
+                    
+                *parents, leaf = prop_path.split(".")
+                target = f"result.setdefault({trait_name!r}, {{}})"
+                for part in parents:
+                    target += f".setdefault({part!r}, {{}})"
+                    
+                lines.append(f"    value = asset_value(asset, {asset_attr!r})")
+                lines.append("    if value is not None:")
+                lines.append(f"        {target}[{leaf!r}] = value")
+                
+            lines.append("    return result")
+            
+            namespace = {"asset_value": self._get_asset_value}
+            exec("\n".join(lines), namespace)
+            converters[set_name] = namespace[f"_convert_{set_name}"]
+            
+        return converters
+    
     def discover_traits(self, asset: Any) -> Set[str]:
         """
         Discover the OpenAssetIO traits supported by a Bifrost asset.
@@ -160,10 +205,7 @@ class BifrostTraitHandler:
         trait_coverage = {}
         
         for asset_attr, (trait_name, _) in self.asset_to_trait_map.items():
-            if not hasattr(asset, asset_attr):
-                continue
-                
-            value = getattr(asset, asset_attr)
+            value = self._get_asset_value(asset, asset_attr)
             if value is not None:
                 trait_coverage.setdefault(trait_name, []).append(asset_attr)
                 
@@ -197,17 +239,19 @@ class BifrostTraitHandler:
         # Expand any standard trait sets
         expanded_traits = self._expand_trait_set(trait_set)
         
-        # Process direct mappings
-        for asset_attr, (trait_name, prop_path) in self.asset_to_trait_map.items():
-            if trait_name not in expanded_traits:
-                continue
-                
-            if not hasattr(asset, asset_attr):
-                continue
-                
-            value = getattr(asset, asset_attr)
-            if value is not None:
-                self._set_nested_value(result, trait_name, prop_path, value)
+        specialized = self._specialized.get(trait_set[0]) if len(trait_set) == 1 else None
+        if specialized is not None:
+            # A single standard set has a generated converter
+            specialized(asset, result)
+        else:
+            # Process direct mappings
+            for asset_attr, (trait_name, prop_path) in self.asset_to_trait_map.items():
+                if trait_name not in expanded_traits:
+                    continue
+                    
+                value = self._get_asset_value(asset, asset_attr)
+                if value is not None:
+                    self._set_nested_value(result, trait_name, prop_path, value)
                 
         # Process custom traits
         for trait_name in expanded_traits:
@@ -237,7 +281,7 @@ class BifrostTraitHandler:
                 
             value = self._get_nested_value(traits_data, trait_name, prop_path)
             if value is not None:
-                setattr(asset, asset_attr, value)
+                self._set_asset_value(asset, asset_attr, value)
                 
         # Process custom traits
         for trait_name, handler in self.custom_trait_handlers.items():
@@ -246,6 +290,45 @@ class BifrostTraitHandler:
                 
         return asset
     
+    @staticmethod
+    def _get_asset_value(asset: Any, asset_attr: str) -> Any:
+        """
+        Get a mapped attribute from an asset, falling back to its metadata.
+        
+        Args:
+            asset: A Bifrost asset object
+            asset_attr: The asset attribute name
+            
+        Returns:
+            The attribute value, or None if the asset has no such value
+        """
+        try:
+            return getattr(asset, asset_attr)
+        except AttributeError:
+            metadata = getattr(asset, "metadata", None)
+            return metadata.get(asset_attr) if isinstance(metadata, dict) else None
+            
+    @staticmethod
+    def _set_asset_value(asset: Any, asset_attr: str, value: Any) -> None:
+        """
+        Set a mapped attribute on an asset.
+        
+        Slotted models only accept their declared fields, so values for other
+        attributes are stored in the asset's metadata instead.
+        
+        Args:
+            asset: A Bifrost asset object
+            asset_attr: The asset attribute name
+            value: The value to set
+        """
+        try:
+            setattr(asset, asset_attr, value)
+        except AttributeError:
+            metadata = getattr(asset, "metadata", None)
+            if not isinstance(metadata, dict):
+                raise
+            metadata[asset_attr] = value
+            
     def _expand_trait_set(self, trait_set: List[str]) -> Set[str]:
         """
         Expand a trait set by resolving standard trait set names.
@@ -261,7 +344,7 @@ class BifrostTraitHandler:
         for trait in trait_set:
             if trait in self.STANDARD_TRAIT_SETS:
                 # It's a standard trait set, expand it
-                expanded.update(self.STANDARD_TRAIT_SETS[trait])
+                expanded |= self.STANDARD_TRAIT_SETS[trait]
             else:
                 # It's an individual trait
                 expanded.add(trait)
@@ -357,21 +440,17 @@ class BifrostTraitHandler:
                 return
                 
             # Convert dependencies to relationship traits
-            relationships = []
-            
-            for dep in asset.dependencies:
-                relationship = {
-                    "type": dep.dependency_type or "default",
-                    "targetId": str(dep.dependent_asset_id),
-                    "optional": bool(dep.optional),
-                    "metadata": {}
+            relationships = [
+                {
+                    "type": dep_type or "default",
+                    "targetId": str(target_id),
+                    "optional": bool(optional),
+                    # Add any additional metadata
+                    "metadata": getattr(dep, 'metadata', None) or {}
                 }
-                
-                # Add any additional metadata
-                if hasattr(dep, 'metadata') and dep.metadata:
-                    relationship["metadata"] = dep.metadata
-                    
-                relationships.append(relationship)
+                for dep in asset.dependencies
+                for dep_type, target_id, optional in (_get_dependency_fields(dep),)
+            ]
                 
             result["relationshipManagement"] = {
                 "relationships": relationships
@@ -4,6 +4,8 @@
 #
 # Created: 2025-04-02
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 import re
@@ -14,6 +16,22 @@ from ...models.asset import Asset
 
 logger = logging.getLogger(__name__)
 
+# Asset ID format when using UUIDs, compiled once at import
+_UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+
+def _uri_scheme() -> str:
+    """Get the configured URI scheme for Bifrost assets."""
+    uri_scheme: str = get_config("assetio.uri_scheme", "bifrost")
+    return uri_scheme
+
+
+@lru_cache(maxsize=8)
+def _assets_prefix_bytes(uri_scheme: str) -> bytes:
+    """Get the encoded asset URI prefix for a URI scheme."""
+    return f"{uri_scheme}:///assets/".encode('utf-8')
+
+
 class AssetUriMapper:
     """
     Maps between Bifrost assets and OpenAssetIO URIs.
@@ -33,7 +51,7 @@ class AssetUriMapper:
         Returns:
             URI string in the form "bifrost:///assets/{asset_id}"
         """
-        uri_scheme = get_config("assetio.uri_scheme", "bifrost")
+        uri_scheme = _uri_scheme()
         return f"{uri_scheme}:///assets/{asset.id}"
         
     @staticmethod
@@ -47,21 +65,28 @@ class AssetUriMapper:
         Returns:
             Asset ID extracted from the URI, or None if invalid
         """
-        uri_scheme = get_config("assetio.uri_scheme", "bifrost")
-        prefix = f"{uri_scheme}:///assets/"
+        return AssetUriMapper.uri_to_asset_id_bytes(uri.encode('utf-8'))
+        
+    @staticmethod
+    def uri_to_asset_id_bytes(uri: bytes) -> Optional[str]:
+        """
+        Extract asset ID from an encoded URI without decoding it first.
+        
+        Args:
+            uri: An OpenAssetIO URI as UTF-8 bytes, e.g. read from a socket
+            
+        Returns:
+            Asset ID extracted from the URI, or None if invalid
+        """
+        prefix = _assets_prefix_bytes(_uri_scheme())
         
         if not uri.startswith(prefix):
             return None
             
-        asset_id = uri[len(prefix):]
-        
         # Handle any additional path components or query params by taking just the first part
-        if '/' in asset_id:
-            asset_id = asset_id.split('/')[0]
-        if '?' in asset_id:
-            asset_id = asset_id.split('?')[0]
-            
-        return asset_id
+        asset_id = uri[len(prefix):].partition(b'/')[0].partition(b'?')[0]
+        
+        return asset_id.decode('utf-8')
         
     @staticmethod
     def path_to_uri(path: Union[str, Path]) -> Optional[str]:
@@ -80,7 +105,7 @@ class AssetUriMapper:
         parts = path.parts
         
         # Get the URI scheme
-        uri_scheme = get_config("assetio.uri_scheme", "bifrost")
+        uri_scheme = _uri_scheme()
         
         # Try to find 'assets' in the path
         if 'assets' not in parts:
@@ -97,8 +122,7 @@ class AssetUriMapper:
         
         # Basic validation for asset ID format (this will depend on your ID format)
         # For example, if using UUIDs:
-        uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
-        if len(asset_id) == 36 and uuid_pattern.match(asset_id):
+        if len(asset_id) == 36 and _UUID_PATTERN.match(asset_id):
             return f"{uri_scheme}:///assets/{asset_id}"
             
         # Alternative formats - if your asset IDs follow different patterns
@@ -141,27 +165,28 @@ class AssetUriMapper:
                     if file.is_file():
                         return file
         
-        # Otherwise, find the latest version by directory name pattern
-        version_dirs = []
+        # Otherwise, find the latest version by directory name pattern.
+        # DirEntry caches its stat results, so no Path objects are built per entry.
+        latest_version, latest_dir = -1, None
         if asset_dir.exists():
-            for dir_path in asset_dir.iterdir():
-                if dir_path.is_dir() and dir_path.name.startswith('v'):
-                    try:
-                        # Extract version number from directory name
-                        version_num = int(dir_path.name[1:])
-                        version_dirs.append((version_num, dir_path))
-                    except ValueError:
-                        # Not a version directory
-                        pass
-        
-        # Find the highest version
-        if version_dirs:
-            latest_version, latest_dir = max(version_dirs, key=lambda x: x[0])
-            
-            # Find a file in this directory (could be any file type)
-            for file in latest_dir.iterdir():
-                if file.is_file():
-                    return file
+            with os.scandir(asset_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('v') and entry.is_dir():
+                        try:
+                            # Extract version number from directory name
+                            version_num = int(entry.name[1:])
+                        except ValueError:
+                            # Not a version directory
+                            continue
+                        if version_num > latest_version:
+                            latest_version, latest_dir = version_num, entry.path
+        
+        # Find a file in the highest version directory (could be any file type)
+        if latest_dir is not None:
+            with os.scandir(latest_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        return Path(entry.path)
         
         return None
     
@@ -176,7 +201,7 @@ class AssetUriMapper:
         Returns:
             The detected URI or None
         """
-        uri_scheme = get_config("assetio.uri_scheme", "bifrost")
+        uri_scheme = _uri_scheme()
         pattern = re.compile(f"{uri_scheme}:///assets/[^\\s/]+")
         
         match = pattern.search(text)
@@ -196,7 +221,7 @@ class AssetUriMapper:
         Returns:
             True if valid, False otherwise
         """
-        uri_scheme = get_config("assetio.uri_scheme", "bifrost")
+        uri_scheme = _uri_scheme()
         pattern = re.compile(f"^{uri_scheme}:///assets/[^\\s/]+$")
         
         return bool(pattern.match(uri))
@@ -9,7 +9,6 @@ import os
 from typing import Dict, List, Optional
 
 from ...core.config import get_config
-from .rv_service import RVService
 
 __all__ = ['RVService']
 
@@ -42,3 +41,6 @@ if RV_AVAILABLE:
         os.environ["RV_PACKAGE_PATH"] = str(rv_package_dir)
         
     logger.info("OpenRV environment configured")
+
+# Imported after RV_AVAILABLE is set, since rv_service reads it at import time
+from .rv_service import RVService  # noqa: E402
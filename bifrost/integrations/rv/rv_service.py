@@ -4,19 +4,82 @@
 #
 # Created: 2025-04-14
 
+import hashlib
 import os
 import subprocess
 import tempfile
 import json
 import logging
-from typing import List, Optional, Dict, Any, Union
+import re
+import shutil
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Mapping, NamedTuple, Optional, Dict, Any, Sequence, Set, Tuple, Union
 from pathlib import Path
+from types import MappingProxyType
 
 from ...core.config import get_config
 from . import RV_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Use the streaming JSON parser for RV annotation exports if available
+IJSON_AVAILABLE = False
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    logger.debug("ijson not available, RV annotation exports will be loaded in full")
+
+# Use orjson for note JSON round-trips if available
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    logger.debug("orjson not available, using the standard json module for RV notes")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Review settings used by the RV service, read from configuration once
+_ReviewConfig = namedtuple(
+    "_ReviewConfig", ["rv_binary", "rv_enabled", "rv_session_dir", "rv_notes_package"]
+)
+
+# Reviews resolved for playback and export: review ID -> (expiry time, review)
+_REVIEW_CACHE: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_REVIEW_CACHE_TTL = 30.0
+_REVIEW_CACHE_SIZE = 256
+
+# Shared read-only stand-in for notes without metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Characters not allowed in session file names (underscores are kept as-is)
+_UNSAFE_NAME_CHARS = re.compile(r"\W")
+
+
+class LaunchSpec(NamedTuple):
+    """A set of media files and playback options to show in RV."""
+    file_paths: List[Union[str, Path]]
+    session_name: Optional[str] = None
+    comparison_mode: bool = False
+    start_frame: Optional[int] = None
+    end_frame: Optional[int] = None
+
 
 class RVService:
     """
@@ -26,14 +89,31 @@ class RVService:
     for creating RV session files for more complex review sessions.
     """
     
-    def __init__(self):
+    # Command-line fragments shared by RV invocations
+    _QUIT_SUFFIX = ("-quit",)
+    _ANNOTATIONS_EXPORT = "require('annotations').export('{}')"
+    _ANNOTATIONS_IMPORT = "require('annotations').import('{}')"
+    
+    # Entry points provided by the bifrost_notes RV package (see pkg/bifrost_notes)
+    _NOTES_PACKAGE_FLAG = "bifrost_notes_path={}"
+    _NOTES_PACKAGE_EXPORT = "bifrost_notes.exportNotes();"
+    _NOTES_PACKAGE_IMPORT = "bifrost_notes.importNotes();"
+    
+    # Session directories already created by this process
+    _ensured_dirs: Set[str] = set()
+    
+    def __init__(self) -> None:
         """Initialize the RV service."""
-        self.rv_binary = get_config("review.rv_binary_path", "rv")
-        self.rv_enabled = get_config("review.rv_enabled", True) and RV_AVAILABLE
-        self.rv_session_dir = get_config("review.rv_session_dir", "temp/rv_sessions")
+        review_config = self._review_config()
+        self.rv_binary = review_config.rv_binary
+        self.rv_enabled = review_config.rv_enabled and RV_AVAILABLE
+        self.rv_session_dir = review_config.rv_session_dir
+        self.rv_notes_package = review_config.rv_notes_package
         
-        # Ensure session directory exists
-        os.makedirs(self.rv_session_dir, exist_ok=True)
+        # Ensure session directory exists, once per process
+        if self.rv_session_dir not in RVService._ensured_dirs:
+            os.makedirs(self.rv_session_dir, exist_ok=True)
+            RVService._ensured_dirs.add(self.rv_session_dir)
         
         # Log initialization status
         if self.rv_enabled:
@@ -41,6 +121,98 @@ class RVService:
         else:
             logger.warning("RV service initialized but RV is not available or disabled")
         
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _review_config(cls) -> _ReviewConfig:
+        """
+        Read the review configuration subtree in a single lookup.
+        
+        Returns:
+            The RV settings from the review configuration
+        """
+        review_config = get_config("review", {}) or {}
+        return _ReviewConfig(
+            rv_binary=review_config.get("rv_binary_path", "rv"),
+            rv_enabled=review_config.get("rv_enabled", True),
+            rv_session_dir=review_config.get("rv_session_dir", "temp/rv_sessions"),
+            rv_notes_package=review_config.get("rv_notes_package", False),
+        )
+        
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        """
+        Create a sanitized filename by replacing non-alphanumeric characters.
+        
+        Args:
+            name: Name to sanitize
+            
+        Returns:
+            The name with every non-alphanumeric character replaced by "_"
+        """
+        return _UNSAFE_NAME_CHARS.sub("_", name)
+        
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _stringify_paths(paths: Tuple[Union[str, Path], ...]) -> Tuple[str, ...]:
+        """
+        Convert media paths to strings for an RV command line.
+        
+        Args:
+            paths: Tuple of media paths
+            
+        Returns:
+            Tuple of path strings, shared between calls with the same paths
+        """
+        return tuple(str(p) for p in paths)
+        
+    def _notes_command_args(self, action: str, notes_path: str) -> List[str]:
+        """
+        Build the RV arguments that import or export annotations as JSON.
+        
+        When the bifrost_notes package is installed in RV (review.rv_notes_package),
+        the notes path is passed as a command-line flag to its precompiled entry
+        points; otherwise the annotation snippet is evaluated from source.
+        
+        Args:
+            action: Either "import" or "export"
+            notes_path: Path of the JSON notes file
+            
+        Returns:
+            List of RV command-line arguments
+        """
+        if self.rv_notes_package:
+            entry_point = self._NOTES_PACKAGE_EXPORT if action == "export" else self._NOTES_PACKAGE_IMPORT
+            return ["-flags", self._NOTES_PACKAGE_FLAG.format(notes_path), "-evaluate", entry_point]
+            
+        snippet = self._ANNOTATIONS_EXPORT if action == "export" else self._ANNOTATIONS_IMPORT
+        return ["-evaluate", snippet.format(notes_path)]
+        
+    @staticmethod
+    def _run_rv(argv: List[str], *, background: bool = False,
+                capture_output: bool = False) -> Tuple[int, str]:
+        """
+        Run an RV command.
+        
+        Args:
+            argv: Full RV command line, starting with the RV binary
+            background: Start RV without waiting for it to exit
+            capture_output: Capture stdout as well as stderr for diagnostics
+            
+        Returns:
+            Tuple of (return code, stderr output); (0, "") for background launches
+        """
+        if background:
+            subprocess.Popen(argv)
+            return 0, ""
+            
+        if capture_output:
+            result = subprocess.run(argv, capture_output=True, text=True)
+        else:
+            # Only the return code and stderr are used, so don't buffer stdout
+            result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            
+        return result.returncode, result.stderr
+        
     def launch_viewer(self, file_paths: List[Union[str, Path]], 
                      session_name: Optional[str] = None,
                      comparison_mode: bool = False,
@@ -56,6 +228,24 @@ class RVService:
             start_frame: Optional start frame
             end_frame: Optional end frame
             
+        Returns:
+            True if RV was launched successfully, False otherwise
+        """
+        return self.launch_viewer_batch([
+            LaunchSpec(file_paths, session_name, comparison_mode, start_frame, end_frame)
+        ])
+        
+    def launch_viewer_batch(self, sessions: List[LaunchSpec]) -> bool:
+        """
+        Launch a single OpenRV process showing the media of several launch specs.
+        
+        A single spec produces the same command as launch_viewer. With several
+        specs, every file is added as a source of one RV session; frame ranges
+        are applied per source using RV's "[ file -in N -out M ]" syntax.
+        
+        Args:
+            sessions: Launch specs to show in the viewer
+            
         Returns:
             True if RV was launched successfully, False otherwise
         """
@@ -63,37 +253,63 @@ class RVService:
             logger.warning("OpenRV integration is disabled or unavailable")
             return False
             
-        if not file_paths:
+        sessions = [spec for spec in sessions if spec.file_paths]
+        if not sessions:
             logger.warning("No files provided to open in RV")
             return False
             
-        # Convert Path objects to strings
-        str_paths = [str(p) for p in file_paths]
-            
         # Build command
         cmd = [self.rv_binary]
         
-        # Add session name if provided
-        if session_name:
-            cmd.extend(["-sessname", session_name])
+        if len(sessions) == 1:
+            spec = sessions[0]
             
-        # Add comparison mode if enabled
-        if comparison_mode and len(str_paths) > 1:
-            cmd.append("-c")
-            
-        # Add frame range if specified
-        if start_frame is not None:
-            cmd.extend(["-s", str(start_frame)])
-        if end_frame is not None:
-            cmd.extend(["-e", str(end_frame)])
+            # Convert Path objects to strings
+            str_paths = self._stringify_paths(tuple(spec.file_paths))
             
-        # Add files to open
-        cmd.extend(str_paths)
+            # Add session name if provided
+            if spec.session_name:
+                cmd.extend(["-sessname", spec.session_name])
+                
+            # Add comparison mode if enabled
+            if spec.comparison_mode and len(str_paths) > 1:
+                cmd.append("-c")
+                
+            # Add frame range if specified
+            if spec.start_frame is not None:
+                cmd.extend(["-s", str(spec.start_frame)])
+            if spec.end_frame is not None:
+                cmd.extend(["-e", str(spec.end_frame)])
+                
+            # Add files to open
+            cmd.extend(str_paths)
+        else:
+            # Name the combined session after the first named spec
+            session_name = next((spec.session_name for spec in sessions if spec.session_name), None)
+            if session_name:
+                cmd.extend(["-sessname", session_name])
+                
+            if any(spec.comparison_mode for spec in sessions):
+                cmd.append("-c")
+                
+            # Add each spec's files, scoping frame ranges to their own sources
+            for spec in sessions:
+                frame_args = []
+                if spec.start_frame is not None:
+                    frame_args.extend(["-in", str(spec.start_frame)])
+                if spec.end_frame is not None:
+                    frame_args.extend(["-out", str(spec.end_frame)])
+                    
+                for path in self._stringify_paths(tuple(spec.file_paths)):
+                    if frame_args:
+                        cmd.extend(["[", path, *frame_args, "]"])
+                    else:
+                        cmd.append(path)
         
         try:
             # Launch RV
             logger.info(f"Launching RV with command: {' '.join(cmd)}")
-            subprocess.Popen(cmd)
+            self._run_rv(cmd, background=True)
             return True
         except Exception as e:
             logger.error(f"Error launching RV: {e}")
@@ -119,32 +335,40 @@ class RVService:
             return None
             
         # Create a sanitized filename from the session name
-        safe_name = "".join(c if c.isalnum() else "_" for c in session_name)
+        safe_name = self._safe_name(session_name)
         session_file = Path(self.rv_session_dir) / f"{safe_name}.rv"
         
         try:
             # Convert Path objects to strings
-            str_paths = [str(p) for p in file_paths]
-            
-            # Create RV session file using RV command
-            cmd = [self.rv_binary]
+            str_paths = self._stringify_paths(tuple(file_paths))
             
-            # Add session name
-            cmd.extend(["-sessname", session_name])
+            # Reuse a session RV already saved for the same inputs
+            cache_dir = Path(self.rv_session_dir) / ".cache"
+            cache_key = hashlib.blake2b("\0".join((*str_paths, session_name)).encode(), digest_size=16).hexdigest()
+            cached_file = cache_dir / f"{cache_key}.rv"
             
-            # Add files
-            cmd.extend(str_paths)
+            if self._is_session_cache_fresh(cached_file, str_paths):
+                self._link_file(cached_file, session_file)
+                logger.info(f"Reused cached RV session file: {session_file}")
+                return session_file
+                
+            # Never let RV write through a link into a cache entry
+            if session_file.exists():
+                session_file.unlink()
             
-            # Save session
-            cmd.extend(["-save", str(session_file)])
+            # Create RV session file using RV command: session name, files, then save
+            cmd = [self.rv_binary, "-sessname", session_name, *str_paths, "-save", str(session_file)]
             
             # Run command
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            returncode, stderr = self._run_rv(cmd)
             
-            if result.returncode != 0:
-                logger.error(f"Failed to create RV session: {result.stderr}")
+            if returncode != 0:
+                logger.error(f"Failed to create RV session: {stderr}")
                 return None
                 
+            cache_dir.mkdir(exist_ok=True)
+            self._link_file(session_file, cached_file)
+                
             logger.info(f"Created RV session file: {session_file}")
             return session_file
             
@@ -152,7 +376,97 @@ class RVService:
             logger.error(f"Error creating RV session file: {e}")
             return None
             
-    def play_review(self, review_id: str, shot_service=None, asset_service=None) -> bool:
+    @staticmethod
+    def _is_session_cache_fresh(cached_file: Path, source_paths: Sequence[str]) -> bool:
+        """
+        Check whether a cached session file is newer than all of its sources.
+        
+        Args:
+            cached_file: Path to the cached session file
+            source_paths: Media files the session was created from
+            
+        Returns:
+            True if the cached session can be reused, False otherwise
+        """
+        try:
+            cached_mtime = cached_file.stat().st_mtime
+            return all(os.path.getmtime(p) < cached_mtime for p in source_paths)
+        except OSError:
+            # Missing cache entry or source file
+            return False
+            
+    @staticmethod
+    def _link_file(source: Path, target: Path) -> None:
+        """
+        Hard-link a file to a new location, copying it if linking isn't possible.
+        
+        Args:
+            source: Existing file
+            target: Location to link it to, replacing any existing file
+        """
+        if target.exists():
+            target.unlink()
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+            
+    @staticmethod
+    def _versions_by_number(entity: Any) -> Dict[str, Any]:
+        """
+        Index a shot's or asset's versions by their version number.
+        
+        Args:
+            entity: A shot or asset with a versions list
+            
+        Returns:
+            Dictionary mapping version number strings to versions
+        """
+        # Iterate in reverse so the first version with a given number wins
+        return {str(v.version_number): v for v in reversed(entity.versions)}
+        
+    def _get_review(self, review_id: str) -> Optional[Any]:
+        """
+        Get a review, reusing it if it was fetched within the cache TTL.
+        
+        Args:
+            review_id: ID of the review
+            
+        Returns:
+            Review object or None if not found
+        """
+        now = time.monotonic()
+        cached = _REVIEW_CACHE.get(review_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+            
+        # This requires the review_service to be imported at runtime to avoid
+        # circular dependencies
+        from ...services.review_service import review_service
+        
+        review = review_service.get_review(review_id)
+        if review is not None:
+            _REVIEW_CACHE[review_id] = (now + _REVIEW_CACHE_TTL, review)
+            _REVIEW_CACHE.move_to_end(review_id)
+            if len(_REVIEW_CACHE) > _REVIEW_CACHE_SIZE:
+                _REVIEW_CACHE.popitem(last=False)
+                
+        return review
+        
+    @staticmethod
+    def invalidate_review(review_id: Optional[str] = None) -> None:
+        """
+        Drop a cached review after it has been modified.
+        
+        Args:
+            review_id: ID of the review to drop, or None to drop all cached reviews
+        """
+        if review_id is None:
+            _REVIEW_CACHE.clear()
+        else:
+            _REVIEW_CACHE.pop(review_id, None)
+        
+    def play_review(self, review_id: str, shot_service: Any = None, asset_service: Any = None) -> bool:
         """
         Play a review session in RV.
         
@@ -167,56 +481,137 @@ class RVService:
         Returns:
             True if the review was played successfully, False otherwise
         """
-        # This requires the review_service to be imported at runtime to avoid
-        # circular dependencies
-        from ...services.review_service import review_service
+        return self.play_reviews([review_id], shot_service, asset_service)
         
-        # Get the review
-        review = review_service.get_review(review_id)
-        if not review:
-            logger.error(f"Review not found: {review_id}")
+    def play_reviews(self, review_ids: List[str], shot_service: Any = None,
+                     asset_service: Any = None) -> bool:
+        """
+        Play several review sessions in a single RV process.
+        
+        Args:
+            review_ids: IDs of the reviews to play
+            shot_service: Optional ShotService for accessing shots
+            asset_service: Optional AssetService for accessing assets
+            
+        Returns:
+            True if RV was launched successfully, False otherwise
+        """
+        sessions = []
+        for review_id in review_ids:
+            # Get the review
+            review = self._get_review(review_id)
+            if not review:
+                logger.error(f"Review not found: {review_id}")
+                continue
+                
+            file_paths = self._collect_review_media(review, shot_service, asset_service)
+            if not file_paths:
+                logger.warning(f"No valid media files found for review: {review_id}")
+                continue
+                
+            sessions.append(LaunchSpec(file_paths, session_name=review.name))
+            
+        if not sessions:
             return False
             
-        # Collect file paths for all items in the review
-        file_paths = []
+        # Launch RV with the files
+        return self.launch_viewer_batch(sessions)
+        
+    def _collect_review_media(self, review: Any, shot_service: Any = None,
+                              asset_service: Any = None) -> List[Union[str, Path]]:
+        """
+        Collect the playable media file paths for the items of a review.
+        
+        Args:
+            review: The review to collect media for
+            shot_service: Optional ShotService for accessing shots
+            asset_service: Optional AssetService for accessing assets
+            
+        Returns:
+            List of existing preview paths, in review item order
+        """
+        # Check every item's own preview up front, overlapping the stat calls
+        existing = self._existing_paths([item.preview_path for item in review.items if item.preview_path])
+        
+        # Pick a candidate media path for each item in the review
+        candidates = []
+        versions_by_entity = {}
         
         for item in review.items:
             # If item has a preview path, use it directly
-            if item.preview_path and os.path.exists(item.preview_path):
-                file_paths.append(item.preview_path)
+            if item.preview_path and item.preview_path in existing:
+                candidates.append(item.preview_path)
                 continue
                 
             # Otherwise look up the item
             if item.item_type == "shot" and shot_service:
-                shot = shot_service.get_shot(item.item_id)
-                if shot:
-                    version = None
-                    for v in shot.versions:
-                        if str(v.version_number) == item.version_id:
-                            version = v
-                            break
-                    
-                    if version and version.preview_path and os.path.exists(version.preview_path):
-                        file_paths.append(version.preview_path)
-                        
+                get_entity = shot_service.get_shot
             elif item.item_type == "asset" and asset_service:
-                asset = asset_service.get_asset(item.item_id)
-                if asset:
-                    version = None
-                    for v in asset.versions:
-                        if str(v.version_number) == item.version_id:
-                            version = v
-                            break
-                    
-                    if version and version.preview_path and os.path.exists(version.preview_path):
-                        file_paths.append(version.preview_path)
+                get_entity = asset_service.get_asset
+            else:
+                continue
+                
+            # Index each entity's versions once, even if several items refer to it
+            key = (item.item_type, item.item_id)
+            if key not in versions_by_entity:
+                entity = get_entity(item.item_id)
+                versions_by_entity[key] = self._versions_by_number(entity) if entity else {}
+                
+            version = versions_by_entity[key].get(item.version_id)
+            if version and version.preview_path:
+                candidates.append(version.preview_path)
         
-        if not file_paths:
-            logger.warning(f"No valid media files found for review: {review_id}")
-            return False
+        # Check the version previews that haven't been seen yet
+        existing |= self._existing_paths([p for p in candidates if p not in existing])
+        
+        return [p for p in candidates if p in existing]
+        
+    @staticmethod
+    def _existing_paths(paths: List[Union[str, Path]]) -> set:
+        """
+        Find which of the given paths exist, stat'ing each unique path once.
+        
+        The checks run on a small thread pool so their latency overlaps when
+        media lives on network storage.
+        
+        Args:
+            paths: Paths to check
             
-        # Launch RV with the files
-        return self.launch_viewer(file_paths, session_name=review.name)
+        Returns:
+            Set of the paths that exist
+        """
+        unique_paths = list(dict.fromkeys(paths))
+        if len(unique_paths) <= 1:
+            return {p for p in unique_paths if os.path.exists(p)}
+            
+        with ThreadPoolExecutor(max_workers=min(16, len(unique_paths))) as executor:
+            found = executor.map(os.path.exists, unique_paths)
+            return {p for p, exists in zip(unique_paths, found) if exists}
+        
+    @staticmethod
+    def _rv_annotation_to_note(annotation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an RV annotation to a Bifrost note dictionary.
+        
+        Args:
+            annotation: Annotation dictionary exported by RV
+            
+        Returns:
+            Note dictionary
+        """
+        return {
+            'content': annotation.get('text', ''),
+            'frame': annotation.get('frame'),
+            'author': annotation.get('author', 'Unknown'),
+            'timestamp': annotation.get('timestamp'),
+            'status': 'open',
+            'metadata': {
+                'rv_id': annotation.get('id'),
+                'rv_type': annotation.get('type'),
+                'rv_color': annotation.get('color'),
+                'rv_properties': annotation.get('properties', {})
+            }
+        }
         
     def import_notes_from_rv(self, session_file: Union[str, Path]) -> List[Dict[str, Any]]:
         """
@@ -238,53 +633,74 @@ class RVService:
             return []
             
         try:
-            # Use RV to extract notes - RV has JSON export options for annotations
-            temp_json = tempfile.mktemp(suffix=".json")
-            cmd = [
-                self.rv_binary,
-                str(session_file),
-                "-evaluate",
-                f"require('annotations').export('{temp_json}')",
-                "-quit"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0 or not os.path.exists(temp_json):
-                logger.error(f"Failed to extract notes from RV session: {result.stderr}")
-                return []
+            # Use RV to extract notes - RV has JSON export options for annotations.
+            # The temp file lives next to the sessions so RV writes to the same filesystem.
+            with tempfile.NamedTemporaryFile(dir=self.rv_session_dir, suffix=".json", delete=False) as f:
+                temp_json = f.name
                 
-            # Read and parse the JSON file
-            with open(temp_json, 'r') as f:
-                notes_data = json.load(f)
+            try:
+                cmd = [
+                    self.rv_binary,
+                    str(session_file),
+                    *self._notes_command_args("export", temp_json),
+                    *self._QUIT_SUFFIX
+                ]
                 
-            # Clean up the temp file
-            os.remove(temp_json)
-            
-            # Convert RV annotations to Bifrost note format
-            notes = []
-            for annotation in notes_data.get('annotations', []):
-                note = {
-                    'content': annotation.get('text', ''),
-                    'frame': annotation.get('frame'),
-                    'author': annotation.get('author', 'Unknown'),
-                    'timestamp': annotation.get('timestamp'),
-                    'status': 'open',
-                    'metadata': {
-                        'rv_id': annotation.get('id'),
-                        'rv_type': annotation.get('type'),
-                        'rv_color': annotation.get('color'),
-                        'rv_properties': annotation.get('properties', {})
-                    }
-                }
-                notes.append(note)
+                returncode, stderr = self._run_rv(cmd, capture_output=True)
                 
-            return notes
+                # The temp file already exists, so an empty file means RV wrote nothing
+                if returncode != 0 or not os.path.getsize(temp_json):
+                    logger.error(f"Failed to extract notes from RV session: {stderr}")
+                    return []
+                    
+                # Parse the JSON file, streaming annotations one at a time when possible
+                with open(temp_json, 'rb') as f:
+                    if IJSON_AVAILABLE:
+                        annotations = ijson.items(f, 'annotations.item', use_float=True)
+                    else:
+                        annotations = _json_loads(f.read()).get('annotations', [])
+                        
+                    # Convert RV annotations to Bifrost note format
+                    return [self._rv_annotation_to_note(annotation) for annotation in annotations]
+            finally:
+                # Clean up the temp file
+                os.remove(temp_json)
             
         except Exception as e:
             logger.error(f"Error importing notes from RV: {e}")
             return []
     
+    @staticmethod
+    def _to_rv_note(note: Any, media_path: str) -> Dict[str, Any]:
+        """
+        Convert a review note to an RV annotation dictionary.
+        
+        Args:
+            note: The review note to convert
+            media_path: Path of the media the note belongs to
+            
+        Returns:
+            Annotation dictionary for RV
+        """
+        # Timestamps loaded from storage are usually already ISO strings
+        timestamp = note.timestamp
+        if type(timestamp) is not str:
+            timestamp = timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp)
+            
+        metadata = note.metadata or _EMPTY_METADATA
+        
+        return {
+            'id': note.id,
+            'type': 'text',
+            'text': note.content,
+            'frame': note.frame or 1,
+            'media': media_path,
+            'author': note.author,
+            'timestamp': timestamp,
+            'color': metadata.get('color', '#FFFF00'),
+            'properties': note.metadata
+        }
+        
     def export_notes_to_rv(self, 
                          review_id: str, 
                          session_file: Union[str, Path] = None) -> Optional[Path]:
@@ -298,48 +714,35 @@ class RVService:
         Returns:
             Path to the created/modified session file, or None if failed
         """
-        # Import review_service at runtime to avoid circular dependencies
-        from ...services.review_service import review_service
-        
         # Get the review
-        review = review_service.get_review(review_id)
+        review = self._get_review(review_id)
         if not review:
             logger.error(f"Review not found: {review_id}")
             return None
             
         # If no session file is provided, create one
         if not session_file:
-            # Create a temp file path for the notes
-            temp_notes = tempfile.mktemp(suffix=".json")
-            
-            # Collect all notes from the review
-            all_notes = []
-            for item in review.items:
-                # Extract the media path if available
-                media_path = str(item.preview_path) if item.preview_path else ""
-                
-                # Add each note
-                for note in item.notes:
-                    rv_note = {
-                        'id': note.id,
-                        'type': 'text',
-                        'text': note.content,
-                        'frame': note.frame or 1,
-                        'media': media_path,
-                        'author': note.author,
-                        'timestamp': note.timestamp.isoformat() if hasattr(note.timestamp, 'isoformat') else str(note.timestamp),
-                        'color': note.metadata.get('color', '#FFFF00'),
-                        'properties': note.metadata
-                    }
-                    all_notes.append(rv_note)
+            # Create a temp file for the notes on the same filesystem as the sessions
+            notes_file = tempfile.NamedTemporaryFile(
+                'wb', dir=self.rv_session_dir, suffix=".json", delete=False
+            )
+            temp_notes = notes_file.name
+            
+            # Collect all notes from the review, with each item's media path if available
+            all_notes = [
+                self._to_rv_note(note, media_path)
+                for item in review.items
+                for media_path in (str(item.preview_path) if item.preview_path else "",)
+                for note in item.notes
+            ]
             
             # Write notes to temp file
-            with open(temp_notes, 'w') as f:
-                json.dump({'annotations': all_notes}, f)
+            with notes_file:
+                notes_file.write(_json_dumps({'annotations': all_notes}))
             
             # Create RV session with the notes
             session_name = f"{review.name}_notes"
-            safe_name = "".join(c if c.isalnum() else "_" for c in session_name)
+            safe_name = self._safe_name(session_name)
             session_file = Path(self.rv_session_dir) / f"{safe_name}.rv"
             
             # Build file paths list from review items
@@ -352,17 +755,16 @@ class RVService:
             if file_paths:
                 cmd = [
                     self.rv_binary,
-                    *[str(p) for p in file_paths],
-                    "-evaluate",
-                    f"require('annotations').import('{temp_notes}')",
+                    *self._stringify_paths(tuple(file_paths)),
+                    *self._notes_command_args("import", temp_notes),
                     "-save",
                     str(session_file)
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                returncode, stderr = self._run_rv(cmd)
                 
-                if result.returncode != 0:
-                    logger.error(f"Failed to create RV session with notes: {result.stderr}")
+                if returncode != 0:
+                    logger.error(f"Failed to create RV session with notes: {stderr}")
                     os.remove(temp_notes)
                     return None
             else:
@@ -4,51 +4,84 @@ OpenUSD integration for Bifrost.
 This module provides integration with OpenUSD (Universal Scene Description),
 allowing Bifrost to work with USD files and leverage USD's powerful
 composition and referencing capabilities.
+
+The pxr modules (``Usd``, ``UsdGeom``, ``Sdf``, ``Ar``) and ``USD_AVAILABLE``
+are resolved lazily on first attribute access, so importing Bifrost doesn't
+pay for loading USD unless it is actually used.
 """
 
 import logging
 import os
 import sys
 from pathlib import Path
+from typing import Any
 
 from ...core.config import get_config
 
 logger = logging.getLogger(__name__)
 
-# Check if USD is available
-USD_AVAILABLE = False
-try:
-    from pxr import Usd, UsdGeom, Sdf, Ar
-    USD_AVAILABLE = True
-except ImportError:
-    logger.warning("OpenUSD modules could not be imported. USD functionality will be disabled.")
-    logger.warning("Install USD with: pip install usd-core")
+# Attributes resolved by importing pxr on first access
+_LAZY_USD_ATTRIBUTES = ("Usd", "UsdGeom", "Sdf", "Ar", "USD_AVAILABLE")
+
+# Whether the pxr import has already been attempted
+_USD_IMPORT_ATTEMPTED = False
+
+# USD enablement never changes at runtime, so read it once
+USD_ENABLED = get_config("usd.enabled", True)
+
+# Whether setup_usd_environment has already configured the environment
+_USD_INITIALIZED = False
 
 # Set up USD environment variables from config if available
-def setup_usd_environment():
+def setup_usd_environment() -> bool:
     """Set up USD environment variables based on configuration."""
-    if not USD_AVAILABLE:
-        return False
+    global _USD_INITIALIZED
+    if _USD_INITIALIZED:
+        return True
     
-    # Get USD configuration
-    usd_enabled = get_config("usd.enabled", True)
-    if not usd_enabled:
+    if not USD_ENABLED:
         logger.info("USD integration is disabled in configuration.")
         return False
     
     # Set environment variables
-    usd_install_dir = get_config("usd.environment.USD_INSTALL_DIR", "")
+    usd_environment = get_config("usd.environment", {}) or {}
+    usd_install_dir = usd_environment.get("USD_INSTALL_DIR", "")
     if usd_install_dir:
         os.environ["USD_INSTALL_DIR"] = str(usd_install_dir)
         
-    plugin_paths = get_config("usd.environment.PXR_PLUGINPATH_NAME", "")
+    plugin_paths = usd_environment.get("PXR_PLUGINPATH_NAME", "")
     if plugin_paths:
         os.environ["PXR_PLUGINPATH_NAME"] = str(plugin_paths)
     
+    _USD_INITIALIZED = True
     logger.info("USD environment variables configured.")
     return True
 
-# Initialize USD support if available
-if USD_AVAILABLE:
+def _import_usd() -> None:
+    """Import the OpenUSD modules into this package on first use."""
+    global _USD_IMPORT_ATTEMPTED
+    if _USD_IMPORT_ATTEMPTED:
+        return
+    _USD_IMPORT_ATTEMPTED = True
+    
+    # Configure plugin paths before pxr discovers its plugins
     setup_usd_environment()
+    
+    try:
+        from pxr import Usd, UsdGeom, Sdf, Ar
+    except ImportError:
+        globals()["USD_AVAILABLE"] = False
+        logger.warning("OpenUSD modules could not be imported. USD functionality will be disabled.")
+        logger.warning("Install USD with: pip install usd-core")
+        return
+        
+    globals().update(Usd=Usd, UsdGeom=UsdGeom, Sdf=Sdf, Ar=Ar, USD_AVAILABLE=True)
     logger.info("OpenUSD integration initialized.")
+
+def __getattr__(name: str) -> Any:
+    """Resolve the pxr modules and USD_AVAILABLE lazily (PEP 562)."""
+    if name in _LAZY_USD_ATTRIBUTES:
+        _import_usd()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
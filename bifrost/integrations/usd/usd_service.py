@@ -7,22 +7,30 @@
 import logging
 import os
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from ...core.config import get_config
 from ...models.usd_asset import UsdAssetVersion, UsdStageInfo, UsdPrimInfo
+from . import setup_usd_environment
 
 logger = logging.getLogger(__name__)
 
-# Check if USD is available
+# Check if USD is available, configuring plugin paths before pxr discovers its plugins
 USD_AVAILABLE = False
+setup_usd_environment()
 try:
-    from pxr import Usd, UsdGeom, Sdf, Ar, UsdUtils
+    from pxr import Usd, UsdGeom, Sdf, Ar, UsdUtils, Tf
     USD_AVAILABLE = True
 except ImportError:
     logger.warning("OpenUSD modules could not be imported. USD functionality will be disabled.")
 
+# Rough footprint of a composed stage, used to turn the configured cache
+# size into a number of stages to keep open
+_ESTIMATED_STAGE_SIZE_MB = 64
+
 class UsdService:
     """
     Service for working with USD data.
@@ -44,27 +52,114 @@ class UsdService:
         
         # Set up USD stage cache
         self.stage_cache_size_mb = get_config("usd.stage_cache_size_mb", 1024)
+        self._stage_cache_max_stages = max(1, self.stage_cache_size_mb // _ESTIMATED_STAGE_SIZE_MB)
+        # Open stages with their file's modification time, keyed by real path,
+        # least recent first
+        self._stage_cache: "OrderedDict[str, Tuple[float, Usd.Stage]]" = OrderedDict()
         # Set up USD supported formats
-        self.supported_formats = get_config("usd.supported_formats", ["usd", "usda", "usdc", "usdz"])
+        self.supported_formats = frozenset(get_config("usd.supported_formats", ["usd", "usda", "usdc", "usdz"]))
         # Default up axis
         self.default_up_axis = get_config("usd.default_up_axis", "Y")
         # Version control strategy
         self.version_strategy = get_config("usd.version_strategy", "layer_stack")
         # Namespace prefix for creating prims
         self.namespace_prefix = get_config("usd.namespace_prefix", "bifrost")
+        # Prim types whose subtrees are left out of extracted stage info
+        self.skip_prim_types = frozenset(get_config("usd.skip_prim_types", []))
+        # File conversion settings
+        self.conversion_enabled = get_config("usd.conversion.enabled", True)
+        self.conversion_temp_dir = Path(get_config("usd.conversion.temp_dir", "temp/usd_conversion"))
+        # Directories this service has already created
+        self._known_dirs: Set[Path] = set()
+        # Extracted prim info for the most recently traversed stages, as
+        # (stage, change listener, prim info by path) keyed by root layer
+        # identifier, least recent first
+        self._prim_info_cache: "OrderedDict[str, Tuple[Usd.Stage, Tf.Notice.Listener, Dict[str, UsdPrimInfo]]]" = OrderedDict()
+        # Most prims memoized per stage
+        self._prim_info_cache_max_prims = get_config("usd.prim_info_cache_max_prims", 100000)
         
         logger.info("USD service initialized.")
         
     def is_available(self) -> bool:
         """Check if USD functionality is available."""
         return USD_AVAILABLE and self.usd_enabled
+    
+    def _ensure_dir(self, directory: Path) -> None:
+        """
+        Create a directory unless this service has already done so.
+        
+        Args:
+            directory: The directory to create
+        """
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+    
+    def _invalidate_prim_infos(self, stage: Usd.Stage) -> None:
+        """
+        Drop the memoized prim info for a stage after it has been modified.
+        
+        Args:
+            stage: The USD stage whose cached prim info is stale
+        """
+        self._drop_prim_infos(stage.GetRootLayer().identifier)
         
-    def open_stage(self, file_path: Union[str, Path]) -> Optional[Usd.Stage]:
+    def _drop_prim_infos(self, identifier: str) -> None:
+        """
+        Drop the memoized prim info for a root layer and stop listening for its changes.
+        
+        Args:
+            identifier: The root layer identifier
+        """
+        entry = self._prim_info_cache.pop(identifier, None)
+        if entry is not None:
+            entry[1].Revoke()
+            
+    def _stage_prim_infos(self, stage: Usd.Stage) -> Dict[str, UsdPrimInfo]:
+        """
+        Get the memoized prim info for a stage, keyed by prim path.
+        
+        The memo belongs to the stage object and is dropped on any change to
+        the stage, including edits made through pxr directly. Only the most
+        recently traversed stages are kept.
+        
+        Args:
+            stage: The USD stage being traversed
+            
+        Returns:
+            The prim info dictionary to read from and fill
+        """
+        identifier = stage.GetRootLayer().identifier
+        entry = self._prim_info_cache.get(identifier)
+        if entry is not None and entry[0] == stage:
+            self._prim_info_cache.move_to_end(identifier)
+            return entry[2]
+            
+        self._drop_prim_infos(identifier)
+        listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged,
+            lambda notice, sender: self._drop_prim_infos(identifier),
+            stage)
+        prim_infos: Dict[str, UsdPrimInfo] = {}
+        self._prim_info_cache[identifier] = (stage, listener, prim_infos)
+        while len(self._prim_info_cache) > self._stage_cache_max_stages:
+            _, (_, old_listener, _) = self._prim_info_cache.popitem(last=False)
+            old_listener.Revoke()
+        return prim_infos
+        
+    def open_stage(self, file_path: Union[str, Path], cached: bool = True) -> Optional[Usd.Stage]:
         """
         Open a USD stage from a file path.
         
+        Stages are cached by resolved path and modification time, so reopening
+        an unchanged file returns the already composed stage. The file is
+        opened through the given path, so a symlink keeps its own layer
+        identifier and anchors relative asset paths.
+        
         Args:
             file_path: Path to the USD file
+            cached: Whether to share the stage through the cache. Callers that
+                edit the stage without saving it should pass False.
             
         Returns:
             The USD stage object or None if it couldn't be opened
@@ -73,8 +168,31 @@ class UsdService:
             return None
             
         try:
-            file_path = str(file_path)
+            file_path = os.fspath(file_path)
+            real_path = os.path.realpath(file_path)
+            mtime = os.path.getmtime(real_path)
+            
+            # An uncached open also evicts the cached stage, so edits made on
+            # the shared root layer are not served from the cache afterwards
+            entry = self._stage_cache.pop(real_path, None)
+            if entry is not None:
+                cached_mtime, stage = entry
+                if cached and cached_mtime == mtime:
+                    self._stage_cache[real_path] = entry
+                    return stage
+                if cached_mtime != mtime:
+                    # The layer registry keeps the stale root layer alive, and
+                    # a new stage would reuse it unless it is reloaded
+                    stage.GetRootLayer().Reload()
+            
             stage = Usd.Stage.Open(file_path)
+            if stage:
+                # Prim info memoized for an earlier stage of this file is stale
+                self._drop_prim_infos(stage.GetRootLayer().identifier)
+            if stage and cached:
+                self._stage_cache[real_path] = (mtime, stage)
+                if len(self._stage_cache) > self._stage_cache_max_stages:
+                    self._stage_cache.popitem(last=False)
             return stage
         except Exception as e:
             logger.error(f"Error opening USD stage {file_path}: {e}")
@@ -99,7 +217,7 @@ class UsdService:
             return None
             
         try:
-            file_path = str(file_path)
+            file_path = os.fspath(file_path)
             
             # Create the stage
             stage = Usd.Stage.CreateNew(file_path)
@@ -143,11 +261,99 @@ class UsdService:
             
         try:
             stage.Save()
+            self._invalidate_prim_infos(stage)
             return True
         except Exception as e:
             logger.error(f"Error saving USD stage: {e}")
             return False
             
+    def iter_prim_infos(self, 
+                       stage: Usd.Stage, 
+                       variant_names: Optional[Dict[str, Dict[str, None]]] = None) -> Iterator[UsdPrimInfo]:
+        """
+        Yield information about each prim on a USD stage, one prim at a time.
+        
+        Unlike stage.Traverse(), this also visits prims beneath instances.
+        Prims whose type is listed in usd.skip_prim_types are skipped along
+        with their subtrees.
+        
+        Args:
+            stage: The USD stage to traverse
+            variant_names: Optional mapping filled with variantSet -> variant
+                names (as dict keys) for every visited prim
+            
+        Yields:
+            UsdPrimInfo for each visited prim
+        """
+        if not self.is_available():
+            return
+        
+        prim_info_cache = self._stage_prim_infos(stage)
+        prim_range = iter(Usd.PrimRange(stage.GetPseudoRoot(), Usd.TraverseInstanceProxies()))
+        for prim in prim_range:
+            if prim.IsPseudoRoot():
+                continue
+                
+            prim_type = prim.GetTypeName()
+            if prim_type in self.skip_prim_types:
+                # Skip the whole subtree without visiting it
+                prim_range.PruneChildren()
+                continue
+                
+            prim_path = str(prim.GetPath())
+            
+            # Collect variants
+            if variant_names is not None:
+                variant_sets = prim.GetVariantSets()
+                for variantSet in variant_sets.GetNames():
+                    variantSet_obj = variant_sets.GetVariantSet(variantSet)
+                    # Keys of a dict dedupe in linear time and keep first-seen order
+                    variant_names.setdefault(variantSet, {}).update(
+                        dict.fromkeys(variantSet_obj.GetVariantNames()))
+            
+            # Reuse prim info extracted by an earlier call on this stage
+            prim_info = prim_info_cache.get(prim_path)
+            if prim_info is not None:
+                yield prim_info
+                continue
+            
+            # Get properties and attributes
+            properties = {}
+            attributes = {}
+            for attr in prim.GetAttributes():
+                attr_name = attr.GetName()
+                type_name = attr.GetTypeName()
+                properties[attr_name] = str(type_name)
+                if not attr.HasAuthoredValue():
+                    continue
+                if type_name.isArray:
+                    # Don't copy and stringify large buffers such as points
+                    attributes[attr_name] = f"<array:{type_name}>"
+                else:
+                    attributes[attr_name] = str(attr.Get())
+            for rel in prim.GetRelationships():
+                properties[rel.GetName()] = "Relationship"
+            
+            # Get metadata
+            metadata = {key: str(value) for key, value in prim.GetAllMetadata().items()}
+            
+            # Get children
+            children = []
+            for child in prim.GetChildren():
+                children.append(str(child.GetPath()))
+            
+            prim_info = UsdPrimInfo(
+                path=prim_path,
+                type=prim_type,
+                properties=properties,
+                attributes=attributes,
+                metadata=metadata,
+                children=children
+            )
+            if len(prim_info_cache) < self._prim_info_cache_max_prims:
+                prim_info_cache[prim_path] = prim_info
+            yield prim_info
+            
     def extract_stage_info(self, stage: Usd.Stage) -> UsdStageInfo:
         """
         Extract key information from a USD stage.
@@ -164,11 +370,10 @@ class UsdService:
         try:
             root_layer = stage.GetRootLayer()
             
-            # Get referenced layers
-            referenced_layers = []
-            for layer in stage.GetUsedLayers():
-                if layer != root_layer:
-                    referenced_layers.append(Path(layer.realPath))
+            # Get referenced layers from the already composed stage. Anonymous
+            # layers (e.g. the session layer) have no file behind them.
+            referenced_layers = [Path(layer.realPath) for layer in stage.GetUsedLayers()
+                                 if layer != root_layer and layer.realPath]
             
             # Get default prim
             default_prim_name = None
@@ -183,51 +388,13 @@ class UsdService:
             timeCodesPerSecond = root_layer.timeCodesPerSecond
             upAxis = UsdGeom.GetStageUpAxis(stage)
             
-            # Extract variant information
-            variants = {}
-            for prim in stage.Traverse():
-                for variantSet in prim.GetVariantSets().GetNames():
-                    variantSet_obj = prim.GetVariantSet(variantSet)
-                    if variantSet not in variants:
-                        variants[variantSet] = []
-                    for variant in variantSet_obj.GetVariantNames():
-                        if variant not in variants[variantSet]:
-                            variants[variantSet].append(variant)
-            
-            # Extract prim information
+            # Extract variant and prim information in a single traversal
+            variant_names: Dict[str, Dict[str, None]] = {}
             prims = {}
-            for prim in stage.Traverse():
-                prim_path = str(prim.GetPath())
-                prim_type = prim.GetTypeName()
-                
-                # Get properties and attributes
-                properties = {}
-                attributes = {}
-                for prop in prim.GetProperties():
-                    properties[prop.GetName()] = str(prop.GetTypeName())
-                    if prop.IsAttribute():
-                        attr = prop.As(Usd.Attribute)
-                        if attr.HasValue():
-                            attributes[prop.GetName()] = str(attr.Get())
-                
-                # Get metadata
-                metadata = {}
-                for key in prim.GetAllMetadata().keys():
-                    metadata[key] = str(prim.GetMetadata(key))
-                
-                # Get children
-                children = []
-                for child in prim.GetChildren():
-                    children.append(str(child.GetPath()))
-                
-                prims[prim_path] = UsdPrimInfo(
-                    path=prim_path,
-                    type=prim_type,
-                    properties=properties,
-                    attributes=attributes,
-                    metadata=metadata,
-                    children=children
-                )
+            for prim_info in self.iter_prim_infos(stage, variant_names):
+                prims[prim_info.path] = prim_info
+            
+            variants = {name: list(names) for name, names in variant_names.items()}
             
             # Create stage info
             stage_info = UsdStageInfo(
@@ -248,6 +415,32 @@ class UsdService:
             logger.error(f"Error extracting stage info: {e}")
             return None
     
+    def extract_many(self, 
+                    paths: List[Union[str, Path]], 
+                    max_workers: Optional[int] = None) -> Dict[Path, Optional[UsdStageInfo]]:
+        """
+        Extract stage information from several USD files in parallel.
+        
+        Each file is opened and analyzed in a pool of worker processes.
+        
+        Args:
+            paths: Paths to the USD files
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Dictionary mapping each path to its UsdStageInfo, or None where the
+            stage couldn't be opened or analyzed
+        """
+        if not self.is_available():
+            return {}
+        
+        stage_paths = [Path(path) for path in paths]
+        if len(stage_paths) <= 1:
+            return {path: _extract_stage_info(self, path) for path in stage_paths}
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return dict(zip(stage_paths, executor.map(_extract_stage_info_worker, stage_paths)))
+    
     def create_reference(self, 
                         stage: Usd.Stage, 
                         target_prim_path: str, 
@@ -279,11 +472,13 @@ class UsdService:
                     return False
             
             # Add the reference
+            reference_file = os.fspath(reference_file_path)
             references = target_prim.GetReferences()
             if reference_prim_path:
-                references.AddReference(str(reference_file_path), reference_prim_path)
+                references.AddReference(reference_file, reference_prim_path)
             else:
-                references.AddReference(str(reference_file_path))
+                references.AddReference(reference_file)
+            self._invalidate_prim_infos(stage)
             
             return True
             
@@ -294,14 +489,19 @@ class UsdService:
     def create_sublayer(self, 
                        stage: Usd.Stage, 
                        sublayer_path: Union[str, Path], 
-                       position: int = -1) -> bool:
+                       position: int = -1,
+                       save: bool = False) -> bool:
         """
         Add a sublayer to a USD stage.
         
+        The change is made in memory only unless save is set, so several
+        edits can be written out with a single save_stage call.
+        
         Args:
             stage: The USD stage to modify
             sublayer_path: Path to the USD file to add as a sublayer
             position: Position in the layer stack (-1 means strongest/top)
+            save: Whether to save the stage to disk after adding the sublayer
             
         Returns:
             True if successful, False otherwise
@@ -311,26 +511,25 @@ class UsdService:
             
         try:
             root_layer = stage.GetRootLayer()
+            # subLayerPaths is a live proxy onto the layer; edit it in place
             sublayer_paths = root_layer.subLayerPaths
             
             # Check if the sublayer already exists
-            sublayer_path_str = str(sublayer_path)
+            sublayer_path_str = os.fspath(sublayer_path)
             if sublayer_path_str in sublayer_paths:
                 logger.warning(f"Sublayer {sublayer_path_str} already exists in stage")
                 return True
             
             # Add the sublayer at the specified position
             if position < 0:
-                sublayer_paths.insert(0, sublayer_path_str)
-            elif position >= len(sublayer_paths):
-                sublayer_paths.append(sublayer_path_str)
+                position = 0
             else:
-                sublayer_paths.insert(position, sublayer_path_str)
-            
-            root_layer.subLayerPaths = sublayer_paths
+                position = min(position, len(sublayer_paths))
+            sublayer_paths.insert(position, sublayer_path_str)
             
-            # Save the stage to reflect changes
-            stage.Save()
+            if save:
+                stage.Save()
+            self._invalidate_prim_infos(stage)
             
             return True
             
@@ -346,6 +545,9 @@ class UsdService:
         """
         Create a variant for a prim.
         
+        Like create_sublayer, this only edits the stage in memory; call
+        save_stage to write it to disk.
+        
         Args:
             stage: The USD stage to modify
             prim_path: Path to the prim to add the variant to
@@ -372,13 +574,13 @@ class UsdService:
                 variant_set = variant_sets.AddVariantSet(variant_set_name)
             
             # Check if the variant already exists
-            variant_names = variant_set.GetVariantNames()
-            if variant_name not in variant_names:
+            if not variant_set.HasAuthoredVariant(variant_name):
                 # Add the variant
                 variant_set.AddVariant(variant_name)
             
             # Set the current variant selection
             variant_set.SetVariantSelection(variant_name)
+            self._invalidate_prim_infos(stage)
             
             return True
             
@@ -394,6 +596,9 @@ class UsdService:
         """
         Select a variant for a prim.
         
+        Like create_sublayer, this only edits the stage in memory; call
+        save_stage to write it to disk.
+        
         Args:
             stage: The USD stage to modify
             prim_path: Path to the prim
@@ -421,13 +626,13 @@ class UsdService:
                 return False
             
             # Check if the variant exists
-            variant_names = variant_set.GetVariantNames()
-            if variant_name not in variant_names:
+            if not variant_set.HasAuthoredVariant(variant_name):
                 logger.error(f"Variant {variant_name} does not exist in set {variant_set_name}")
                 return False
             
             # Set the variant selection
             variant_set.SetVariantSelection(variant_name)
+            self._invalidate_prim_infos(stage)
             
             return True
             
@@ -494,36 +699,38 @@ class UsdService:
             output_path = Path(output_path)
         
         source_ext = source_path.suffix.lower()
+        source_file, output_file = os.fspath(source_path), os.fspath(output_path)
         
         # Check if conversion is enabled
-        conversion_enabled = get_config("usd.conversion.enabled", True)
-        if not conversion_enabled:
+        if not self.conversion_enabled:
             logger.error("USD conversion is disabled in configuration")
             return None
         
-        # Get conversion temp directory
-        temp_dir = get_config("usd.conversion.temp_dir", "temp/usd_conversion")
-        temp_dir_path = Path(temp_dir)
-        temp_dir_path.mkdir(parents=True, exist_ok=True)
+        # Make sure the conversion temp directory exists
+        self._ensure_dir(self.conversion_temp_dir)
         
         try:
             # Handle different file formats
-            if source_ext == '.abc':  # Alembic
-                import subprocess
-                cmd = ['usdcat', '--in', str(source_path), '--out', str(output_path)]
-                subprocess.run(cmd, check=True)
-                return output_path
+            if source_ext in ('.abc', '.obj'):  # Alembic, OBJ
+                # Translate in-process through the USD file format plugin, which
+                # is what usdcat does, without starting a new process per file
+                try:
+                    layer = Sdf.Layer.FindOrOpen(source_file)
+                    if layer and layer.Export(output_file):
+                        return output_path
+                except Tf.ErrorException as e:
+                    logger.debug(f"In-process translation of {source_path} failed: {e}")
                 
-            elif source_ext == '.obj':  # OBJ
+                # The file format plugin isn't available here, fall back to usdcat
                 import subprocess
-                cmd = ['usdcat', '--in', str(source_path), '--out', str(output_path)]
+                cmd = ['usdcat', '--in', source_file, '--out', output_file]
                 subprocess.run(cmd, check=True)
                 return output_path
                 
             elif source_ext == '.fbx':  # FBX
                 # This requires the FBX2USD tool
                 import subprocess
-                cmd = ['FBX2USD', str(source_path), str(output_path)]
+                cmd = ['FBX2USD', source_file, output_file]
                 subprocess.run(cmd, check=True)
                 return output_path
                 
@@ -535,6 +742,33 @@ class UsdService:
             logger.error(f"Error converting {source_path} to USD: {e}")
             return None
     
+    def convert_many(self, 
+                    source_files: List[Union[str, Path]], 
+                    max_workers: Optional[int] = None) -> Dict[Path, Optional[Path]]:
+        """
+        Convert several files to USD format in parallel.
+        
+        Conversions run in a pool of worker processes that is reused for the
+        whole batch. Each output is written next to its source file.
+        
+        Args:
+            source_files: Paths to the source files
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Dictionary mapping each source path to its converted USD file,
+            or None where conversion failed
+        """
+        if not self.is_available():
+            return {}
+        
+        source_paths = [Path(source_file) for source_file in source_files]
+        if len(source_paths) <= 1:
+            return {source_path: self.convert_to_usd(source_path) for source_path in source_paths}
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return dict(zip(source_paths, executor.map(_convert_to_usd_worker, source_paths)))
+    
     def create_version_layer(self, 
                           base_layer_path: Union[str, Path], 
                           version_number: int) -> Optional[Path]:
@@ -556,7 +790,7 @@ class UsdService:
             
             # Create the version layer file path
             version_dir = base_path.parent / f"v{version_number:03d}"
-            version_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(version_dir)
             
             version_file = version_dir / f"{base_path.stem}_v{version_number:03d}{base_path.suffix}"
             
@@ -593,3 +827,22 @@ class UsdService:
         except Exception as e:
             logger.error(f"Error creating version layer: {e}")
             return None
+
+
+def _convert_to_usd_worker(source_file: Path) -> Optional[Path]:
+    """Process pool entry point for UsdService.convert_many."""
+    # Services hold open stages, which can't be pickled, so each worker builds its own
+    return UsdService().convert_to_usd(source_file)
+
+
+def _extract_stage_info(service: UsdService, path: Path) -> Optional[UsdStageInfo]:
+    stage = service.open_stage(path)
+    if not stage:
+        return None
+    return service.extract_stage_info(stage)
+
+
+def _extract_stage_info_worker(path: Path) -> Optional[UsdStageInfo]:
+    """Process pool entry point for UsdService.extract_many."""
+    # Stages can't be pickled, so each worker reopens the file itself
+    return _extract_stage_info(UsdService(), path)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# _shot_numba.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Packed (structure of arrays) shot frame and version data for bulk reports,
+# with frame-range arithmetic compiled by Numba when it is installed.
+
+import logging
+from array import array
+from typing import Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# numpy holds the packed frame arrays if available
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    logger.debug("numpy not available, shot frame arrays will be packed into array.array")
+
+# Numba compiles the frame arithmetic if available
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.debug("numba not available, shot frame arithmetic will run in Python")
+
+
+def pack_frame_arrays(frame_ranges: Iterable[Tuple[int, int]]) -> Tuple[Any, Any]:
+    """
+    Pack (start, end) frame ranges into two contiguous int32 arrays.
+
+    Args:
+        frame_ranges: The (start_frame, end_frame) tuples to pack
+
+    Returns:
+        Tuple of (starts, ends) as numpy int32 arrays, or array.array('i')
+        arrays if numpy is not installed
+    """
+    starts = array('i')
+    ends = array('i')
+    for start, end in frame_ranges:
+        starts.append(start)
+        ends.append(end)
+    if NUMPY_AVAILABLE:
+        return np.frombuffer(starts, dtype=np.int32), np.frombuffer(ends, dtype=np.int32)
+    return starts, ends
+
+
+def pack_version_arrays(rows: Iterable[Tuple[int, int, int]]) -> Tuple[Any, Any, Any]:
+    """
+    Pack (version_number, status_code, created_at_ns) rows into three contiguous arrays.
+
+    Args:
+        rows: One tuple per version
+
+    Returns:
+        Tuple of (version_numbers, status_codes, created_at_ns) as int32, int8
+        and int64 numpy arrays, or array.array if numpy is not installed
+    """
+    numbers = array('i')
+    statuses = array('b')
+    ctimes = array('q')
+    for number, status, ctime in rows:
+        numbers.append(number)
+        statuses.append(status)
+        ctimes.append(ctime)
+    if NUMPY_AVAILABLE:
+        return (np.frombuffer(numbers, dtype=np.int32),
+                np.frombuffer(statuses, dtype=np.int8),
+                np.frombuffer(ctimes, dtype=np.int64))
+    return numbers, statuses, ctimes
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)  # type: ignore[untyped-decorator]
+    def total_duration(starts: Any, ends: Any) -> int:
+        """Sum the durations of packed frame ranges, counting inverted ranges as 0 frames."""
+        total = 0
+        for i in prange(starts.shape[0]):
+            duration = np.int64(ends[i]) - np.int64(starts[i]) + 1
+            if duration > 0:
+                total += duration
+        return total
+elif NUMPY_AVAILABLE:
+    def total_duration(starts: Any, ends: Any) -> int:
+        """Sum the durations of packed frame ranges, counting inverted ranges as 0 frames."""
+        durations = ends.astype(np.int64) - starts + 1
+        return int(np.maximum(durations, 0).sum())
+else:
+    def total_duration(starts: Any, ends: Any) -> int:
+        """Sum the durations of packed frame ranges, counting inverted ranges as 0 frames."""
+        total = 0
+        for i in range(len(starts)):
+            duration = ends[i] - starts[i] + 1
+            if duration > 0:
+                total += duration
+        return total
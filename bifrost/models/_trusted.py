@@ -0,0 +1,29 @@
+"""
+Construction of Bifrost domain models from already-valid data.
+"""
+
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+_M = TypeVar("_M", bound="TrustedModel")
+
+
+class TrustedModel(BaseModel):
+    """Base for domain models that can be built from trusted data without validation."""
+
+    @classmethod
+    def from_trusted_dict(cls: Type[_M], data: Dict[str, Any]) -> _M:
+        """
+        Build a model from already-valid data without running validation.
+
+        Use for rows loaded from the database or models received from another
+        Bifrost service; values must already have their declared types.
+
+        Args:
+            data: Field values keyed by field name
+
+        Returns:
+            The model, built with model_construct
+        """
+        return cls.model_construct(**data)
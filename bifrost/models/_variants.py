@@ -0,0 +1,75 @@
+"""
+Create and Update model generation for the Bifrost domain models.
+
+The Create and Update models accepted by the API repeat the fields of the
+domain model they build or modify. They are generated from the domain
+model's fields so each field, with its type, default and constraints, is
+declared once.
+"""
+
+from typing import Annotated, Any, Dict, Iterable, Optional, Type
+
+from pydantic import BaseModel, create_model
+
+
+def create_variant(model: Type[BaseModel], name: str, doc: str,
+                   exclude: Iterable[str],
+                   validators: Optional[Dict[str, Any]] = None) -> Type[BaseModel]:
+    """
+    Generate a model for creating instances of a domain model.
+
+    Fields keep the domain model's types, defaults and constraints.
+
+    Args:
+        model: The domain model to copy fields from
+        name: Name of the generated model
+        doc: Docstring of the generated model
+        exclude: Fields that are set by the system rather than the caller, e.g. id
+        validators: Field validators to attach, keyed by attribute name
+
+    Returns:
+        The generated model class
+    """
+    exclude = frozenset(exclude)
+    fields: Dict[str, Any] = {
+        field_name: (info.annotation, info)
+        for field_name, info in model.model_fields.items()
+        if field_name not in exclude
+    }
+    variant: Type[BaseModel] = create_model(name, __module__=model.__module__, __validators__=validators, **fields)
+    variant.__doc__ = doc
+    return variant
+
+
+def update_variant(model: Type[BaseModel], name: str, doc: str,
+                   exclude: Iterable[str],
+                   validators: Optional[Dict[str, Any]] = None) -> Type[BaseModel]:
+    """
+    Generate a model for partial updates of a domain model.
+
+    Every field becomes optional with a default of None, so only the fields
+    an update sets are included in it; constraints still apply to values
+    that are given.
+
+    Args:
+        model: The domain model to copy fields from
+        name: Name of the generated model
+        doc: Docstring of the generated model
+        exclude: Fields that cannot be updated, e.g. id and created_at
+        validators: Field validators to attach, keyed by attribute name
+
+    Returns:
+        The generated model class
+    """
+    exclude = frozenset(exclude)
+    fields: Dict[str, Any] = {}
+    for field_name, info in model.model_fields.items():
+        if field_name in exclude:
+            continue
+        annotation: Any = info.annotation
+        if info.metadata:
+            annotation = Annotated[(annotation,) + tuple(info.metadata)]
+        fields[field_name] = (Optional[annotation], None)
+    variant: Type[BaseModel] = create_model(name, __module__=model.__module__, __validators__=validators, **fields)
+    variant.__doc__ = doc
+    return variant
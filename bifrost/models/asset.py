@@ -4,14 +4,171 @@
 #
 # Created: 2025-04-02
 
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union, Set
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Optional, Set, SupportsIndex, Union
+from operator import attrgetter
 from pathlib import Path
 
+from bifrost.utils.clock import cached_utcnow
 
-class AssetType(Enum):
+
+# This module can be compiled with mypyc (see setup.py). Compiled classes
+# only allow subclasses defined in interpreted code, such as UsdAsset, when
+# marked with mypyc_attr.
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    def mypyc_attr(*args: Any, **kwargs: Any) -> Any:  # type: ignore[misc]
+        return lambda cls: cls
+
+# Compiled classes are native classes with a fixed attribute layout already,
+# which dataclass(slots=True) cannot rebuild
+_COMPILED = os.path.splitext(__file__)[1] in (".so", ".pyd")
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) and not _COMPILED else {}
+
+_version_number = attrgetter("version_number")
+
+def _insort_version(versions: List[Any], version: Any) -> None:
+    """
+    Insert a version into a list sorted by version_number, after equal numbers.
+    
+    Equivalent to bisect.insort(versions, version, key=...), which needs Python 3.10.
+    """
+    number = version.version_number
+    lo, hi = 0, len(versions)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if number < versions[mid].version_number:
+            hi = mid
+        else:
+            lo = mid + 1
+    list.insert(versions, lo, version)
+
+
+@mypyc_attr(native_class=False)
+class _VersionList(List[Any]):
+    """
+    Versions list of an Asset or Shot that knows whether it is still sorted.
+    
+    The models keep their versions in one of these, sorted by version_number,
+    so the latest version is the last one. Every list method that changes
+    the list clears the sorted flag, and the number of the last version is
+    recorded, so a list changed other than through add_version, or whose
+    last version was renumbered, falls back to a scan and is never sorted
+    by a read.
+    """
+    _sorted = False
+    _last_number = 0
+    
+    def _mark_sorted(self) -> None:
+        """Trust the current order, which must be sorted by version_number."""
+        self._sorted = True
+        self._last_number = self[-1].version_number if self else 0
+    
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._sorted = False
+        super().__setitem__(index, value)
+    
+    def __delitem__(self, index: Any) -> None:
+        self._sorted = False
+        super().__delitem__(index)
+    
+    def __iadd__(self, other: Iterable[Any]) -> "_VersionList":  # type: ignore[misc]
+        self._sorted = False
+        return super().__iadd__(other)
+    
+    def __imul__(self, count: SupportsIndex) -> "_VersionList":
+        self._sorted = False
+        return super().__imul__(count)
+    
+    def append(self, value: Any) -> None:
+        self._sorted = False
+        super().append(value)
+    
+    def extend(self, values: Any) -> None:
+        self._sorted = False
+        super().extend(values)
+    
+    def insert(self, index: Any, value: Any) -> None:
+        self._sorted = False
+        super().insert(index, value)
+    
+    def pop(self, index: Any = -1) -> Any:
+        self._sorted = False
+        return super().pop(index)
+    
+    def remove(self, value: Any) -> None:
+        self._sorted = False
+        super().remove(value)
+    
+    def clear(self) -> None:
+        self._sorted = False
+        super().clear()
+    
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._sorted = False
+        super().sort(*args, **kwargs)
+    
+    def reverse(self) -> None:
+        self._sorted = False
+        super().reverse()
+
+
+def _sorted_version_list(versions: List[Any]) -> List[Any]:
+    """Copy versions into a _VersionList sorted by version_number."""
+    tracked = _VersionList(versions)
+    list.sort(tracked, key=_version_number)
+    tracked._mark_sorted()
+    return tracked
+
+
+def _versions_sorted(versions: List[Any]) -> bool:
+    """Check whether a versions list is known to be sorted by version_number."""
+    if type(versions) is not _VersionList or not versions._sorted:
+        return False
+    return not versions or versions[-1].version_number == versions._last_number
+
+
+def _add_sorted_version(versions: List[Any], version: Any) -> None:
+    """Insert a version into a versions list, keeping it sorted by version_number."""
+    if not _versions_sorted(versions):
+        list.sort(versions, key=_version_number)
+    _insort_version(versions, version)
+    if type(versions) is _VersionList:
+        versions._mark_sorted()
+
+
+def _latest_version(versions: List[Any], statuses: Optional[AbstractSet[Any]] = None) -> Any:
+    """
+    Find the highest numbered version, optionally only among some statuses.
+    
+    Args:
+        versions: A model's versions
+        statuses: The statuses to consider, or None for any status
+        
+    Returns:
+        The latest matching version, or None if there is none
+    """
+    if not _versions_sorted(versions):
+        if statuses is not None:
+            versions = [v for v in versions if v.status in statuses]
+        return max(versions, key=_version_number, default=None)
+    if statuses is None:
+        return versions[-1] if versions else None
+    # Statuses change in place, so walk back from the latest version
+    for i in range(len(versions) - 1, -1, -1):
+        if versions[i].status in statuses:
+            return versions[i]
+    return None
+
+
+class AssetType(str, Enum):
     """Enumeration of possible asset types in an animation pipeline."""
     CHARACTER = "character"
     PROP = "prop"
@@ -29,18 +186,27 @@ class AssetType(Enum):
     OTHER = "other"
     
     @classmethod
-    def assembly_types(cls) -> Set[str]:
+    def assembly_types(cls) -> FrozenSet[str]:
         """Return the set of asset types that are typically assemblies."""
-        return {cls.ENVIRONMENT.value, cls.INTERIOR.value, cls.EXTERIOR.value}
+        return _ASSEMBLY_TYPE_VALUES
         
     @classmethod
-    def individual_types(cls) -> Set[str]:
+    def individual_types(cls) -> FrozenSet[str]:
         """Return the set of asset types that are typically individual assets."""
-        return {cls.CHARACTER.value, cls.PROP.value, cls.VEHICLE.value, cls.SET_PIECE.value, 
-                cls.FX.value, cls.MATERIAL.value, cls.RIG.value, cls.TEXTURE.value}
+        return _INDIVIDUAL_TYPE_VALUES
+
+
+# AssetType members are strings equal to their values, so members and plain
+# values can both be looked up in these sets
+_ASSEMBLY_TYPE_VALUES = frozenset({AssetType.ENVIRONMENT.value, AssetType.INTERIOR.value, 
+                                   AssetType.EXTERIOR.value})
+_INDIVIDUAL_TYPE_VALUES = frozenset({AssetType.CHARACTER.value, AssetType.PROP.value, 
+                                     AssetType.VEHICLE.value, AssetType.SET_PIECE.value, 
+                                     AssetType.FX.value, AssetType.MATERIAL.value, 
+                                     AssetType.RIG.value, AssetType.TEXTURE.value})
 
 
-class AssetStatus(Enum):
+class AssetStatus(str, Enum):
     """Enumeration of possible asset statuses in the production pipeline."""
     CONCEPT = "concept"        # Initial idea stage
     IN_PROGRESS = "in_progress"  # Currently being worked on
@@ -51,7 +217,10 @@ class AssetStatus(Enum):
     DEPRECATED = "deprecated"  # Replaced by newer asset
 
 
-@dataclass
+_APPROVED_STATUSES = frozenset({AssetStatus.APPROVED, AssetStatus.FINAL})
+
+
+@dataclass(eq=False, **_SLOTS)
 class AssetTag:
     """Tags for categorizing and filtering assets."""
     name: str
@@ -59,23 +228,24 @@ class AssetTag:
     description: str = ""
 
 
-@dataclass
+@mypyc_attr(allow_interpreted_subclasses=True)
+@dataclass(eq=False, **_SLOTS)
 class AssetVersion:
     """Represents a specific version of an asset."""
     version_number: int
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=cached_utcnow)
     created_by: str = ""
     comment: str = ""
-    file_path: Path = None
+    file_path: Optional[Path] = None
     status: AssetStatus = AssetStatus.IN_PROGRESS
     metadata: Dict = field(default_factory=dict)
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         if isinstance(self.file_path, str):
             self.file_path = Path(self.file_path)
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS)
 class AssetDependency:
     """Represents a dependency between assets."""
     dependent_asset_id: str  # ID of the asset that depends on this one
@@ -83,7 +253,7 @@ class AssetDependency:
     optional: bool = False  # Whether this dependency is optional
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS)
 class AssemblyComponent:
     """Represents an asset included within an assembly."""
     asset_id: str  # ID of the contained asset
@@ -91,7 +261,8 @@ class AssemblyComponent:
     override_parameters: Dict = field(default_factory=dict)  # Parameters that override the original asset
 
 
-@dataclass
+@mypyc_attr(allow_interpreted_subclasses=True)
+@dataclass(**_SLOTS)
 class Asset:
     """
     Represents a production asset in the animation pipeline.
@@ -105,9 +276,9 @@ class Asset:
     id: str
     name: str
     asset_type: AssetType
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=cached_utcnow)
     created_by: str = ""
-    modified_at: datetime = field(default_factory=datetime.now)
+    modified_at: datetime = field(default_factory=cached_utcnow)
     modified_by: str = ""
     description: str = ""
     status: AssetStatus = AssetStatus.CONCEPT
@@ -125,7 +296,7 @@ class Asset:
     preview_path: Optional[Path] = None
     metadata: Dict = field(default_factory=dict)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Convert string paths to Path objects if needed."""
         if isinstance(self.thumbnail_path, str):
             self.thumbnail_path = Path(self.thumbnail_path)
@@ -133,34 +304,38 @@ class Asset:
             self.preview_path = Path(self.preview_path)
         
         # Auto-detect if this is an assembly based on the asset type if not explicitly set
-        if not self.is_assembly and self.asset_type.value in AssetType.assembly_types():
+        if not self.is_assembly and self.asset_type in _ASSEMBLY_TYPE_VALUES:
             self.is_assembly = True
+        
+        self.versions = _sorted_version_list(self.versions)
     
     @property
     def latest_version(self) -> Optional[AssetVersion]:
         """Return the latest version of this asset if any versions exist."""
-        if not self.versions:
-            return None
-        return max(self.versions, key=lambda v: v.version_number)
+        latest: Optional[AssetVersion] = _latest_version(self.versions)
+        return latest
     
     @property
     def latest_approved_version(self) -> Optional[AssetVersion]:
         """Return the latest approved or final version of this asset."""
-        approved_versions = [v for v in self.versions 
-                             if v.status in (AssetStatus.APPROVED, AssetStatus.FINAL)]
-        if not approved_versions:
-            return None
-        return max(approved_versions, key=lambda v: v.version_number)
+        latest: Optional[AssetVersion] = _latest_version(self.versions, _APPROVED_STATUSES)
+        return latest
     
-    def add_version(self, version: AssetVersion) -> None:
-        """Add a new version to this asset."""
-        self.versions.append(version)
-        self.modified_at = datetime.now()
+    def add_version(self, version: AssetVersion, when: Optional[datetime] = None) -> None:
+        """
+        Add a new version to this asset, keeping versions ordered by number.
+        
+        Args:
+            version: The version to add
+            when: Modification time to record (defaults to now)
+        """
+        _add_sorted_version(self.versions, version)
+        self.modified_at = when if when is not None else cached_utcnow()
     
     def add_dependency(self, asset_id: str, dependency_type: str, optional: bool = False) -> None:
         """Add a dependency on another asset."""
         dependency = AssetDependency(
-            dependent_asset_id=asset_id,
+            dependent_asset_id=sys.intern(asset_id),
             dependency_type=dependency_type,
             optional=optional
         )
@@ -175,7 +350,7 @@ class Asset:
         """Update the status of this asset."""
         self.status = status
         self.modified_by = updated_by
-        self.modified_at = datetime.now()
+        self.modified_at = cached_utcnow()
     
     def add_component(self, asset_id: str, transform: Optional[Dict] = None, 
                     override_parameters: Optional[Dict] = None) -> None:
@@ -184,25 +359,39 @@ class Asset:
             raise ValueError("Cannot add components to a non-assembly asset")
         
         component = AssemblyComponent(
-            asset_id=asset_id,
+            # Assemblies often instance the same few assets many times; interning
+            # makes all their components share one ID string
+            asset_id=sys.intern(asset_id),
             transform=transform or {},
             override_parameters=override_parameters or {}
         )
         self.contained_assets.append(component)
-        self.modified_at = datetime.now()
+        self.modified_at = cached_utcnow()
     
     def remove_component(self, asset_id: str) -> bool:
         """Remove a component asset from this assembly."""
         if not self.is_assembly:
             return False
             
-        initial_length = len(self.contained_assets)
-        self.contained_assets = [c for c in self.contained_assets if c.asset_id != asset_id]
+        components = self.contained_assets
+        # Find the first match without allocating, so misses cost a scan only
+        first = 0
+        count = len(components)
+        while first < count and components[first].asset_id != asset_id:
+            first += 1
+        if first == count:
+            return False
         
-        if len(self.contained_assets) < initial_length:
-            self.modified_at = datetime.now()
-            return True
-        return False
+        # Compact the kept components in place, so references to the list stay current
+        kept = first
+        for i in range(first + 1, count):
+            component = components[i]
+            if component.asset_id != asset_id:
+                components[kept] = component
+                kept += 1
+        del components[kept:]
+        self.modified_at = cached_utcnow()
+        return True
     
     def get_all_component_ids(self) -> List[str]:
         """Get IDs of all component assets in this assembly."""
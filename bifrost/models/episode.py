@@ -1,12 +1,20 @@
 """
 Episode model for the Bifrost system.
+
+Episodes are msgspec Structs rather than pydantic models: construction is
+done in C and bulk loads validate through msgspec.convert, which is much
+cheaper when ingesting many episodes at once.
 """
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
-from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+from uuid import UUID
+
+import msgspec
+
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 
 
 class EpisodeStatus(str, Enum):
@@ -20,13 +28,53 @@ class EpisodeStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-class Episode(BaseModel):
+def _validate_frame_ranges(episode: Union["Episode", "EpisodeCreate"]) -> None:
+    """Validate that the frame ranges of an episode don't end before they start."""
+    if episode.frame_start is not None and episode.frame_end is not None:
+        if episode.frame_end < episode.frame_start:
+            raise ValueError('frame_end must be greater than or equal to frame_start')
+    if episode.global_frame_start is not None and episode.global_frame_end is not None:
+        if episode.global_frame_end < episode.global_frame_start:
+            raise ValueError('global_frame_end must be greater than or equal to global_frame_start')
+
+
+_EpisodeStructT = TypeVar("_EpisodeStructT", bound="_EpisodeStruct")
+
+
+class _EpisodeStruct(msgspec.Struct, kw_only=True):
+    """Shared conversion and serialization helpers for the episode models."""
+    
+    @classmethod
+    def from_dict(cls: Type[_EpisodeStructT], data: Dict[str, Any]) -> _EpisodeStructT:
+        """
+        Build a model from a plain dictionary, validating and coercing field types.
+        
+        Prefer this over cls(**data) for bulk loads; the constructor does not
+        type check its arguments.
+        """
+        return msgspec.convert(data, cls)
+    
+    @classmethod
+    def from_orm(cls: Type[_EpisodeStructT], obj: Any) -> _EpisodeStructT:
+        """Build a model from an object's attributes, e.g. a database row."""
+        return msgspec.convert(obj, cls, from_attributes=True)
+    
+    def dict(self) -> Dict[str, Any]:
+        """Return the fields of this model as a dictionary."""
+        return msgspec.structs.asdict(self)
+    
+    def json(self) -> str:
+        """Serialize this model to a JSON string."""
+        return msgspec.json.encode(self).decode('utf-8')
+
+
+class Episode(_EpisodeStruct, kw_only=True):
     """
     Represents an episode in the animation production pipeline.
     
     An episode belongs to a series and contains sequences.
     """
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = msgspec.field(default_factory=fast_uuid4)
     series_id: UUID
     name: str
     code: str  # Episode code (e.g., "ep001")
@@ -39,29 +87,14 @@ class Episode(BaseModel):
     global_frame_start: Optional[int] = None
     global_frame_end: Optional[int] = None
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = msgspec.field(default_factory=cached_utcnow)
     created_by: str
-    modified_at: datetime = Field(default_factory=datetime.utcnow)
+    modified_at: datetime = msgspec.field(default_factory=cached_utcnow)
     modified_by: str = ""
-    metadata: Dict = Field(default_factory=dict)
+    metadata: Dict = msgspec.field(default_factory=dict)
     
-    @validator('frame_end')
-    def frame_end_greater_than_start(cls, v, values):
-        """Validate that frame_end is greater than or equal to frame_start."""
-        if 'frame_start' in values and v < values['frame_start']:
-            raise ValueError('frame_end must be greater than or equal to frame_start')
-        return v
-    
-    @validator('global_frame_end')
-    def global_frame_end_greater_than_start(cls, v, values):
-        """Validate that global_frame_end is greater than or equal to global_frame_start."""
-        if (v is not None and 'global_frame_start' in values and 
-                values['global_frame_start'] is not None and v < values['global_frame_start']):
-            raise ValueError('global_frame_end must be greater than or equal to global_frame_start')
-        return v
-    
-    class Config:
-        orm_mode = True
+    def __post_init__(self) -> None:
+        _validate_frame_ranges(self)
     
     @property
     def duration(self) -> int:
@@ -76,7 +109,7 @@ class Episode(BaseModel):
         return self.global_frame_end - self.global_frame_start + 1
 
 
-class EpisodeCreate(BaseModel):
+class EpisodeCreate(_EpisodeStruct, kw_only=True):
     """Model for creating a new episode."""
     series_id: UUID
     name: str
@@ -87,25 +120,13 @@ class EpisodeCreate(BaseModel):
     frame_end: int = 1001
     global_frame_start: Optional[int] = None
     global_frame_end: Optional[int] = None
-    metadata: Dict = Field(default_factory=dict)
+    metadata: Dict = msgspec.field(default_factory=dict)
     
-    @validator('frame_end')
-    def frame_end_greater_than_start(cls, v, values):
-        """Validate that frame_end is greater than or equal to frame_start."""
-        if 'frame_start' in values and v < values['frame_start']:
-            raise ValueError('frame_end must be greater than or equal to frame_start')
-        return v
-    
-    @validator('global_frame_end')
-    def global_frame_end_greater_than_start(cls, v, values):
-        """Validate that global_frame_end is greater than or equal to global_frame_start."""
-        if (v is not None and 'global_frame_start' in values and 
-                values['global_frame_start'] is not None and v < values['global_frame_start']):
-            raise ValueError('global_frame_end must be greater than or equal to global_frame_start')
-        return v
+    def __post_init__(self) -> None:
+        _validate_frame_ranges(self)
 
 
-class EpisodeUpdate(BaseModel):
+class EpisodeUpdate(_EpisodeStruct, kw_only=True, omit_defaults=True):
     """Model for updating an existing episode."""
     name: Optional[str] = None
     code: Optional[str] = None
@@ -115,4 +136,4 @@ class EpisodeUpdate(BaseModel):
     frame_end: Optional[int] = None
     global_frame_start: Optional[int] = None
     global_frame_end: Optional[int] = None
-    metadata: Optional[Dict] = None
\ No newline at end of file
+    metadata: Optional[Dict] = None
@@ -7,7 +7,7 @@ and cross-studio synchronization.
 """
 
 from .core import EntityType, DataType, FolderTemplate, StudioMapping
-from .project import Series, Episode, SequenceInfo, ShotInfo
+from .project import Series, Episode, SequenceInfo, ShotInfo, SharedElement, Deliverable
 from .workflow import Department, DepartmentDependency, DepartmentOutput, Workflow
 
 __all__ = [
@@ -19,6 +19,8 @@ __all__ = [
     'Episode',
     'SequenceInfo',
     'ShotInfo',
+    'SharedElement',
+    'Deliverable',
     'Department',
     'DepartmentDependency',
     'DepartmentOutput',
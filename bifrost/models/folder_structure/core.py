@@ -4,9 +4,14 @@
 #
 # Created: 2025-04-02
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional
+from string import Formatter
+from typing import Any, Callable, FrozenSet, List, Dict, NamedTuple, Optional
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 class EntityType(Enum):
     """
@@ -38,8 +43,53 @@ class DataType(Enum):
     DELIVERABLE = "deliverable"  # Final deliverable data
 
 
-@dataclass
-class FolderTemplate:
+def _compile_template(template: str) -> Callable[[Dict], str]:
+    """
+    Compile a str.format template into a function taking the format arguments.
+    
+    Templates whose fields are plain names, optionally with a conversion or
+    format spec (e.g. {number:04d}), become a single generated f-string, so
+    the braces are parsed once instead of on every format call. Templates
+    using positional fields, attribute/index access or nested format specs
+    fall back to str.format.
+    """
+    pieces = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if literal:
+            pieces.append(repr(literal))
+        if field_name is None:
+            continue
+        format_spec = format_spec or ""
+        if not field_name.isidentifier() or any(c in format_spec for c in '{}"\\\n'):
+            return lambda kwargs: template.format(**kwargs)
+        conversion = f"!{conversion}" if conversion else ""
+        format_spec = f":{format_spec}" if format_spec else ""
+        pieces.append(f'f"{{kwargs[{field_name!r}]{conversion}{format_spec}}}"')
+    compiled: Callable[[Dict], str] = eval("lambda kwargs: " + (" ".join(pieces) or "''"))
+    return compiled
+
+
+class _CompiledTemplate(NamedTuple):
+    """A template string with its field names and compiled format function."""
+    template: str
+    field_names: FrozenSet[str]
+    format: Callable[[Dict], str]
+
+
+class _FolderTemplateCaches:
+    """
+    Slots for the compiled form of a FolderTemplate's template.
+    
+    These are not dataclass fields, so they stay out of fields(), asdict()
+    and repr().
+    """
+    __slots__ = ("_compiled",)
+    
+    _compiled: _CompiledTemplate
+
+
+@dataclass(**_SLOTS)
+class FolderTemplate(_FolderTemplateCaches):
     """
     Template for folder path construction.
     
@@ -53,12 +103,33 @@ class FolderTemplate:
     template: str
     variables: List[str] = field(default_factory=list)
     
+    def _compile(self) -> _CompiledTemplate:
+        """Get the compiled template, compiling it again if template was reassigned."""
+        # Copies and unpickled instances don't carry the cache slots
+        compiled: Optional[_CompiledTemplate] = getattr(self, "_compiled", None)
+        if compiled is None or compiled.template is not self.template:
+            template = self.template
+            field_names = frozenset(
+                name for _, name, _, _ in Formatter().parse(template) if name is not None)
+            compiled = self._compiled = _CompiledTemplate(
+                template, field_names, _compile_template(template))
+        return compiled
+    
+    @property
+    def field_names(self) -> FrozenSet[str]:
+        """Names of the fields in the template."""
+        return self._compile().field_names
+    
     def format(self, **kwargs) -> str:
         """Format the template with provided variables."""
-        return self.template.format(**kwargs)
+        return self._compile().format(kwargs)
+    
+    def format_map(self, values: Dict[str, Any]) -> str:
+        """Format the template with variables from a mapping, like str.format_map."""
+        return self._compile().format(values)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StudioMapping:
     """
     Mapping between different studio folder structures.
@@ -7,7 +7,9 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
-@dataclass
+from .core import _SLOTS
+
+@dataclass(**_SLOTS)
 class ShotInfo:
     """
     Information about a shot in a sequence.
@@ -26,7 +28,7 @@ class ShotInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SequenceInfo:
     """
     Information about a sequence in an episode.
@@ -45,7 +47,7 @@ class SequenceInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Episode:
     """
     Information about an episode in a series.
@@ -64,7 +66,7 @@ class Episode:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SharedElement:
     """
     An element shared across multiple episodes.
@@ -83,7 +85,7 @@ class SharedElement:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Deliverable:
     """
     A deliverable format for the series.
@@ -102,7 +104,7 @@ class Deliverable:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Series:
     """
     Information about a series of episodes.
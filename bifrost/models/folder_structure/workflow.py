@@ -5,9 +5,11 @@
 # Created: 2025-04-02
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-@dataclass
+from .core import _SLOTS
+
+@dataclass(**_SLOTS)
 class DepartmentDependency:
     """
     Dependency between departments.
@@ -25,7 +27,7 @@ class DepartmentDependency:
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DepartmentOutput:
     """
     Output produced by a department.
@@ -43,7 +45,7 @@ class DepartmentOutput:
     location: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Department:
     """
     Department in the production pipeline.
@@ -63,8 +65,38 @@ class Department:
     produces: List[DepartmentOutput] = field(default_factory=list)
 
 
-@dataclass
-class Workflow:
+class _StageGraph(NamedTuple):
+    """A department sequence with the departments directly after/before each one."""
+    stages: List[str]
+    downstream: Dict[str, List[str]]
+    upstream: Dict[str, List[str]]
+
+
+def _build_stage_graph(sequence: List[str]) -> _StageGraph:
+    """Copy a department sequence and index its neighbouring departments."""
+    stages = list(sequence)
+    downstream: Dict[str, List[str]] = {}
+    upstream: Dict[str, List[str]] = {}
+    for before, after in zip(stages, stages[1:]):
+        downstream.setdefault(before, []).append(after)
+        upstream.setdefault(after, []).append(before)
+    return _StageGraph(stages, downstream, upstream)
+
+
+class _WorkflowCaches:
+    """
+    Slots for the department sequences Workflow indexes on first use.
+    
+    These are not dataclass fields, so they stay out of fields(), asdict()
+    and repr().
+    """
+    __slots__ = ("_stage_graphs",)
+    
+    _stage_graphs: Dict[Tuple[str, str], _StageGraph]
+
+
+@dataclass(**_SLOTS)
+class Workflow(_WorkflowCaches):
     """
     Workflow definition for a production type.
     
@@ -79,3 +111,48 @@ class Workflow:
     name: str
     asset_types: Dict[str, Dict[str, List[str]]]
     shot_types: Dict[str, Dict[str, List[str]]]
+    
+    def _stage_graph(self, kind: str, type_name: str) -> Optional[_StageGraph]:
+        """
+        Get the indexed department sequence for an asset or shot type.
+        
+        The index of a type is built on first use and kept while the type's
+        sequence still has the same departments, so edits to asset_types or
+        shot_types are seen by the next lookup.
+        """
+        types = self.asset_types if kind == "asset" else self.shot_types if kind == "shot" else {}
+        if type_name not in types:
+            return None
+        sequence = (types[type_name] or {}).get("sequence", [])
+        # Copies and unpickled instances don't carry the cache slots
+        graphs: Optional[Dict[Tuple[str, str], _StageGraph]] = getattr(self, "_stage_graphs", None)
+        if graphs is None:
+            graphs = self._stage_graphs = {}
+        graph = graphs.get((kind, type_name))
+        if graph is None or graph.stages != sequence:
+            graph = graphs[(kind, type_name)] = _build_stage_graph(sequence)
+        return graph
+    
+    def stages_for(self, kind: str, type_name: str) -> List[str]:
+        """
+        Get the department sequence for an asset or shot type.
+        
+        Args:
+            kind: "asset" or "shot"
+            type_name: Asset or shot type, e.g. "character" or "standard"
+            
+        Returns:
+            Departments in production order, or an empty list if the type is not defined
+        """
+        graph = self._stage_graph(kind, type_name)
+        return graph.stages if graph is not None else []
+    
+    def next_stages(self, kind: str, type_name: str, department: str) -> List[str]:
+        """Get the departments that directly follow a department for an asset or shot type."""
+        graph = self._stage_graph(kind, type_name)
+        return graph.downstream.get(department, []) if graph is not None else []
+    
+    def previous_stages(self, kind: str, type_name: str, department: str) -> List[str]:
+        """Get the departments that directly precede a department for an asset or shot type."""
+        graph = self._stage_graph(kind, type_name)
+        return graph.upstream.get(department, []) if graph is not None else []
@@ -2,26 +2,70 @@
 Pipeline step models for the Bifrost system.
 """
 
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable, Sequence, Set, Tuple, TypeVar
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator
 
+from bifrost.models._trusted import TrustedModel
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 from .task import TaskStatus, TaskPriority
 
+# Department IDs defined in dependencies.yaml
+_VALID_DEPARTMENTS: FrozenSet[str] = frozenset({
+    "concept", "modeling", "texture", "shading", "rigging",
+    "layout", "animation", "fx", "lighting", "rendering", "comp"})
+_VALID_DEPARTMENTS_MSG = ', '.join(sorted(_VALID_DEPARTMENTS))
+
+
+def _validate_department_id(cls, v: str) -> str:
+    """Ensure department_id follows the convention in dependencies.yaml."""
+    if v not in _VALID_DEPARTMENTS:
+        raise ValueError(f"Department ID must be one of: {_VALID_DEPARTMENTS_MSG}")
+    return v
+
+
+_T = TypeVar('_T')
+
+# Canonical instances of the frozen configuration models, keyed by themselves
+_INTERNED: Dict[Any, Any] = {}
+
+
+def intern_config(value: _T) -> _T:
+    """
+    Return the canonical instance of an immutable configuration model.
+    
+    Pipeline steps loaded from configuration repeat the same file formats,
+    dependencies and workflows; interning them shares one instance per
+    distinct value, so later comparisons are usually identity checks.
+    
+    Args:
+        value: A FileFormat, DepartmentDependency, TaskTemplate, AssetWorkflow
+            or ShotWorkflow
+        
+    Returns:
+        The first interned instance equal to value, or value itself
+    """
+    return _INTERNED.setdefault(value, value)
+
 
 class FileFormat(BaseModel):
     """File format produced by a pipeline step."""
     type: str
-    formats: List[str]
+    formats: Tuple[str, ...]
     location: str
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class DepartmentDependency(BaseModel):
     """Dependency on another department."""
     department: str
     status: str = "approved"  # Status required for dependency to be satisfied
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class TaskTemplate(BaseModel):
@@ -31,11 +75,13 @@ class TaskTemplate(BaseModel):
     estimated_hours: Optional[float] = Field(default=None, ge=0)
     status: TaskStatus = Field(default=TaskStatus.NOT_STARTED)
     priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
+    
+    model_config = ConfigDict(frozen=True)
 
 
-class PipelineStep(BaseModel):
+class PipelineStep(TrustedModel):
     """Core pipeline step model representing a workflow stage."""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     department_id: str = Field(min_length=1, max_length=50)  # Matches department ID in dependencies.yaml
     name: str = Field(min_length=3, max_length=50)
     description: str
@@ -44,23 +90,15 @@ class PipelineStep(BaseModel):
     produces: List[FileFormat] = Field(default_factory=list)
     task_template: Optional[TaskTemplate] = None
     enabled: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     created_by: str
     updated_at: Optional[datetime] = None
     updated_by: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
-    @validator('department_id')
-    def department_id_must_be_valid(cls, v):
-        """Ensure department_id follows the convention in dependencies.yaml."""
-        valid_departments = {"concept", "modeling", "texture", "shading", "rigging", 
-                             "layout", "animation", "fx", "lighting", "rendering", "comp"}
-        if v not in valid_departments:
-            raise ValueError(f"Department ID must be one of: {', '.join(valid_departments)}")
-        return v
+    department_id_must_be_valid = field_validator('department_id')(_validate_department_id)
 
 
 class PipelineStepCreate(BaseModel):
@@ -75,14 +113,7 @@ class PipelineStepCreate(BaseModel):
     enabled: bool = Field(default=True)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('department_id')
-    def department_id_must_be_valid(cls, v):
-        """Ensure department_id follows the convention in dependencies.yaml."""
-        valid_departments = {"concept", "modeling", "texture", "shading", "rigging", 
-                             "layout", "animation", "fx", "lighting", "rendering", "comp"}
-        if v not in valid_departments:
-            raise ValueError(f"Department ID must be one of: {', '.join(valid_departments)}")
-        return v
+    department_id_must_be_valid = field_validator('department_id')(_validate_department_id)
 
 
 class PipelineStepUpdate(BaseModel):
@@ -107,29 +138,91 @@ class WorkflowType(str, Enum):
 class AssetWorkflow(BaseModel):
     """Pipeline workflow for an asset type."""
     asset_type: str  # character, prop, environment, etc.
-    sequence: List[str]  # List of department IDs in sequence
+    sequence: Tuple[str, ...]  # Department IDs in sequence
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ShotWorkflow(BaseModel):
     """Pipeline workflow for a shot type."""
     shot_type: str  # standard, vfx_heavy, full_cg, etc.
-    sequence: List[str]  # List of department IDs in sequence
+    sequence: Tuple[str, ...]  # Department IDs in sequence
+    
+    model_config = ConfigDict(frozen=True)
 
 
-class PipelineWorkflow(BaseModel):
+def _topological_order(sequences: Iterable[Sequence[str]]) -> List[str]:
+    """
+    Order departments so each comes before the departments that follow it in any sequence.
+    
+    Uses an iterative depth-first search. An edge back to a department that
+    is still being visited would close a cycle, so it is dropped.
+    
+    Args:
+        sequences: Department ID sequences, each in production order
+        
+    Returns:
+        Every department ID once, in dependency order
+    """
+    successors: Dict[str, List[str]] = {}
+    for sequence in sequences:
+        for department in sequence:
+            successors.setdefault(department, [])
+        for before, after in zip(sequence, sequence[1:]):
+            if after not in successors[before]:
+                successors[before].append(after)
+    
+    order: List[str] = []
+    visiting: Set[str] = set()
+    visited: Set[str] = set()
+    # Start from the last department seen so independent chains keep their order
+    for root in reversed(list(successors)):
+        if root in visited:
+            continue
+        visiting.add(root)
+        stack = [(root, iter(successors[root]))]
+        while stack:
+            department, children = stack[-1]
+            for child in children:
+                if child not in visiting and child not in visited:
+                    visiting.add(child)
+                    stack.append((child, iter(successors[child])))
+                    break
+            else:
+                stack.pop()
+                visiting.discard(department)
+                visited.add(department)
+                order.append(department)
+    order.reverse()
+    return order
+
+
+class PipelineWorkflow(TrustedModel):
     """Complete pipeline workflow configuration."""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     name: str
     type: WorkflowType = WorkflowType.DEFAULT
     description: str = ""
     asset_workflows: List[AssetWorkflow] = Field(default_factory=list)
     shot_workflows: List[ShotWorkflow] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     created_by: str
     updated_at: Optional[datetime] = None
     updated_by: Optional[str] = None
     enabled: bool = Field(default=True)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+    
+    # Department order across all workflows, computed once when the model is built
+    _topological_order: List[str] = PrivateAttr(default_factory=list)
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._topological_order = _topological_order(
+            [workflow.sequence for workflow in self.asset_workflows]
+            + [workflow.sequence for workflow in self.shot_workflows])
+    
+    @property
+    def topological_order(self) -> List[str]:
+        """Return every department in the workflows, each before the departments that follow it."""
+        return self._topological_order
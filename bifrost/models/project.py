@@ -4,11 +4,15 @@ Project model for the Bifrost system.
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 from enum import Enum
-from pydantic import BaseModel, Field, root_validator
+from pydantic import BaseModel, Field, ConfigDict
 
+from bifrost.models._trusted import TrustedModel
+from bifrost.models._variants import create_variant, update_variant
 from bifrost.models.pipeline_step import WorkflowType, AssetWorkflow, ShotWorkflow
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 
 
 class ProjectStatus(str, Enum):
@@ -42,16 +46,16 @@ class ProjectPipelineConfig(BaseModel):
     shot_workflows: Dict[str, ShotWorkflow] = Field(default_factory=dict)
 
 
-class Project(BaseModel):
+class Project(TrustedModel):
     """Core project model representing a production project."""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     project_code: str = Field(min_length=2, max_length=20)
     name: str
     description: str = ""
     status: ProjectStatus = ProjectStatus.PLANNING
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     created_by: str
     updated_at: Optional[datetime] = None
     updated_by: Optional[str] = None
@@ -66,45 +70,13 @@ class Project(BaseModel):
     colorspace: str = "ACES"
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class ProjectCreate(BaseModel):
-    """Model for creating a new project."""
-    project_code: str = Field(min_length=2, max_length=20)
-    name: str
-    description: str = ""
-    status: ProjectStatus = ProjectStatus.PLANNING
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
-    
-    # Pipeline configuration
-    pipeline_config: Optional[ProjectPipelineConfig] = None
-    task_templates: Dict[str, TaskTemplateOverride] = Field(default_factory=dict)
-    
-    # Project metadata
-    fps: float = 24.0
-    resolution: str = "1920x1080"
-    colorspace: str = "ACES"
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
+ProjectCreate = create_variant(
+    Project, 'ProjectCreate', "Model for creating a new project.",
+    exclude={'id', 'created_at', 'created_by', 'updated_at', 'updated_by'})
 
-class ProjectUpdate(BaseModel):
-    """Model for updating an existing project."""
-    project_code: Optional[str] = Field(default=None, min_length=2, max_length=20)
-    name: Optional[str] = None
-    description: Optional[str] = None
-    status: Optional[ProjectStatus] = None
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
-    
-    # Pipeline configuration
-    pipeline_config: Optional[ProjectPipelineConfig] = None
-    task_templates: Optional[Dict[str, TaskTemplateOverride]] = None
-    
-    # Project metadata
-    fps: Optional[float] = None
-    resolution: Optional[str] = None
-    colorspace: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
\ No newline at end of file
+ProjectUpdate = update_variant(
+    Project, 'ProjectUpdate', "Model for updating an existing project.",
+    exclude={'id', 'created_at', 'created_by', 'updated_at', 'updated_by'})
@@ -4,13 +4,19 @@
 #
 # Created: 2025-04-14
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
-class ReviewStatus(Enum):
+from bifrost.utils.clock import now_isoformat
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+class ReviewStatus(str, Enum):
     """Enumeration of possible review statuses in the production pipeline."""
     PENDING = "pending"        # Scheduled but not started
     IN_PROGRESS = "in_progress"  # Currently being reviewed
@@ -18,7 +24,11 @@ class ReviewStatus(Enum):
     CANCELED = "canceled"      # Review canceled
     REOPENED = "reopened"      # Review reopened after completion
 
-class NoteStatus(Enum):
+
+# Valid ReviewStatus values, for membership tests on raw strings
+REVIEW_STATUS_VALUES = frozenset(status.value for status in ReviewStatus)
+
+class NoteStatus(str, Enum):
     """Enumeration of possible statuses for review notes."""
     OPEN = "open"              # Note needs to be addressed
     ADDRESSED = "addressed"    # Note has been addressed
@@ -27,7 +37,11 @@ class NoteStatus(Enum):
     DEFERRED = "deferred"      # Addressing note deferred to later
 
 
-@dataclass
+# Valid NoteStatus values, for membership tests on raw strings
+NOTE_STATUS_VALUES = frozenset(status.value for status in NoteStatus)
+
+
+@dataclass(**_SLOTS)
 class ReviewNote:
     """Note associated with a review item."""
     id: str
@@ -45,12 +59,10 @@ class ReviewNote:
     def __post_init__(self):
         """Convert string paths to Path objects if needed."""
         if self.attachments:
-            for i, path in enumerate(self.attachments):
-                if isinstance(path, str):
-                    self.attachments[i] = Path(path)
+            self.attachments = [Path(p) if type(p) is str else p for p in self.attachments]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReviewItem:
     """Item being reviewed (shot or asset)."""
     id: str
@@ -65,12 +77,25 @@ class ReviewItem:
     
     def __post_init__(self):
         """Convert string paths to Path objects if needed."""
-        if isinstance(self.preview_path, str):
+        if type(self.preview_path) is str:
             self.preview_path = Path(self.preview_path)
 
 
-@dataclass
-class Review:
+class _ReviewCaches:
+    """
+    Slots for the item_id index Review keeps of its items.
+    
+    These are not dataclass fields, so they stay out of fields(), asdict()
+    and repr().
+    """
+    __slots__ = ("_item_index", "_indexed_items")
+    
+    _item_index: Dict[str, Tuple[int, ReviewItem]]
+    _indexed_items: List[ReviewItem]
+
+
+@dataclass(**_SLOTS)
+class Review(_ReviewCaches):
     """
     Review session for shots or assets.
     
@@ -87,17 +112,47 @@ class Review:
     items: List[ReviewItem] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
     
+    def _find_item(self, item_id: str) -> Optional[ReviewItem]:
+        """
+        Find the first item with an item_id.
+        
+        The index maps each item_id to the position and object of its first
+        item in the items list it was built from. An entry is trusted only
+        while that list still holds the same object at that position with
+        that item_id; otherwise, and for IDs not in the index, the index is
+        rebuilt from a scan of the items.
+        """
+        items = self.items
+        # Copies and unpickled instances don't carry the index slots
+        indexed_items: Optional[List[ReviewItem]] = getattr(self, "_indexed_items", None)
+        if indexed_items is items:
+            entry = self._item_index.get(item_id)
+            if entry is not None:
+                position, indexed_item = entry
+                if (position < len(items) and items[position] is indexed_item
+                        and indexed_item.item_id == item_id):
+                    return indexed_item
+        index: Dict[str, Tuple[int, ReviewItem]] = {}
+        for position, item in enumerate(items):
+            index.setdefault(item.item_id, (position, item))
+        self._item_index = index
+        self._indexed_items = items
+        entry = index.get(item_id)
+        return entry[1] if entry is not None else None
+    
     def add_item(self, item: ReviewItem) -> None:
         """Add an item to this review."""
         self.items.append(item)
+        if getattr(self, "_indexed_items", None) is self.items:
+            self._item_index.setdefault(item.item_id, (len(self.items) - 1, item))
     
     def add_note(self, item_id: str, note: ReviewNote) -> bool:
         """Add a note to a review item."""
-        for item in self.items:
-            if item.item_id == item_id:
-                item.notes.append(note)
-                return True
-        return False
+        item = self._find_item(item_id)
+        if item is None:
+            return False
+        item.notes.append(note)
+        return True
     
     def complete(self, completed_by: str) -> None:
         """Mark the review as completed."""
@@ -110,4 +165,4 @@ class Review:
         self.status = ReviewStatus.REOPENED
         self.completed_at = None
         self.metadata["reopened_by"] = reopened_by
-        self.metadata["reopened_at"] = datetime.now().isoformat()
+        self.metadata["reopened_at"] = now_isoformat()
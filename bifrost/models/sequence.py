@@ -4,9 +4,14 @@ Sequence model for the Bifrost system.
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
-from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, Optional
+from uuid import UUID
+from pydantic import Field, ConfigDict, ValidationInfo, field_validator
+
+from bifrost.models._trusted import TrustedModel
+from bifrost.models._variants import create_variant, update_variant
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 
 
 class SequenceStatus(str, Enum):
@@ -21,13 +26,33 @@ class SequenceStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-class Sequence(BaseModel):
+# Valid SequenceStatus values, for membership tests on raw strings
+SEQUENCE_STATUS_VALUES = frozenset(status.value for status in SequenceStatus)
+
+
+def _validate_frame_end(cls, v: Optional[int], info: ValidationInfo) -> Optional[int]:
+    """Validate that frame_end is greater than or equal to frame_start."""
+    frame_start = info.data.get('frame_start')
+    if v is not None and frame_start is not None and v < frame_start:
+        raise ValueError('frame_end must be greater than or equal to frame_start')
+    return v
+
+
+def _validate_global_frame_end(cls, v: Optional[int], info: ValidationInfo) -> Optional[int]:
+    """Validate that global_frame_end is greater than or equal to global_frame_start."""
+    global_frame_start = info.data.get('global_frame_start')
+    if v is not None and global_frame_start is not None and v < global_frame_start:
+        raise ValueError('global_frame_end must be greater than or equal to global_frame_start')
+    return v
+
+
+class Sequence(TrustedModel):
     """
     Represents a sequence in the animation production pipeline.
     
     A sequence belongs to an episode and contains shots.
     """
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     episode_id: Optional[UUID] = None  # Optional because some sequences might not be part of an episode
     name: str
     code: str  # Sequence code (e.g., "sq001")
@@ -40,29 +65,16 @@ class Sequence(BaseModel):
     global_frame_start: Optional[int] = None
     global_frame_end: Optional[int] = None
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     created_by: str
-    modified_at: datetime = Field(default_factory=datetime.utcnow)
+    modified_at: datetime = Field(default_factory=cached_utcnow)
     modified_by: str = ""
     metadata: Dict = Field(default_factory=dict)
     
-    @validator('frame_end')
-    def frame_end_greater_than_start(cls, v, values):
-        """Validate that frame_end is greater than or equal to frame_start."""
-        if 'frame_start' in values and v < values['frame_start']:
-            raise ValueError('frame_end must be greater than or equal to frame_start')
-        return v
-    
-    @validator('global_frame_end')
-    def global_frame_end_greater_than_start(cls, v, values):
-        """Validate that global_frame_end is greater than or equal to global_frame_start."""
-        if (v is not None and 'global_frame_start' in values and 
-                values['global_frame_start'] is not None and v < values['global_frame_start']):
-            raise ValueError('global_frame_end must be greater than or equal to global_frame_start')
-        return v
+    frame_end_greater_than_start = field_validator('frame_end')(_validate_frame_end)
+    global_frame_end_greater_than_start = field_validator('global_frame_end')(_validate_global_frame_end)
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
     
     @property
     def duration(self) -> int:
@@ -75,46 +87,23 @@ class Sequence(BaseModel):
         if self.global_frame_start is None or self.global_frame_end is None:
             return None
         return self.global_frame_end - self.global_frame_start + 1
+    
 
+def _frame_range_validators() -> Dict[str, Any]:
+    """Return the frame range validators for a generated sequence model."""
+    return {
+        'frame_end_greater_than_start': field_validator('frame_end')(_validate_frame_end),
+        'global_frame_end_greater_than_start': field_validator('global_frame_end')(_validate_global_frame_end),
+    }
 
-class SequenceCreate(BaseModel):
-    """Model for creating a new sequence."""
-    episode_id: Optional[UUID] = None
-    name: str
-    code: str
-    description: str = ""
-    status: SequenceStatus = SequenceStatus.PLANNING
-    frame_start: int = 1001
-    frame_end: int = 1001
-    global_frame_start: Optional[int] = None
-    global_frame_end: Optional[int] = None
-    metadata: Dict = Field(default_factory=dict)
-    
-    @validator('frame_end')
-    def frame_end_greater_than_start(cls, v, values):
-        """Validate that frame_end is greater than or equal to frame_start."""
-        if 'frame_start' in values and v < values['frame_start']:
-            raise ValueError('frame_end must be greater than or equal to frame_start')
-        return v
-    
-    @validator('global_frame_end')
-    def global_frame_end_greater_than_start(cls, v, values):
-        """Validate that global_frame_end is greater than or equal to global_frame_start."""
-        if (v is not None and 'global_frame_start' in values and 
-                values['global_frame_start'] is not None and v < values['global_frame_start']):
-            raise ValueError('global_frame_end must be greater than or equal to global_frame_start')
-        return v
-
-
-class SequenceUpdate(BaseModel):
-    """Model for updating an existing sequence."""
-    episode_id: Optional[UUID] = None
-    name: Optional[str] = None
-    code: Optional[str] = None
-    description: Optional[str] = None
-    status: Optional[SequenceStatus] = None
-    frame_start: Optional[int] = None
-    frame_end: Optional[int] = None
-    global_frame_start: Optional[int] = None
-    global_frame_end: Optional[int] = None
-    metadata: Optional[Dict] = None
\ No newline at end of file
+
+SequenceCreate = create_variant(
+    Sequence, 'SequenceCreate', "Model for creating a new sequence.",
+    exclude={'id', 'created_at', 'created_by', 'modified_at', 'modified_by'},
+    validators=_frame_range_validators())
+
+# Validators only run on fields included in the update
+SequenceUpdate = update_variant(
+    Sequence, 'SequenceUpdate', "Model for updating an existing sequence.",
+    exclude={'id', 'created_at', 'created_by', 'modified_at', 'modified_by'},
+    validators=_frame_range_validators())
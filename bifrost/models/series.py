@@ -2,11 +2,16 @@
 Series model for the Bifrost system.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field, ConfigDict
+
+from bifrost.models._trusted import TrustedModel
+from bifrost.models._variants import create_variant, update_variant
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 
 
 class SeriesStatus(str, Enum):
@@ -17,16 +22,16 @@ class SeriesStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-class Series(BaseModel):
+class Series(TrustedModel):
     """Top-level series model representing a production series."""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     name: str
     code: str = Field(min_length=2, max_length=20)
     description: str = ""
     status: SeriesStatus = SeriesStatus.PLANNING
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     created_by: str
-    modified_at: datetime = Field(default_factory=datetime.utcnow)
+    modified_at: datetime = Field(default_factory=cached_utcnow)
     modified_by: str = ""
     
     # Series metadata
@@ -37,28 +42,14 @@ class Series(BaseModel):
     # Additional metadata
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class SeriesCreate(BaseModel):
-    """Model for creating a new series."""
-    name: str
-    code: str = Field(min_length=2, max_length=20)
-    description: str = ""
-    status: SeriesStatus = SeriesStatus.PLANNING
-    season_number: Optional[int] = None
-    episode_count: Optional[int] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
+# total_duration is not given when creating a series, only in updates
+SeriesCreate = create_variant(
+    Series, 'SeriesCreate', "Model for creating a new series.",
+    exclude={'id', 'created_at', 'created_by', 'modified_at', 'modified_by', 'total_duration'})
 
-class SeriesUpdate(BaseModel):
-    """Model for updating an existing series."""
-    name: Optional[str] = None
-    code: Optional[str] = Field(default=None, min_length=2, max_length=20)
-    description: Optional[str] = None
-    status: Optional[SeriesStatus] = None
-    season_number: Optional[int] = None
-    episode_count: Optional[int] = None
-    total_duration: Optional[int] = None
-    metadata: Optional[Dict[str, Any]] = None
\ No newline at end of file
+SeriesUpdate = update_variant(
+    Series, 'SeriesUpdate', "Model for updating an existing series.",
+    exclude={'id', 'created_at', 'created_by', 'modified_at', 'modified_by'})
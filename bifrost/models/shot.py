@@ -4,14 +4,21 @@
 #
 # Created: 2025-04-02
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
+from . import _shot_numba
+from .asset import _add_sorted_version, _latest_version, _sorted_version_list
 
-class ShotStatus(Enum):
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class ShotStatus(str, Enum):
     """Enumeration of possible shot statuses in the production pipeline."""
     PLANNED = "planned"        # Shot is planned but not started
     IN_PROGRESS = "in_progress"  # Currently being worked on
@@ -22,7 +29,19 @@ class ShotStatus(Enum):
     OMITTED = "omitted"        # Shot has been cut from production
 
 
-class Department(Enum):
+# Valid ShotStatus values, for membership tests on raw strings
+SHOT_STATUS_VALUES = frozenset(status.value for status in ShotStatus)
+
+_APPROVED_STATUSES = frozenset({ShotStatus.APPROVED, ShotStatus.FINAL})
+
+# Small integer codes for ShotStatus, used in packed version arrays
+_STATUS_CODES = {status: code for code, status in enumerate(ShotStatus)}
+
+# Naive datetimes are converted to nanoseconds since this epoch when packed
+_EPOCH = datetime(1970, 1, 1)
+
+
+class Department(str, Enum):
     """Departments involved in shot production."""
     LAYOUT = "layout"
     ANIMATION = "animation"
@@ -34,7 +53,7 @@ class Department(Enum):
     ALL = "all"  # For global tasks/notes
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ShotTask:
     """Task associated with a shot."""
     id: str
@@ -53,7 +72,7 @@ class ShotTask:
     metadata: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ShotNote:
     """Notes and feedback related to a shot."""
     id: str
@@ -68,9 +87,8 @@ class ShotNote:
     
     def __post_init__(self):
         """Convert string paths to Path objects if needed."""
-        for i, path in enumerate(self.attachments):
-            if isinstance(path, str):
-                self.attachments[i] = Path(path)
+        if self.attachments:
+            self.attachments = [Path(p) if type(p) is str else p for p in self.attachments]
     
     def resolve(self, user: str) -> None:
         """Mark this note as resolved."""
@@ -79,7 +97,7 @@ class ShotNote:
         self.resolved_by: user
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ShotVersion:
     """Represents a specific version of a shot."""
     version_number: int
@@ -94,14 +112,24 @@ class ShotVersion:
     
     def __post_init__(self):
         """Convert string paths to Path objects if needed."""
-        if isinstance(self.filepath, str):
+        if type(self.filepath) is str:
             self.filepath = Path(self.filepath)
-        if isinstance(self.preview_path, str):
+        if type(self.preview_path) is str:
             self.preview_path = Path(self.preview_path)
 
 
-@dataclass
-class Shot:
+class _ShotCaches:
+    """
+    Slots for values Shot derives from its fields.
+    
+    These are not dataclass fields, so they stay out of fields(), asdict()
+    and repr().
+    """
+    __slots__ = ("_durations", "_durations_frame_range", "_durations_handle_range")
+
+
+@dataclass(**_SLOTS)
+class Shot(_ShotCaches):
     """
     Represents a shot in the animation production pipeline.
     
@@ -122,8 +150,9 @@ class Shot:
     global_frame_start: int = 0
     global_frame_end: int = 0
     
-    # References to assets used in this shot
-    asset_ids: Set[str] = field(default_factory=set)
+    # References to assets used in this shot; shots without assets share an
+    # empty frozenset until the first add_asset
+    asset_ids: Union[Set[str], FrozenSet[str]] = frozenset()
     
     # Shot management
     tasks: List[ShotTask] = field(default_factory=list)
@@ -138,46 +167,126 @@ class Shot:
     
     def __post_init__(self):
         """Convert string paths to Path objects if needed."""
-        if isinstance(self.thumbnail_path, str):
+        if type(self.thumbnail_path) is str:
             self.thumbnail_path = Path(self.thumbnail_path)
+        self.versions = _sorted_version_list(self.versions)
+        self._cache_durations()
+    
+    def _cache_durations(self) -> None:
+        """
+        Compute the durations for the current frame and handle ranges.
+        
+        The durations are stored with the frame_range and handle_range tuples
+        they were computed from; tuples are immutable, so they hold while both
+        are the same objects.
+        """
+        start, end = self.frame_range
+        pre, post = self.handle_range
+        self._durations = (max(0, end - start + 1), max(0, (end + post) - (start - pre) + 1))
+        self._durations_frame_range = self.frame_range
+        self._durations_handle_range = self.handle_range
+    
+    def _durations_current(self) -> bool:
+        """Check whether the cached durations match the current ranges."""
+        # Copies and unpickled instances don't carry the cache slots
+        return (getattr(self, "_durations_frame_range", None) is self.frame_range
+                and self._durations_handle_range is self.handle_range)
     
     @property
     def duration(self) -> int:
         """Calculate the duration of the shot in frames."""
-        start, end = self.frame_range
-        return max(0, end - start + 1)
+        if not self._durations_current():
+            self._cache_durations()
+        return self._durations[0]
     
     @property
     def duration_with_handles(self) -> int:
         """Calculate the duration of the shot in frames, including handles."""
-        start, end = self.frame_range
-        pre, post = self.handle_range
-        return max(0, (end + post) - (start - pre) + 1)
+        if not self._durations_current():
+            self._cache_durations()
+        return self._durations[1]
     
     @property
     def latest_version(self) -> Optional[ShotVersion]:
         """Return the latest version of this shot."""
-        if not self.versions:
-            return None
-        return max(self.versions, key=lambda v: v.version_number)
+        latest: Optional[ShotVersion] = _latest_version(self.versions)
+        return latest
     
     @property
     def latest_approved_version(self) -> Optional[ShotVersion]:
         """Return the latest approved or final version of this shot."""
-        approved_versions = [v for v in self.versions 
-                            if v.status in (ShotStatus.APPROVED, ShotStatus.FINAL)]
-        if not approved_versions:
-            return None
-        return max(approved_versions, key=lambda v: v.version_number)
+        latest: Optional[ShotVersion] = _latest_version(self.versions, _APPROVED_STATUSES)
+        return latest
     
     @property
     def global_duration(self) -> int:
         """Calculate the global duration of the shot in frames."""
         return (self.global_frame_end - self.global_frame_start) + 1
     
+    @staticmethod
+    def pack_frame_arrays(shots: Iterable["Shot"]) -> Tuple[Any, Any]:
+        """
+        Pack the frame ranges of shots into contiguous start and end frame arrays.
+        
+        Args:
+            shots: The shots to pack
+            
+        Returns:
+            Tuple of (starts, ends) int32 arrays, numpy arrays if numpy is installed
+        """
+        return _shot_numba.pack_frame_arrays(shot.frame_range for shot in shots)
+    
+    @staticmethod
+    def total_duration(shots: Iterable["Shot"]) -> int:
+        """
+        Sum the durations of shots in frames, excluding handles.
+        
+        Args:
+            shots: The shots to sum, e.g. all shots of a sequence
+            
+        Returns:
+            The total number of frames
+        """
+        starts, ends = Shot.pack_frame_arrays(shots)
+        return int(_shot_numba.total_duration(starts, ends))
+    
+    @staticmethod
+    def pack_version_arrays(versions: Iterable[ShotVersion]) -> Tuple[Any, Any, Any]:
+        """
+        Pack version metadata into contiguous arrays for reports across many shots.
+        
+        Args:
+            versions: The versions to pack
+            
+        Returns:
+            Tuple of (version_numbers, status_codes, created_at_ns) arrays;
+            status codes are the positions of the statuses in ShotStatus
+        """
+        return _shot_numba.pack_version_arrays(
+            (version.version_number,
+             _STATUS_CODES[version.status],
+             (version.created_at - _EPOCH) // timedelta(microseconds=1) * 1000)
+            for version in versions
+        )
+    
+    @staticmethod
+    def approved_versions(shots: Iterable["Shot"]) -> List[ShotVersion]:
+        """
+        Collect the approved or final versions of shots.
+        
+        Args:
+            shots: The shots to scan
+            
+        Returns:
+            The approved and final versions, in shot order
+        """
+        # Filtering by status needs no packed arrays; packing costs more than the scan
+        return [version for shot in shots for version in shot.versions
+                if version.status in _APPROVED_STATUSES]
+    
     def add_version(self, version: ShotVersion) -> None:
-        """Add a new version to this shot."""
-        self.versions.append(version)
+        """Add a new version to this shot, keeping versions ordered by number."""
+        _add_sorted_version(self.versions, version)
         self.modified_at = datetime.now()
     
     def add_task(self, task: ShotTask) -> None:
@@ -190,15 +299,22 @@ class Shot:
         self.notes.append(note)
         self.modified_at = datetime.now()
     
+    def _mutable_asset_ids(self) -> Set[str]:
+        """Return asset_ids as a set, replacing a frozenset with a copy first."""
+        asset_ids = self.asset_ids
+        if isinstance(asset_ids, frozenset):
+            asset_ids = self.asset_ids = set(asset_ids)
+        return asset_ids
+    
     def add_asset(self, asset_id: str) -> None:
         """Associate an asset with this shot."""
-        self.asset_ids.add(asset_id)
+        self._mutable_asset_ids().add(asset_id)
         self.modified_at = datetime.now()
     
     def remove_asset(self, asset_id: str) -> bool:
         """Remove an asset association from this shot."""
         if asset_id in self.asset_ids:
-            self.asset_ids.remove(asset_id)
+            self._mutable_asset_ids().remove(asset_id)
             self.modified_at = datetime.now()
             return True
         return False
@@ -212,4 +328,5 @@ class Shot:
     def update_frame_range(self, start_frame: int, end_frame: int) -> None:
         """Update the frame range of this shot."""
         self.frame_range = (start_frame, end_frame)
+        self._cache_durations()
         self.modified_at = datetime.now()
@@ -4,9 +4,14 @@ Task domain models for the Bifrost system.
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field, ConfigDict
+
+from bifrost.models._trusted import TrustedModel
+from bifrost.models._variants import create_variant, update_variant
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 
 
 class TaskStatus(str, Enum):
@@ -18,6 +23,10 @@ class TaskStatus(str, Enum):
     BLOCKED = "blocked"
 
 
+# Valid TaskStatus values, for membership tests on raw strings
+TASK_STATUS_VALUES = frozenset(status.value for status in TaskStatus)
+
+
 class TaskPriority(str, Enum):
     """Task priority enumeration."""
     LOW = "low"
@@ -26,9 +35,9 @@ class TaskPriority(str, Enum):
     CRITICAL = "critical"
 
 
-class Task(BaseModel):
+class Task(TrustedModel):
     """Core task model representing a work item."""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     name: str = Field(min_length=3, max_length=100)
     description: str
     status: TaskStatus = Field(default=TaskStatus.NOT_STARTED)
@@ -38,46 +47,20 @@ class Task(BaseModel):
     shot_id: Optional[UUID] = None
     department_id: Optional[UUID] = None
     due_date: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     created_by: str
     estimated_hours: Optional[float] = Field(default=None, ge=0)
     tags: List[str] = Field(default_factory=list)
     dependencies: List[UUID] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class TaskCreate(BaseModel):
-    """Model for creating a new task."""
-    name: str = Field(min_length=3, max_length=100)
-    description: str
-    status: TaskStatus = Field(default=TaskStatus.NOT_STARTED)
-    priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
-    assignee_id: Optional[UUID] = None
-    asset_id: Optional[UUID] = None
-    shot_id: Optional[UUID] = None
-    department_id: Optional[UUID] = None
-    due_date: Optional[datetime] = None
-    estimated_hours: Optional[float] = Field(default=None, ge=0)
-    tags: List[str] = Field(default_factory=list)
-    dependencies: List[UUID] = Field(default_factory=list)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
+TaskCreate = create_variant(
+    Task, 'TaskCreate', "Model for creating a new task.",
+    exclude={'id', 'created_at', 'created_by'})
 
-class TaskUpdate(BaseModel):
-    """Model for updating an existing task."""
-    name: Optional[str] = Field(default=None, min_length=3, max_length=100)
-    description: Optional[str] = None
-    status: Optional[TaskStatus] = None
-    priority: Optional[TaskPriority] = None
-    assignee_id: Optional[UUID] = None
-    asset_id: Optional[UUID] = None
-    shot_id: Optional[UUID] = None
-    department_id: Optional[UUID] = None
-    due_date: Optional[datetime] = None
-    estimated_hours: Optional[float] = Field(default=None, ge=0)
-    tags: Optional[List[str]] = None
-    dependencies: Optional[List[UUID]] = None
-    metadata: Optional[Dict[str, Any]] = None
\ No newline at end of file
+TaskUpdate = update_variant(
+    Task, 'TaskUpdate', "Model for updating an existing task.",
+    exclude={'id', 'created_at', 'created_by'})
@@ -12,13 +12,6 @@ from typing import Dict, List, Optional, Set, Union
 
 from .asset import Asset, AssetVersion
 
-# Check if USD is available
-USD_AVAILABLE = False
-try:
-    from pxr import Usd, UsdGeom, Sdf, Ar
-    USD_AVAILABLE = True
-except ImportError:
-    pass  # The integrations module will handle the warning
 
 class UsdVersionStrategy(Enum):
     """Strategies for versioning USD files."""
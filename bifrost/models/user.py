@@ -4,8 +4,12 @@ User domain models for the Bifrost system.
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from uuid import UUID, uuid4
-from pydantic import BaseModel, EmailStr, Field
+from uuid import UUID
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
+
+from bifrost.models._trusted import TrustedModel
+from bifrost.utils.clock import cached_utcnow
+from bifrost.utils.uuids import fast_uuid4
 
 
 class UserPreferences(BaseModel):
@@ -21,9 +25,9 @@ class TeamMembership(BaseModel):
     role: Optional[str] = None
 
 
-class User(BaseModel):
+class User(TrustedModel):
     """Core user model representing a system user."""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=fast_uuid4)
     username: str = Field(min_length=3, max_length=50)
     email: EmailStr
     password_hash: Optional[str] = None
@@ -33,12 +37,11 @@ class User(BaseModel):
     roles: List[str] = Field(default_factory=list)
     preferences: UserPreferences = Field(default_factory=UserPreferences)
     teams: List[TeamMembership] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=cached_utcnow)
     last_login: Optional[datetime] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserCreate(BaseModel):
@@ -6,9 +6,17 @@
 
 import json
 import logging
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Any
+
+import msgspec
 
 from ..core.database import db
 from ..models.review import Review, ReviewItem, ReviewNote, ReviewStatus, NoteStatus
@@ -16,6 +24,62 @@ from ..models.review import Review, ReviewItem, ReviewNote, ReviewStatus, NoteSt
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Columns of the review tables, selected with an r_, i_ or n_ prefix when
+# reviews are joined with their items and notes
+_REVIEW_COLUMNS = ('id', 'name', 'description', 'created_at', 'created_by',
+                   'completed_at', 'status', 'metadata')
+_ITEM_COLUMNS = ('id', 'review_id', 'item_id', 'item_type', 'version_id',
+                 'status', 'preview_path', 'metadata')
+_NOTE_COLUMNS = ('id', 'review_id', 'item_id', 'author', 'content', 'timestamp',
+                 'frame', 'timecode', 'status', 'metadata', 'attachments')
+_JOINED_COLUMNS = ', '.join(
+    [f"r.{column} AS r_{column}" for column in _REVIEW_COLUMNS]
+    + [f"i.{column} AS i_{column}" for column in _ITEM_COLUMNS]
+    + [f"n.{column} AS n_{column}" for column in _NOTE_COLUMNS])
+
+
+class _ReviewRow(msgspec.Struct, kw_only=True, frozen=True):
+    """
+    A review joined with one of its items and one of that item's notes.
+    
+    Query results are converted to these in one msgspec.convert call, which
+    checks and coerces the column types in C. Item and note columns are None
+    for reviews without items and items without notes.
+    """
+    r_id: str
+    r_name: str
+    r_description: Optional[str] = None
+    r_created_at: datetime
+    r_created_by: Optional[str] = None
+    r_completed_at: Optional[datetime] = None
+    r_status: str
+    r_metadata: Optional[str] = None
+    
+    i_id: Optional[str] = None
+    i_review_id: Optional[str] = None
+    i_item_id: Optional[str] = None
+    i_item_type: Optional[str] = None
+    i_version_id: Optional[str] = None
+    i_status: Optional[str] = None
+    i_preview_path: Optional[str] = None
+    i_metadata: Optional[str] = None
+    
+    n_id: Optional[str] = None
+    n_review_id: Optional[str] = None
+    n_item_id: Optional[str] = None
+    n_author: Optional[str] = None
+    n_content: Optional[str] = None
+    n_timestamp: Optional[datetime] = None
+    n_frame: Optional[int] = None
+    n_timecode: Optional[str] = None
+    n_status: Optional[str] = None
+    n_metadata: Optional[str] = None
+    n_attachments: Optional[str] = None
+
+
+_review_id = attrgetter('r_id')
+_item_row_id = attrgetter('i_id')
+
 
 class ReviewRepository:
     """
@@ -24,6 +88,24 @@ class ReviewRepository:
     This class handles persistence operations for reviews, review items, and notes.
     """
     
+    def __init__(self, cache_size: int = 1024, cache_ttl: float = 30.0):
+        """
+        Initialize the repository.
+        
+        Args:
+            cache_size: Maximum number of reviews whose rows get_review keeps cached
+            cache_ttl: Seconds get_review reuses a review's cached rows; this
+                bounds how long changes written by other processes go unseen
+        """
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        # Rows of recently read reviews: review ID -> (expiry time, rows),
+        # least recently used first
+        self._review_rows: "OrderedDict[str, Tuple[float, Tuple[_ReviewRow, ...]]]" = OrderedDict()
+        self._review_rows_lock = threading.Lock()
+        # Bumped by invalidate, so rows read before a change are not cached after it
+        self._generation = 0
+        
     def create_review(self, review: Review) -> Review:
         """
         Create a new review in the database.
@@ -52,6 +134,7 @@ class ReviewRepository:
         
         # Insert into database
         db.insert('reviews', review_data)
+        self.invalidate(review.id)
         
         # Insert items if any
         for item in review.items:
@@ -63,87 +146,178 @@ class ReviewRepository:
         """
         Get a review by ID.
         
+        The review's rows are cached for cache_ttl seconds, or until the
+        review is changed through this repository, so repeated lookups skip
+        the database. A new Review object is built for every call.
+        
         Args:
             review_id: ID of the review to retrieve
             
         Returns:
             Review object or None if not found
         """
-        # Get review data
-        review_data = db.get_by_id('reviews', review_id)
-        if not review_data:
-            return None
+        rows = self._get_review_rows(review_id)
+        reviews = self._assemble_reviews(rows)
+        return reviews[0] if reviews else None
+        
+    def invalidate(self, review_id: str) -> None:
+        """
+        Discard the cached rows of a review.
+        
+        Called by every method that changes a review, its items or its notes.
+        
+        Args:
+            review_id: ID of the changed review
+        """
+        with self._review_rows_lock:
+            self._generation += 1
+            self._review_rows.pop(review_id, None)
+        
+    def _get_review_rows(self, review_id: str) -> Tuple[_ReviewRow, ...]:
+        """
+        Get the joined rows of a review, reusing them within the cache TTL.
+        
+        Args:
+            review_id: ID of the review
             
-        # Get review items
-        items_query = "SELECT * FROM review_items WHERE review_id = ?"
-        items_data = db.execute(items_query, (review_id,))
-        
-        # Create ReviewItem objects
-        items = []
-        for item_data in items_data:
-            # Get notes for this item
-            notes_query = "SELECT * FROM review_notes WHERE review_id = ? AND item_id = ?"
-            notes_data = db.execute(notes_query, (review_id, item_data['item_id']))
+        Returns:
+            The review's rows, empty if the review doesn't exist
+        """
+        now = time.monotonic()
+        with self._review_rows_lock:
+            cached = self._review_rows.get(review_id)
+            if cached is not None and cached[0] > now:
+                self._review_rows.move_to_end(review_id)
+                return cached[1]
+            generation = self._generation
             
-            # Create ReviewNote objects
-            notes = []
-            for note_data in notes_data:
-                # Parse attachments
-                attachments = []
-                if note_data.get('attachments'):
-                    try:
-                        attachments = json.loads(note_data['attachments'])
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse attachments for note {note_data['id']}")
-                
-                note = ReviewNote(
-                    id=note_data['id'],
-                    review_id=note_data['review_id'],
-                    item_id=note_data['item_id'],
-                    author=note_data['author'],
-                    content=note_data['content'],
-                    timestamp=note_data.get('timestamp'),
-                    frame=note_data.get('frame'),
-                    timecode=note_data.get('timecode'),
-                    status=note_data.get('status', 'open'),
-                    metadata=db.deserialize_json(note_data.get('metadata')),
-                    attachments=attachments
-                )
-                notes.append(note)
+        rows = tuple(self._query_review_rows("SELECT * FROM reviews WHERE id = ?", (review_id,)))
+        
+        with self._review_rows_lock:
+            # Skip caching if a change was made while the rows were read
+            if generation == self._generation:
+                self._review_rows[review_id] = (now + self._cache_ttl, rows)
+                self._review_rows.move_to_end(review_id)
+                if len(self._review_rows) > self._cache_size:
+                    self._review_rows.popitem(last=False)
+        return rows
+        
+    def _query_review_rows(self, reviews_query: str, params: Tuple = ()) -> List[_ReviewRow]:
+        """
+        Load reviews joined with their items and notes in a single query.
+        
+        The result is ordered so that each review's rows, and each item's
+        rows within them, are adjacent. On SQLite, items and notes keep the
+        order they were added in (their rowid); other databases have no
+        portable insertion order, so items are ordered by ID there and notes
+        by timestamp, then ID.
+        
+        Args:
+            reviews_query: Query selecting the review rows, including any
+                filtering and pagination
+            params: Parameters of reviews_query
+            
+        Returns:
+            One row per note, or per item or review without notes, newest review first
+        """
+        # rowid is specific to SQLite
+        row_order = 'rowid' if db.db_type == 'sqlite' else 'id'
+        query = (
+            f"SELECT {_JOINED_COLUMNS} FROM ({reviews_query}) r "
+            "LEFT JOIN review_items i ON i.review_id = r.id "
+            "LEFT JOIN review_notes n ON n.review_id = r.id AND n.item_id = i.item_id "
+            f"ORDER BY r.created_at DESC, r.id, i.{row_order}, n.timestamp, n.{row_order}"
+        )
+        return msgspec.convert(db.execute(query, params), List[_ReviewRow], strict=False)
+        
+    def _assemble_reviews(self, rows: Iterable[_ReviewRow]) -> List[Review]:
+        """
+        Build Review objects from joined review, item and note rows.
+        
+        Args:
+            rows: Rows returned by _query_review_rows
+            
+        Returns:
+            Review objects with their items and notes, in row order
+        """
+        reviews = []
+        for _, review_group in groupby(rows, key=_review_id):
+            review_rows = list(review_group)
             
-            item = ReviewItem(
-                id=item_data['id'],
-                review_id=item_data['review_id'],
-                item_id=item_data['item_id'],
-                item_type=item_data['item_type'],
-                version_id=item_data['version_id'],
-                status=item_data.get('status', 'pending'),
-                notes=notes,
-                preview_path=item_data.get('preview_path'),
-                metadata=db.deserialize_json(item_data.get('metadata'))
-            )
-            items.append(item)
+            items = []
+            for item_key, item_group in groupby(review_rows, key=_item_row_id):
+                if item_key is None:
+                    continue  # Review without items
+                item_rows = list(item_group)
+                row = item_rows[0]
+                notes = [self._note_from_row(note_row) for note_row in item_rows
+                         if note_row.n_id is not None]
+                # Item columns are NOT NULL whenever the row has an item
+                assert (row.i_id is not None and row.i_review_id is not None
+                        and row.i_item_id is not None and row.i_item_type is not None
+                        and row.i_version_id is not None and row.i_status is not None)
+                items.append(ReviewItem(
+                    id=row.i_id,
+                    review_id=row.i_review_id,
+                    item_id=row.i_item_id,
+                    item_type=row.i_item_type,
+                    version_id=row.i_version_id,
+                    status=row.i_status,
+                    notes=notes,
+                    preview_path=Path(row.i_preview_path) if row.i_preview_path is not None else None,
+                    metadata=db.deserialize_json(row.i_metadata)
+                ))
             
-        # Convert status string to enum
-        try:
-            status = ReviewStatus(review_data['status'])
-        except ValueError:
-            status = ReviewStatus.PENDING
+            row = review_rows[0]
             
-        # Create Review object
-        review = Review(
-            id=review_data['id'],
-            name=review_data['name'],
-            description=review_data.get('description', ''),
-            created_at=review_data['created_at'],
-            created_by=review_data.get('created_by', ''),
-            completed_at=review_data.get('completed_at'),
-            status=status,
-            items=items,
-            metadata=db.deserialize_json(review_data.get('metadata'))
-        )
+            # Convert status string to enum
+            try:
+                status = ReviewStatus(row.r_status)
+            except ValueError:
+                status = ReviewStatus.PENDING
+                
+            reviews.append(Review(
+                id=row.r_id,
+                name=row.r_name,
+                description=row.r_description or "",
+                created_at=row.r_created_at,
+                created_by=row.r_created_by or "",
+                completed_at=row.r_completed_at,
+                status=status,
+                items=items,
+                metadata=db.deserialize_json(row.r_metadata)
+            ))
+            
+        return reviews
         
-        return review
+    def _note_from_row(self, row: _ReviewRow) -> ReviewNote:
+        """Build a ReviewNote from the note columns of a joined row."""
+        # Parse attachments
+        attachments = []
+        if row.n_attachments:
+            try:
+                attachments = json.loads(row.n_attachments)
+            except json.JSONDecodeError:
+                logger.warning(f"Failed to parse attachments for note {row.n_id}")
+        
+        # Note columns are NOT NULL whenever the row has a note
+        assert (row.n_id is not None and row.n_review_id is not None
+                and row.n_item_id is not None and row.n_author is not None
+                and row.n_content is not None and row.n_timestamp is not None
+                and row.n_status is not None)
+        return ReviewNote(
+            id=row.n_id,
+            review_id=row.n_review_id,
+            item_id=row.n_item_id,
+            author=row.n_author,
+            content=row.n_content,
+            timestamp=row.n_timestamp,
+            frame=row.n_frame,
+            timecode=row.n_timecode,
+            status=row.n_status,
+            metadata=db.deserialize_json(row.n_metadata),
+            attachments=attachments
+        )
         
     def update_review(self, review: Review) -> bool:
         """
@@ -173,6 +347,7 @@ class ReviewRepository:
         
         # Update in database
         db.update('reviews', review.id, review_data)
+        self.invalidate(review.id)
         
         # Note: This doesn't update items/notes - use specific methods for that
         return True
@@ -195,6 +370,7 @@ class ReviewRepository:
             
         # Delete the review (cascade will handle items and notes)
         db.delete('reviews', review_id)
+        self.invalidate(review_id)
         return True
         
     def add_item(self, review_id: str, item: ReviewItem) -> ReviewItem:
@@ -235,6 +411,7 @@ class ReviewRepository:
         
         # Insert into database
         db.insert('review_items', item_data)
+        self.invalidate(review_id)
         
         # Insert notes if any
         for note in item.notes:
@@ -284,6 +461,7 @@ class ReviewRepository:
         
         # Insert into database
         db.insert('review_notes', note_data)
+        self.invalidate(review_id)
         
         return note
         
@@ -296,7 +474,7 @@ class ReviewRepository:
             item_type: Optional item type filter
             
         Returns:
-            List of Review objects
+            List of Review objects, newest first
         """
         # Build query
         query = "SELECT review_id FROM review_items WHERE item_id = ?"
@@ -306,17 +484,9 @@ class ReviewRepository:
             query += " AND item_type = ?"
             params.append(item_type)
             
-        # Execute query
-        results = db.execute(query, tuple(params))
-        
-        # Get full reviews
-        reviews = []
-        for result in results:
-            review = self.get_review(result['review_id'])
-            if review:
-                reviews.append(review)
-                
-        return reviews
+        # Load the reviews containing the item with their items and notes
+        return self._assemble_reviews(
+            self._query_review_rows(f"SELECT * FROM reviews WHERE id IN ({query})", tuple(params)))
         
     def list_reviews(self, status: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[Review]:
         """
@@ -331,27 +501,19 @@ class ReviewRepository:
             List of Review objects
         """
         # Build query
-        query = "SELECT id FROM reviews"
+        query = "SELECT * FROM reviews"
         params = []
         
         if status:
             query += " WHERE status = ?"
             params.append(status)
             
+        # Paginate the reviews before joining, so limit counts reviews rather than rows
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        # Execute query
-        results = db.execute(query, tuple(params))
-        
-        # Get full reviews
-        reviews = []
-        for result in results:
-            review = self.get_review(result['id'])
-            if review:
-                reviews.append(review)
-                
-        return reviews
+        # Load the reviews with their items and notes
+        return self._assemble_reviews(self._query_review_rows(query, tuple(params)))
 
     def update_note_status(self, note_id: str, status: Union[str, NoteStatus]) -> bool:
         """
@@ -368,5 +530,11 @@ class ReviewRepository:
         if isinstance(status, NoteStatus):
             status = status.value
             
+        # Find the review the note belongs to, to invalidate its cached rows
+        results = db.execute("SELECT review_id FROM review_notes WHERE id = ?", (note_id,))
+        
         # Update note
-        return db.update('review_notes', note_id, {'status': status})
+        updated = db.update('review_notes', note_id, {'status': status})
+        for result in results:
+            self.invalidate(result['review_id'])
+        return updated
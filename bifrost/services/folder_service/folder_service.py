@@ -4,13 +4,14 @@
 #
 # Created: 2025-04-02
 
+import copy
 import os
 import yaml
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple, Any
+from typing import Callable, Dict, List, Optional, Union, Tuple, Any
 import re
-import string
 
 from ...core.config import get_config
 from ...models.folder_structure import (
@@ -21,6 +22,81 @@ from ...models.folder_structure import (
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(file_path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per modification time and shared, so never hand out the result."""
+    with open(file_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_yaml(file_path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed data while the file is unchanged.
+    
+    FolderService instances are created per request in some services, and
+    each one reads the same configuration files. Each call returns its own
+    copy of the parsed data, since the models built from it (e.g. episode
+    sequences and series numbering) are handed out to callers.
+    
+    Args:
+        file_path: Path to the YAML file
+        
+    Returns:
+        The parsed YAML data
+    """
+    return copy.deepcopy(_parse_yaml(file_path, os.stat(file_path).st_mtime_ns))
+
+
+@lru_cache(maxsize=64)
+def _published_cache_template(published_template: str, cache_field: str) -> FolderTemplate:
+    """Build the fallback published cache template below a published path template."""
+    return FolderTemplate(f"{published_template}/cache/{{{cache_field}}}")
+
+
+def _add_asset_args(format_args: Dict[str, Any], entity_name: str,
+                    asset_type: Optional[str], sequence: Optional[str]) -> None:
+    """Add the asset name and type to the format arguments of an asset path."""
+    if not asset_type:
+        raise ValueError("Asset type is required for asset paths")
+    format_args['ASSET_NAME'] = entity_name
+    format_args['ASSET_TYPE'] = asset_type
+
+
+def _add_shot_args(format_args: Dict[str, Any], entity_name: str,
+                   asset_type: Optional[str], sequence: Optional[str]) -> None:
+    """Add the shot and sequence names to the format arguments of a shot path."""
+    if not sequence:
+        raise ValueError("Sequence is required for shot paths")
+    format_args['SHOT'] = entity_name
+    format_args['SEQUENCE'] = sequence
+
+
+# For each entity type supported by get_path: the function adding its format
+# arguments, and the StudioMapping attribute holding the template per data type
+_ENTITY_PATHS: Dict[EntityType, Tuple[Callable[..., None], Dict[DataType, str]]] = {
+    EntityType.ASSET: (_add_asset_args, {
+        DataType.PUBLISHED: 'asset_published_path',
+        DataType.WORK: 'asset_work_path',
+        DataType.RENDER: 'render_path',
+        DataType.CACHE: 'cache_path',
+        DataType.PUBLISHED_CACHE: 'asset_published_cache_path',
+        DataType.DELIVERABLE: 'deliverable_path',
+    }),
+    EntityType.SHOT: (_add_shot_args, {
+        DataType.PUBLISHED: 'shot_published_path',
+        DataType.WORK: 'shot_work_path',
+        DataType.RENDER: 'render_path',
+        DataType.CACHE: 'cache_path',
+        DataType.PUBLISHED_CACHE: 'shot_published_cache_path',
+        DataType.DELIVERABLE: 'deliverable_path',
+    }),
+}
+
+
 class FolderService:
     """
     Service for managing production folder structures.
@@ -55,6 +131,7 @@ class FolderService:
         series_file = get_config("folder_structure.series_file",
                                "config/show/series_metadata.yaml")
         self.series_info = self._load_series_info(series_file)
+        self._prepare_series_lookups()
         
         logger.info(f"Folder service initialized with project root: {self.project_root}")
     
@@ -73,8 +150,7 @@ class FolderService:
                 logger.warning(f"Studio mappings file not found: {file_path}")
                 return {}
                 
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml(file_path)
                 
             mappings = {}
             for studio_name, paths in data.get('studio_mappings', {}).items():
@@ -141,8 +217,7 @@ class FolderService:
                 logger.warning(f"Dependencies file not found: {file_path}")
                 return [], {}
                 
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml(file_path)
                 
             departments = []
             for dept_data in data.get('departments', []):
@@ -202,8 +277,7 @@ class FolderService:
                 logger.warning(f"Series metadata file not found: {file_path}")
                 return None
                 
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f).get('series', {})
+            data = _load_yaml(file_path).get('series', {})
             
             # Create episodes list
             episodes = []
@@ -247,6 +321,31 @@ class FolderService:
             logger.error(f"Error loading series info: {e}")
             return None
     
+    def _prepare_series_lookups(self) -> None:
+        """
+        Precompute the lookups derived from the series metadata.
+        
+        Episodes and their sequences are indexed by ID, and the shot numbering
+        pattern is parsed once rather than for every shot. Call this again
+        after replacing or editing self.series_info.
+        """
+        self._episode_index: Dict[str, Episode] = {}
+        self._sequence_index: Dict[Tuple[str, str], Dict] = {}
+        shot_pattern = 'SH{number:04d}'
+        if self.series_info:
+            shot_pattern = self.series_info.numbering.get('shot_pattern', shot_pattern)
+        self._shot_id_template = FolderTemplate(shot_pattern)
+        if not self.series_info:
+            return
+            
+        for episode in self.series_info.episodes:
+            # Like a linear search, the first episode with a given ID wins
+            if episode.id in self._episode_index:
+                continue
+            self._episode_index[episode.id] = episode
+            for sequence in episode.sequences:
+                self._sequence_index.setdefault((episode.id, sequence['id']), sequence)
+    
     def get_path(self, 
                 entity_type: EntityType, 
                 data_type: DataType, 
@@ -307,94 +406,33 @@ class FolderService:
             **kwargs
         }
         
-        # Add entity-specific arguments
-        if entity_type == EntityType.ASSET:
-            if not asset_type:
-                raise ValueError("Asset type is required for asset paths")
-                
-            format_args['ASSET_NAME'] = entity_name
-            format_args['ASSET_TYPE'] = asset_type
-            
-            if data_type == DataType.PUBLISHED:
-                template = studio.asset_published_path
-            elif data_type == DataType.WORK:
-                template = studio.asset_work_path
-            elif data_type == DataType.RENDER:
-                if studio.render_path:
-                    template = studio.render_path
-                else:
-                    raise ValueError(f"Render path not defined for studio: {self.studio_name}")
-            elif data_type == DataType.CACHE:
-                if studio.cache_path:
-                    template = studio.cache_path
-                else:
-                    raise ValueError(f"Cache path not defined for studio: {self.studio_name}")
-            elif data_type == DataType.PUBLISHED_CACHE:
-                if studio.asset_published_cache_path:
-                    template = studio.asset_published_cache_path
-                else:
-                    # Fall back to a subdirectory in the published path if not explicitly defined
-                    template = FolderTemplate(f"{studio.asset_published_path.template}/cache/{{{cache_type or 'CACHE_TYPE'}}}")
-            elif data_type == DataType.DELIVERABLE:
-                if studio.deliverable_path:
-                    template = studio.deliverable_path
-                else:
-                    raise ValueError(f"Deliverable path not defined for studio: {self.studio_name}")
-            else:
-                raise ValueError(f"Unsupported data type for assets: {data_type}")
-                
-        elif entity_type == EntityType.SHOT:
-            if not sequence:
-                raise ValueError("Sequence is required for shot paths")
-                
-            format_args['SHOT'] = entity_name
-            format_args['SEQUENCE'] = sequence
-            
-            if data_type == DataType.PUBLISHED:
-                template = studio.shot_published_path
-            elif data_type == DataType.WORK:
-                template = studio.shot_work_path
-            elif data_type == DataType.RENDER:
-                if studio.render_path:
-                    template = studio.render_path
-                else:
-                    raise ValueError(f"Render path not defined for studio: {self.studio_name}")
-            elif data_type == DataType.CACHE:
-                if studio.cache_path:
-                    template = studio.cache_path
-                else:
-                    raise ValueError(f"Cache path not defined for studio: {self.studio_name}")
-            elif data_type == DataType.PUBLISHED_CACHE:
-                if studio.shot_published_cache_path:
-                    template = studio.shot_published_cache_path
-                else:
-                    # Fall back to a subdirectory in the published path if not explicitly defined
-                    template = FolderTemplate(f"{studio.shot_published_path.template}/cache/{{{cache_type or 'CACHE_TYPE'}}}")
-            elif data_type == DataType.DELIVERABLE:
-                if studio.deliverable_path:
-                    template = studio.deliverable_path
-                else:
-                    raise ValueError(f"Deliverable path not defined for studio: {self.studio_name}")
-            else:
-                raise ValueError(f"Unsupported data type for shots: {data_type}")
-                
-        else:
+        # Add entity-specific arguments and pick the template for the data type
+        try:
+            add_entity_args, template_attrs = _ENTITY_PATHS[entity_type]
+        except KeyError:
             raise ValueError(f"Unsupported entity type: {entity_type}")
+        add_entity_args(format_args, entity_name, asset_type, sequence)
+        
+        try:
+            template = getattr(studio, template_attrs[data_type])
+        except KeyError:
+            raise ValueError(f"Unsupported data type for {entity_type.value}s: {data_type}")
+        if not template:
+            if data_type != DataType.PUBLISHED_CACHE:
+                label = data_type.value.capitalize()
+                raise ValueError(f"{label} path not defined for studio: {self.studio_name}")
+            # Fall back to a subdirectory in the published path if not explicitly defined
+            published = getattr(studio, template_attrs[DataType.PUBLISHED])
+            template = _published_cache_template(published.template, cache_type or 'CACHE_TYPE')
         
         # Format the template using the arguments
         try:
-            # Use string.Formatter to identify missing keys first
-            required_keys = set()
-            for _, arg_name, _, _ in string.Formatter().parse(template.template):
-                if arg_name is not None:
-                    required_keys.add(arg_name)
-            
-            # Check for missing keys
-            missing_keys = required_keys - set(format_args.keys())
+            # Check for missing keys first, using the fields parsed with the template
+            missing_keys = template.field_names - format_args.keys()
             if missing_keys:
                 raise ValueError(f"Missing required path arguments: {', '.join(missing_keys)}")
                 
-            path = template.format(**format_args)
+            path = template.format_map(format_args)
             return path
         except KeyError as e:
             logger.error(f"Missing format argument: {e}")
@@ -446,13 +484,7 @@ class FolderService:
         Returns:
             Episode object or None if not found
         """
-        if not self.series_info:
-            return None
-            
-        for episode in self.series_info.episodes:
-            if episode.id == episode_id:
-                return episode
-        return None
+        return self._episode_index.get(episode_id)
     
     def get_sequence_info(self, episode_id: str, sequence_id: str) -> Optional[Dict]:
         """
@@ -465,14 +497,7 @@ class FolderService:
         Returns:
             Dictionary with sequence information or None if not found
         """
-        episode = self.get_episode_info(episode_id)
-        if not episode:
-            return None
-            
-        for sequence in episode.sequences:
-            if sequence['id'] == sequence_id:
-                return sequence
-        return None
+        return self._sequence_index.get((episode_id, sequence_id))
     
     def generate_shot_id(self, episode_id: str, sequence_id: str, shot_number: int) -> str:
         """
@@ -486,12 +511,7 @@ class FolderService:
         Returns:
             Generated shot ID
         """
-        if not self.series_info:
-            # Default pattern if no series info
-            return f"SH{shot_number:04d}"
-            
-        pattern = self.series_info.numbering.get('shot_pattern', 'SH{number:04d}')
-        return pattern.format(number=shot_number)
+        return self._shot_id_template.format(number=shot_number)
     
     def get_shared_elements(self, episode_id: str = None) -> List[SharedElement]:
         """
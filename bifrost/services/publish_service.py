@@ -12,6 +12,9 @@ from .folder_service import FolderService
 from ..integrations.usd.usd_service import UsdService
 from ..integrations.assetio.uri_mapper import AssetUriMapper
 
+# Work file suffixes that get USD-specific publish handling
+_USD_SUFFIXES = frozenset(['.usd', '.usda', '.usdc', '.usdz'])
+
 class PublishService:
     """
     Service for managing the publishing workflow from work files to published files.
@@ -81,9 +84,9 @@ class PublishService:
         dest_file = Path(published_path) / work_file.name
         
         # Special handling for USD files (apply version metadata)
-        if work_file.suffix.lower() in ['.usd', '.usda', '.usdc', '.usdz']:
-            # Open the USD stage
-            stage = self.usd_service.open_stage(work_file)
+        if work_file.suffix.lower() in _USD_SUFFIXES:
+            # Open a private USD stage, since the version metadata is not saved
+            stage = self.usd_service.open_stage(work_file, cached=False)
             if not stage:
                 print(f"Failed to open USD stage: {work_file}")
                 return None
@@ -101,6 +104,10 @@ class PublishService:
             
             # Save to new location
             layer.Export(str(dest_file))
+            
+            # Discard the metadata from the work file's layer, which other
+            # stages opened on the same file share
+            layer.Reload()
         else:
             # For non-USD files, just copy
             shutil.copy2(work_file, dest_file)
@@ -222,7 +229,7 @@ class PublishService:
         dest_file = Path(published_path) / work_file.name
         
         # Special handling for USD files (apply version metadata)
-        if work_file.suffix.lower() in ['.usd', '.usda', '.usdc', '.usdz']:
+        if work_file.suffix.lower() in _USD_SUFFIXES:
             # Apply similar USD metadata handling as in publish_asset
             # (Code omitted for brevity, but would follow same pattern)
             pass
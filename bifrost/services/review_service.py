@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
 from ..core.config import get_config
+from ..utils.clock import now_isoformat
 from ..models.review import Review, ReviewItem, ReviewNote, ReviewStatus, NoteStatus
 from ..repositories.review_repository import ReviewRepository
 from ..integrations.rv.rv_service import rv_service
@@ -147,6 +148,10 @@ class ReviewService:
         except ValueError:
             logger.error(f"Failed to add item to review {review_id}")
             return None
+        finally:
+            # Drop the cached review once the write is done, so a concurrent
+            # read can't cache the old review again
+            rv_service.invalidate_review(review_id)
             
     def add_note_to_item(self,
                        review_id: str,
@@ -196,6 +201,8 @@ class ReviewService:
         except Exception as e:
             logger.error(f"Failed to add note to item {item_id}: {e}")
             return None
+        finally:
+            rv_service.invalidate_review(review_id)
             
     def update_review_status(self, 
                           review_id: str, 
@@ -237,7 +244,7 @@ class ReviewService:
         elif status == ReviewStatus.REOPENED:
             review.completed_at = None
             review.metadata["reopened_by"] = modified_by
-            review.metadata["reopened_at"] = datetime.now().isoformat()
+            review.metadata["reopened_at"] = now_isoformat()
             
         # Update metadata
         if "status_history" not in review.metadata:
@@ -247,11 +254,14 @@ class ReviewService:
             "from": prev_status.value,
             "to": status.value,
             "by": modified_by,
-            "at": datetime.now().isoformat()
+            "at": now_isoformat()
         })
         
         # Save to database
-        return self.repository.update_review(review)
+        try:
+            return self.repository.update_review(review)
+        finally:
+            rv_service.invalidate_review(review_id)
         
     def update_note_status(self, 
                          note_id: str, 
@@ -277,8 +287,11 @@ class ReviewService:
         # Convert enum to string if needed
         status_str = status.value if isinstance(status, NoteStatus) else status
         
-        # Update in database
-        return self.repository.update_note_status(note_id, status_str)
+        # Update in database; the note's review isn't known here, so drop all cached reviews
+        try:
+            return self.repository.update_note_status(note_id, status_str)
+        finally:
+            rv_service.invalidate_review()
         
     def list_reviews(self, 
                    status: Optional[Union[ReviewStatus, str]] = None,
@@ -330,7 +343,10 @@ class ReviewService:
         Returns:
             True if successful, False otherwise
         """
-        return self.repository.delete_review(review_id)
+        try:
+            return self.repository.delete_review(review_id)
+        finally:
+            rv_service.invalidate_review(review_id)
         
     def play_review_in_rv(self, 
                         review_id: str, 
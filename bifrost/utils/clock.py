@@ -0,0 +1,59 @@
+"""
+Clock utilities for the Bifrost system.
+
+Models stamp their creation and modification times through cached_utcnow, so
+bulk ingestion that creates many models per millisecond shares clock reads.
+Timestamps stored as strings in metadata come from now_isoformat, which
+formats each second once.
+"""
+
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Tuple
+
+# Monotonic time of the last clock read and the timestamp it gave, swapped
+# as one tuple so threads never see a new time paired with an old timestamp
+_last_utcnow: Tuple[float, datetime] = (float('-inf'), datetime.min)
+
+
+def cached_utcnow(resolution: float = 0.005) -> datetime:
+    """
+    Return datetime.utcnow(), reusing the previous value if it is less than resolution seconds old.
+
+    Batch updates touch many models in a tight loop; they share one clock read
+    instead of querying the system clock for every timestamp.
+
+    Args:
+        resolution: Maximum age in seconds of a reused timestamp
+
+    Returns:
+        The current UTC time as a naive datetime
+    """
+    global _last_utcnow
+    t = time.monotonic()
+    last = _last_utcnow
+    if t - last[0] < resolution:
+        return last[1]
+    now = datetime.utcnow()
+    _last_utcnow = (t, now)
+    return now
+
+
+@lru_cache(maxsize=1)
+def _isoformat_second(second: int) -> str:
+    """Format a Unix time in whole seconds as a local ISO 8601 string."""
+    return datetime.fromtimestamp(second).isoformat(timespec='seconds')
+
+
+def now_isoformat() -> str:
+    """
+    Return the current local time as an ISO 8601 string with second precision.
+
+    The string is formatted once per second and shared by every call within
+    that second, e.g. when reopening many reviews in a backfill.
+
+    Returns:
+        The current local time, e.g. '2025-04-02T10:15:30'
+    """
+    return _isoformat_second(int(time.time()))
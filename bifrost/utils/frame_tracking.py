@@ -10,9 +10,6 @@ from typing import List, Optional, Tuple, Dict, Any
 from uuid import UUID
 
 from bifrost.core.database import db
-from bifrost.models.episode import Episode
-from bifrost.models.sequence import Sequence
-from bifrost.models.shot import Shot
 
 logger = logging.getLogger(__name__)
 
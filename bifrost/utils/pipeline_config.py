@@ -9,7 +9,7 @@ from pathlib import Path
 
 from bifrost.models.pipeline_step import (
     FileFormat, DepartmentDependency, PipelineStep,
-    AssetWorkflow, ShotWorkflow, PipelineWorkflow, WorkflowType
+    AssetWorkflow, ShotWorkflow, PipelineWorkflow, WorkflowType, intern_config
 )
 from bifrost.models.project import (
     Project, ProjectPipelineConfig, DepartmentOverride, TaskTemplateOverride
@@ -69,18 +69,18 @@ def get_departments(config_path: Optional[str] = None) -> List[PipelineStep]:
     for i, dept in enumerate(config.get('departments', [])):
         # Convert the YAML structure to our model structure
         requires = [
-            DepartmentDependency(
+            intern_config(DepartmentDependency(
                 department=req['department'],
                 status=req.get('status', 'approved')
-            ) for req in dept.get('requires', [])
+            )) for req in dept.get('requires', [])
         ]
         
         produces = [
-            FileFormat(
+            intern_config(FileFormat(
                 type=prod['type'],
                 formats=prod['format'],
                 location=prod['location']
-            ) for prod in dept.get('produces', [])
+            )) for prod in dept.get('produces', [])
         ]
         
         departments.append(
@@ -117,20 +117,20 @@ def get_workflows(config_path: Optional[str] = None) -> List[PipelineWorkflow]:
         asset_workflows = []
         for asset_type, asset_data in workflow_data.get('asset_types', {}).items():
             asset_workflows.append(
-                AssetWorkflow(
+                intern_config(AssetWorkflow(
                     asset_type=asset_type,
                     sequence=asset_data['sequence']
-                )
+                ))
             )
         
         # Process shot workflows
         shot_workflows = []
         for shot_type, shot_data in workflow_data.get('shot_types', {}).items():
             shot_workflows.append(
-                ShotWorkflow(
+                intern_config(ShotWorkflow(
                     shot_type=shot_type,
                     sequence=shot_data['sequence']
-                )
+                ))
             )
         
         # Create workflow object
@@ -208,19 +208,19 @@ def get_project_pipeline_config(project_code: str) -> ProjectPipelineConfig:
     asset_workflows = {}
     if 'asset_workflows' in pipeline_config:
         for asset_type, asset_data in pipeline_config['asset_workflows'].items():
-            asset_workflows[asset_type] = AssetWorkflow(
+            asset_workflows[asset_type] = intern_config(AssetWorkflow(
                 asset_type=asset_type,
                 sequence=asset_data.get('sequence', [])
-            )
+            ))
     
     # Parse shot workflows
     shot_workflows = {}
     if 'shot_workflows' in pipeline_config:
         for shot_type, shot_data in pipeline_config['shot_workflows'].items():
-            shot_workflows[shot_type] = ShotWorkflow(
+            shot_workflows[shot_type] = intern_config(ShotWorkflow(
                 shot_type=shot_type,
                 sequence=shot_data.get('sequence', [])
-            )
+            ))
     
     return ProjectPipelineConfig(
         workflow_type=workflow_type,
@@ -283,10 +283,10 @@ def get_project_pipeline_steps(project_code: str) -> List[PipelineStep]:
             requires = []
             for req in override.requires:
                 requires.append(
-                    DepartmentDependency(
+                    intern_config(DepartmentDependency(
                         department=req['department'],
                         status=req.get('status', 'approved')
-                    )
+                    ))
                 )
             
             # Update the step dependencies with the overrides
@@ -0,0 +1,67 @@
+"""
+UUID utilities for the Bifrost system.
+
+Models draw their default IDs from fast_uuid4, which takes random bytes from
+os.urandom in batches instead of making one system call per ID.
+"""
+
+import os
+from typing import List
+from uuid import UUID, SafeUUID
+
+# Number of UUIDs generated per os.urandom call
+_POOL_SIZE = 256
+
+# Bits of a random 128-bit integer to replace with the version 4 and
+# RFC 4122 variant markers, as UUID(version=4) does
+_VERSION_VARIANT_MASK = ~((0xf000 << 64) | (0xc000 << 48)) & ((1 << 128) - 1)
+_VERSION_VARIANT_BITS = (4 << 76) | (0x8000 << 48)
+
+# Prepared UUID integers; list.pop is atomic, so threads can share the pool
+_pool: List[int] = []
+
+# Process that filled the pool; a forked child must not hand out the parent's UUIDs
+_pool_pid = os.getpid()
+
+
+def _reset_pool() -> None:
+    """Discard the pool, e.g. after a fork copied it into a new process."""
+    global _pool_pid
+    _pool.clear()
+    _pool_pid = os.getpid()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _refill_pool() -> int:
+    """Fill the pool with a batch of UUID integers and return one more for the caller."""
+    data = os.urandom(16 * _POOL_SIZE)
+    _pool.extend((int.from_bytes(data[i:i + 16], 'big') & _VERSION_VARIANT_MASK) | _VERSION_VARIANT_BITS
+                 for i in range(16, len(data), 16))
+    return (int.from_bytes(data[:16], 'big') & _VERSION_VARIANT_MASK) | _VERSION_VARIANT_BITS
+
+
+def fast_uuid4() -> UUID:
+    """
+    Generate a random (version 4) UUID.
+
+    Equivalent to uuid.uuid4(), but the randomness comes from a pool refilled
+    256 UUIDs at a time, and the UUID is built without re-validating the
+    integer in UUID.__init__. The pool is discarded in forked children, so
+    worker processes never repeat their parent's UUIDs.
+
+    Returns:
+        A new random UUID
+    """
+    if _pool_pid != os.getpid():
+        _reset_pool()
+    try:
+        value = _pool.pop()
+    except IndexError:
+        value = _refill_pool()
+    uuid = object.__new__(UUID)
+    object.__setattr__(uuid, 'int', value)
+    object.__setattr__(uuid, 'is_safe', SafeUUID.unknown)
+    return uuid
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 import os
-from setuptools import setup, find_packages
+from setuptools import setup, find_namespace_packages
 
 long_description = ""
 if os.path.exists("README.md"):
@@ -9,11 +9,49 @@ if os.path.exists("README.md"):
 else:
     long_description = "Bifrost Animation Asset Management System for production pipelines."
 
+# Optionally compile hot model modules to C extensions with mypyc, which ships
+# with mypy (e.g. BIFROST_MYPYC=1 pip install --no-build-isolation .).
+# The pure Python modules are used otherwise.
+ext_modules = []
+if os.environ.get("BIFROST_MYPYC") == "1":
+    from mypyc.build import mypycify
+    # The mypy config also covers the tests, which aren't part of this build
+    ext_modules = mypycify(["--no-warn-unused-configs", "bifrost/models/asset.py"])
+
+# Optionally compile the pydantic model modules with Cython (BIFROST_CYTHON=1).
+# Annotations keep their Python meaning so pydantic can still read them.
+if os.environ.get("BIFROST_CYTHON") == "1":
+    from Cython.Build import cythonize
+    ext_modules += cythonize(
+        [
+            "bifrost/models/pipeline_step.py",
+            "bifrost/models/project.py",
+            "bifrost/models/sequence.py",
+            "bifrost/models/series.py",
+            "bifrost/models/task.py",
+        ],
+        compiler_directives={
+            "language_level": 3,
+            "binding": True,
+            "annotation_typing": False,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+
 setup(
     name="bifrost-pipeline",
     version="0.1.0",
-    packages=find_packages(),
+    # Several bifrost subpackages (core, models, integrations, utils) have no
+    # __init__.py, so find them as namespace packages
+    packages=find_namespace_packages(include=["bifrost", "bifrost.*"],
+                                     exclude=["*.__pycache__", "*.pkg", "*.pkg.*"]),
     include_package_data=True,
+    # RV package providing the note import/export entry points (see rv_service)
+    package_data={
+        "bifrost.integrations.rv": ["pkg/bifrost_notes/PACKAGE", "pkg/bifrost_notes/bifrost_notes.mu"],
+    },
+    ext_modules=ext_modules,
     
     # Dependencies
     install_requires=[
@@ -22,9 +60,10 @@ setup(
         "click>=8.0.0",
         "rich>=10.0.0",
         "requests>=2.26.0",
-        "fastapi>=0.68.0",
+        "fastapi>=0.100",
         "uvicorn>=0.15.0",
-        "pydantic>=1.8.2",
+        "pydantic>=2.0",
+        "msgspec>=0.18.0",
         "python-dotenv>=0.19.0",
         # Removed uuid as it is part of Python's standard library
         # OpenUSD dependency
@@ -53,6 +92,10 @@ setup(
         ],
         # OpenAssetIO integration
         "openassetio": ["openassetio>=1.0.0-rc.2"],
+        # Faster parsing and serialization of RV annotation notes
+        "rv": ["ijson>=3.1", "orjson>=3.6"],
+        # Compiled frame-range arithmetic over shot collections
+        "numba": ["numpy>=1.22", "numba>=0.56"],
     },
     
     # Entry points
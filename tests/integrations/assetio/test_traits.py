@@ -19,6 +19,8 @@ with patch.dict('sys.modules', {
     # Now we can import our module that uses OpenAssetIO
     from bifrost.integrations.assetio.traits import BifrostTraitHandler, trait_handler
 
+from bifrost.models.asset import Asset, AssetType
+
 
 class MockAsset:
     """Mock asset class for testing."""
@@ -173,6 +175,26 @@ class TestBifrostTraitHandler(unittest.TestCase):
         self.assertEqual(traits_data["versionedContent"]["versionInfo"]["createdBy"], "test_user")
         self.assertEqual(traits_data["versionedContent"]["versionInfo"]["comment"], "Initial version")
         
+    def test_asset_to_traits_data_missing_attributes(self):
+        """Test standard trait set conversion for assets lacking some attributes."""
+        asset = MockAsset(name="Partial Asset", path="/path/to/partial")
+        
+        # The versioned set expects version attributes the asset doesn't have
+        traits_data = self.trait_handler.asset_to_traits_data(asset, ["versioned"])
+        
+        self.assertEqual(traits_data["defaultName"]["name"], "Partial Asset")
+        self.assertEqual(traits_data["locatableContent"]["location"], "/path/to/partial")
+        self.assertNotIn("versionedContent", traits_data)
+        
+    def test_specialized_converters_match_generic_mapping(self):
+        """Test generated standard set converters produce the generic mapping output."""
+        asset = MockAsset(**{attr: attr for attr in self.trait_handler.asset_to_trait_map})
+        
+        for set_name in self.trait_handler.STANDARD_TRAIT_SETS:
+            # An unknown extra trait forces the generic mapping path
+            expected = self.trait_handler.asset_to_traits_data(asset, [set_name, "customTrait"])
+            self.assertEqual(self.trait_handler.asset_to_traits_data(asset, [set_name]), expected)
+        
     def test_traits_data_to_asset(self):
         """Test conversion from traits data to asset."""
         # Create traits data
@@ -205,6 +227,24 @@ class TestBifrostTraitHandler(unittest.TestCase):
         self.assertEqual(updated_asset.created_by, "other_user")
         self.assertEqual(updated_asset.comment, "Updated version")
         
+    def test_traits_round_trip_unmapped_fields(self):
+        """Test that traits without an Asset field are kept in the asset's metadata."""
+        traits_data = {
+            "locatableContent": {"location": "/show/a.usd"},
+            "mediaSource": {"width": 1920},
+        }
+        asset = Asset(id="a1", name="Hero", asset_type=AssetType.CHARACTER)
+        
+        self.trait_handler.traits_data_to_asset(traits_data, asset)
+        
+        self.assertEqual(asset.metadata, {"path": "/show/a.usd", "width": 1920})
+        self.assertIn("locatableContent", self.trait_handler.discover_traits(asset))
+        
+        for trait_set in (["basic"], ["basic", "media"]):
+            exported = self.trait_handler.asset_to_traits_data(asset, trait_set)
+            self.assertEqual(exported["locatableContent"], {"location": "/show/a.usd"})
+        self.assertEqual(exported["mediaSource"], {"width": 1920})
+        
     def test_relationship_trait_discovery(self):
         """Test discovery of relationship traits."""
         # Create a mock asset with dependencies
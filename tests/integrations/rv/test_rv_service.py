@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# test_rv_service.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the OpenRV service.
+"""
+
+import importlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from bifrost.integrations.rv import rv_service
+from bifrost.integrations.rv.rv_service import RVService
+
+# psycopg2 is only needed for PostgreSQL connections
+with patch.dict('sys.modules', {
+    'psycopg2': MagicMock(),
+    'psycopg2.extras': MagicMock(),
+}):
+    review_service_module = importlib.import_module("bifrost.services.review_service")
+    services_package = sys.modules["bifrost.services"]
+
+
+# Annotations as exported by RV's annotations package
+RV_PAYLOAD = {
+    "annotations": [
+        {
+            "id": "a1",
+            "type": "text",
+            "text": "Fix the hand pose",
+            "frame": 1012,
+            "author": "lead",
+            "timestamp": "2025-04-14T10:00:00",
+            "color": [1.0, 0.0, 0.0, 1.0],
+            "properties": {"size": 12},
+        },
+        {
+            "id": "a2",
+            "type": "stroke",
+            "frame": 1020,
+        },
+    ]
+}
+
+
+class TestRVNoteImport(unittest.TestCase):
+    """Test importing notes from RV sessions."""
+
+    def setUp(self):
+        """Set up an enabled service writing to a temporary session directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.service = RVService()
+        self.service.rv_enabled = True
+        self.service.rv_binary = "rv"
+        self.service.rv_session_dir = self.temp_dir.name
+        self.service.rv_notes_package = False
+
+        self.session_file = Path(self.temp_dir.name) / "review.rv"
+        self.session_file.write_text("GTOa (4)\n")
+
+    def _fake_rv(self, payload):
+        """Return a subprocess.run stand-in that writes payload to the export path."""
+        def run(argv, **kwargs):
+            snippet = next(arg for arg in argv if "export(" in arg)
+            export_path = re.search(r"export\('(.+)'\)", snippet).group(1)
+            with open(export_path, "w") as f:
+                json.dump(payload, f)
+            return subprocess.CompletedProcess(argv, 0, stdout="", stderr="")
+        return run
+
+    def test_import_notes_from_rv(self):
+        """Test that exported annotations are converted to note dictionaries."""
+        with patch("bifrost.integrations.rv.rv_service.subprocess.run", side_effect=self._fake_rv(RV_PAYLOAD)):
+            notes = self.service.import_notes_from_rv(self.session_file)
+
+        self.assertEqual(len(notes), 2)
+        self.assertEqual(notes[0], {
+            "content": "Fix the hand pose",
+            "frame": 1012,
+            "author": "lead",
+            "timestamp": "2025-04-14T10:00:00",
+            "status": "open",
+            "metadata": {
+                "rv_id": "a1",
+                "rv_type": "text",
+                "rv_color": [1.0, 0.0, 0.0, 1.0],
+                "rv_properties": {"size": 12},
+            },
+        })
+
+        # Missing fields fall back to defaults
+        self.assertEqual(notes[1]["content"], "")
+        self.assertEqual(notes[1]["author"], "Unknown")
+        self.assertEqual(notes[1]["metadata"]["rv_properties"], {})
+
+        # The temporary export file is removed
+        self.assertEqual(list(Path(self.temp_dir.name).glob("*.json")), [])
+
+    def test_import_notes_from_rv_failure(self):
+        """Test that a failed RV run imports no notes."""
+        failed = subprocess.CompletedProcess([], 1, stdout="", stderr="boom")
+        with patch("bifrost.integrations.rv.rv_service.subprocess.run", return_value=failed):
+            notes = self.service.import_notes_from_rv(self.session_file)
+
+        self.assertEqual(notes, [])
+
+
+class TestRVSessionCache(unittest.TestCase):
+    """Test reusing RV session files created for the same inputs."""
+
+    def setUp(self):
+        """Set up an enabled service and a media file older than any session."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.service = RVService()
+        self.service.rv_enabled = True
+        self.service.rv_binary = "rv"
+        self.service.rv_session_dir = self.temp_dir.name
+
+        self.media = Path(self.temp_dir.name) / "sh010.mov"
+        self.media.write_bytes(b"")
+        past = time.time() - 100
+        os.utime(self.media, (past, past))
+
+        run = patch.object(RVService, "_run_rv", side_effect=self._fake_rv)
+        self.run = run.start()
+        self.addCleanup(run.stop)
+
+    @staticmethod
+    def _fake_rv(argv, **kwargs):
+        """Stand in for RV saving a session to the path after -save."""
+        Path(argv[argv.index("-save") + 1]).write_text("GTOa (4)\n")
+        return 0, ""
+
+    def test_reuses_cached_session(self):
+        """Test that a second session for the same media and name doesn't run RV."""
+        first = self.service.create_session_file([self.media], "Dailies")
+        first.unlink()
+
+        second = self.service.create_session_file([str(self.media)], "Dailies")
+
+        self.assertEqual(second, first)
+        self.assertEqual(second.read_text(), "GTOa (4)\n")
+        self.assertEqual(self.run.call_count, 1)
+
+    def test_different_inputs(self):
+        """Test that other media or session names get their own session."""
+        other = Path(self.temp_dir.name) / "sh020.mov"
+        other.write_bytes(b"")
+        os.utime(other, (time.time() - 100,) * 2)
+
+        self.service.create_session_file([self.media], "Dailies")
+        self.service.create_session_file([self.media], "Retakes")
+        self.service.create_session_file([self.media, other], "Dailies")
+
+        self.assertEqual(self.run.call_count, 3)
+
+    def test_changed_media(self):
+        """Test that a session is created again after its media changes."""
+        self.service.create_session_file([self.media], "Dailies")
+        future = time.time() + 100
+        os.utime(self.media, (future, future))
+
+        self.service.create_session_file([self.media], "Dailies")
+
+        self.assertEqual(self.run.call_count, 2)
+
+    def test_failed_session_not_cached(self):
+        """Test that a failed RV run is neither returned nor reused."""
+        self.run.side_effect = None
+        self.run.return_value = (1, "boom")
+
+        self.assertIsNone(self.service.create_session_file([self.media], "Dailies"))
+
+        self.run.side_effect = self._fake_rv
+        self.assertIsNotNone(self.service.create_session_file([self.media], "Dailies"))
+        self.assertEqual(self.run.call_count, 2)
+
+
+class TestRVReviewCache(unittest.TestCase):
+    """Test caching of the reviews resolved for playback and export."""
+
+    def setUp(self):
+        """Start from an empty cache with a stubbed review lookup."""
+        rv_service._REVIEW_CACHE.clear()
+        self.addCleanup(rv_service._REVIEW_CACHE.clear)
+
+        # The RV service imports the review service when it first needs it
+        modules = patch.dict("sys.modules", {
+            "bifrost.services": services_package,
+            "bifrost.services.review_service": review_service_module,
+        })
+        modules.start()
+        self.addCleanup(modules.stop)
+
+        get_review = patch.object(review_service_module.review_service, "get_review",
+                                  side_effect=lambda review_id: MagicMock(id=review_id))
+        self.get_review = get_review.start()
+        self.addCleanup(get_review.stop)
+
+        self.service = RVService()
+
+    def test_repeated_lookups_use_cache(self):
+        """Test that a review is fetched once within the TTL."""
+        first = self.service._get_review("r1")
+        second = self.service._get_review("r1")
+
+        self.assertIs(first, second)
+        self.get_review.assert_called_once_with("r1")
+
+    def test_cache_expires(self):
+        """Test that a review is fetched again after the TTL."""
+        self.service._get_review("r1")
+
+        later = time.monotonic() + rv_service._REVIEW_CACHE_TTL + 1
+        with patch.object(rv_service.time, "monotonic", return_value=later):
+            self.service._get_review("r1")
+
+        self.assertEqual(self.get_review.call_count, 2)
+
+    def test_invalidate_review(self):
+        """Test that invalidated reviews are fetched again."""
+        self.service._get_review("r1")
+        self.service._get_review("r2")
+
+        RVService.invalidate_review("r1")
+        self.service._get_review("r1")
+        self.service._get_review("r2")
+
+        self.assertEqual(self.get_review.call_count, 3)
+
+        RVService.invalidate_review()
+        self.service._get_review("r2")
+
+        self.assertEqual(self.get_review.call_count, 4)
+
+    def test_missing_review_not_cached(self):
+        """Test that a review that wasn't found is looked up again."""
+        self.get_review.side_effect = None
+        self.get_review.return_value = None
+
+        self.assertIsNone(self.service._get_review("r1"))
+        self.assertIsNone(self.service._get_review("r1"))
+        self.assertEqual(self.get_review.call_count, 2)
+
+    def test_cache_is_bounded(self):
+        """Test that only the most recently fetched reviews are kept."""
+        with patch.object(rv_service, "_REVIEW_CACHE_SIZE", 2):
+            for review_id in ("r1", "r2", "r3"):
+                self.service._get_review(review_id)
+
+        self.assertEqual(list(rv_service._REVIEW_CACHE), ["r2", "r3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# test_usd_environment.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for configuring the USD environment before pxr is imported.
+"""
+
+import importlib
+import importlib.machinery
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bifrost.core import config
+
+USD_CONFIG = {
+    "usd.enabled": True,
+    "usd.environment": {"PXR_PLUGINPATH_NAME": "/studio/usd/plugins"},
+}
+
+
+class StubPxrFinder:
+    """Meta path finder providing a stub pxr package that records the plugin path when imported."""
+
+    def __init__(self):
+        self.plugin_paths = []
+
+    def find_spec(self, name, path=None, target=None):
+        """Return a spec for the stub package when pxr is imported."""
+        if name == "pxr":
+            return importlib.machinery.ModuleSpec(name, self)
+        return None
+
+    def create_module(self, spec):
+        """Use the default module creation."""
+        return None
+
+    def exec_module(self, module):
+        """Record the plugin path and add stand-ins for the pxr modules."""
+        self.plugin_paths.append(os.environ.get("PXR_PLUGINPATH_NAME"))
+        for name in ("Usd", "UsdGeom", "Sdf", "Ar", "UsdUtils", "Tf"):
+            setattr(module, name, MagicMock())
+
+
+class TestUsdEnvironment(unittest.TestCase):
+    """Test that plugin paths are set before the USD modules load."""
+
+    def setUp(self):
+        """Import the USD modules afresh, with a stub pxr package."""
+        modules = patch.dict(sys.modules)
+        modules.start()
+        self.addCleanup(modules.stop)
+        for name in [name for name in sys.modules
+                     if name == "pxr" or name.startswith(("pxr.", "bifrost.integrations.usd",
+                                                          "bifrost.models.usd_asset"))]:
+            del sys.modules[name]
+
+        environ = patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop("PXR_PLUGINPATH_NAME", None)
+
+        get_config = patch.object(config, "get_config",
+                                  side_effect=lambda key, default=None: USD_CONFIG.get(key, default))
+        get_config.start()
+        self.addCleanup(get_config.stop)
+
+        self.pxr_finder = StubPxrFinder()
+        sys.meta_path.insert(0, self.pxr_finder)
+        self.addCleanup(sys.meta_path.remove, self.pxr_finder)
+
+    def test_package_import_is_lazy(self):
+        """Test that importing the package neither loads pxr nor changes the environment."""
+        importlib.import_module("bifrost.integrations.usd")
+
+        self.assertEqual(self.pxr_finder.plugin_paths, [])
+        self.assertNotIn("PXR_PLUGINPATH_NAME", os.environ)
+
+    def test_service_import_configures_environment_first(self):
+        """Test that importing the USD service sets plugin paths before importing pxr."""
+        importlib.import_module("bifrost.integrations.usd.usd_service")
+
+        self.assertEqual(self.pxr_finder.plugin_paths, ["/studio/usd/plugins"])
+
+    def test_lazy_attribute_configures_environment_first(self):
+        """Test that resolving the pxr modules lazily sets plugin paths first."""
+        usd = importlib.import_module("bifrost.integrations.usd")
+
+        usd.USD_AVAILABLE
+
+        self.assertEqual(self.pxr_finder.plugin_paths, ["/studio/usd/plugins"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# test_usd_service.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the USD service, against stand-ins for the pxr modules.
+"""
+
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+
+class ErrorException(Exception):
+    """Stand-in for pxr.Tf.ErrorException."""
+
+
+# The service needs pxr at import time; these tests only exercise the
+# code paths around it
+pxr = types.ModuleType("pxr")
+for name in ("Usd", "UsdGeom", "Sdf", "Ar", "UsdUtils", "Tf"):
+    setattr(pxr, name, MagicMock())
+pxr.Tf.ErrorException = ErrorException
+
+with patch.dict('sys.modules', {'pxr': pxr}):
+    from bifrost.integrations.usd import usd_service
+    from bifrost.integrations.usd.usd_service import UsdService
+
+
+class TestConvertToUsd(unittest.TestCase):
+    """Test converting other formats to USD."""
+
+    def setUp(self):
+        """Set up a service converting in a temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.source = Path(temp_dir.name) / "rock.abc"
+        self.source.write_bytes(b"")
+
+        self.service = UsdService()
+        self.service.conversion_temp_dir = Path(temp_dir.name) / "conversion"
+
+        sdf = patch.object(usd_service, "Sdf")
+        self.sdf = sdf.start()
+        self.addCleanup(sdf.stop)
+        run = patch("subprocess.run")
+        self.run = run.start()
+        self.addCleanup(run.stop)
+
+    def test_in_process_translation(self):
+        """Test that files are translated through the file format plugin when it is available."""
+        self.sdf.Layer.FindOrOpen.return_value.Export.return_value = True
+
+        result = self.service.convert_to_usd(self.source)
+
+        self.assertEqual(result, self.source.with_suffix(".usd"))
+        self.sdf.Layer.FindOrOpen.return_value.Export.assert_called_once_with(
+            str(self.source.with_suffix(".usd")))
+        self.run.assert_not_called()
+
+    def test_falls_back_to_usdcat(self):
+        """Test that usdcat is used when no file format plugin can open the file."""
+        self.sdf.Layer.FindOrOpen.side_effect = ErrorException("no file format plugin for 'abc'")
+
+        result = self.service.convert_to_usd(self.source)
+
+        self.assertEqual(result, self.source.with_suffix(".usd"))
+        self.run.assert_called_once_with(
+            ["usdcat", "--in", str(self.source), "--out", str(self.source.with_suffix(".usd"))],
+            check=True)
+
+    def test_usdcat_failure(self):
+        """Test that a failed usdcat run converts nothing."""
+        self.sdf.Layer.FindOrOpen.return_value = None
+        self.run.side_effect = OSError("usdcat not found")
+
+        self.assertIsNone(self.service.convert_to_usd(self.source))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# test_asset.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the Asset model.
+"""
+
+import copy
+import dataclasses
+import unittest
+
+from bifrost.models.asset import AssemblyComponent, Asset, AssetStatus, AssetType, AssetVersion
+
+
+def make_asset(*version_numbers):
+    """Create an asset with versions numbered as given."""
+    return Asset(id="a1", name="Hero", asset_type=AssetType.CHARACTER,
+                 versions=[AssetVersion(number) for number in version_numbers])
+
+
+class TestAssetVersions(unittest.TestCase):
+    """Test looking up the latest versions of an asset."""
+
+    def test_latest_version(self):
+        """Test that the highest numbered version is the latest."""
+        asset = make_asset(2, 3, 1)
+
+        self.assertEqual(asset.latest_version.version_number, 3)
+        self.assertIsNone(make_asset().latest_version)
+
+    def test_add_version_keeps_order(self):
+        """Test that added versions are inserted by version number."""
+        asset = make_asset(1, 4)
+
+        asset.add_version(AssetVersion(2))
+        asset.add_version(AssetVersion(5))
+
+        self.assertEqual([v.version_number for v in asset.versions], [1, 2, 4, 5])
+        self.assertEqual(asset.latest_version.version_number, 5)
+
+    def test_approve_version_in_place(self):
+        """Test that approving an existing version is seen without re-adding it."""
+        asset = make_asset(1, 2)
+        self.assertIsNone(asset.latest_approved_version)
+
+        asset.versions[0].status = AssetStatus.APPROVED
+
+        self.assertEqual(asset.latest_approved_version.version_number, 1)
+
+        asset.versions[1].status = AssetStatus.FINAL
+        asset.versions[0].status = AssetStatus.REVIEW
+
+        self.assertEqual(asset.latest_approved_version.version_number, 2)
+
+    def test_reassigned_versions(self):
+        """Test that a reassigned versions list is scanned and left unsorted."""
+        asset = make_asset(1, 2)
+        self.assertEqual(asset.latest_version.version_number, 2)
+
+        versions = [AssetVersion(5), AssetVersion(1)]
+        versions[1].status = AssetStatus.APPROVED
+        asset.versions = versions
+
+        self.assertEqual(asset.latest_version.version_number, 5)
+        self.assertEqual(asset.latest_approved_version.version_number, 1)
+        self.assertEqual([v.version_number for v in versions], [5, 1])
+
+    def test_appended_versions(self):
+        """Test that versions appended to the list directly are seen."""
+        asset = make_asset(2)
+        asset.versions.append(AssetVersion(1))
+        asset.versions.append(AssetVersion(3))
+
+        self.assertEqual(asset.latest_version.version_number, 3)
+
+    def test_replaced_version(self):
+        """Test that a version replaced in place is seen."""
+        asset = make_asset(1, 2)
+        self.assertEqual(asset.latest_version.version_number, 2)
+
+        asset.versions[0] = AssetVersion(9)
+
+        self.assertEqual(asset.latest_version.version_number, 9)
+
+        asset.add_version(AssetVersion(3))
+
+        self.assertEqual([v.version_number for v in asset.versions], [2, 3, 9])
+
+    def test_renumbered_latest_version(self):
+        """Test that renumbering the latest version in place is seen."""
+        asset = make_asset(1, 2, 3)
+
+        asset.versions[-1].version_number = 0
+
+        self.assertEqual(asset.latest_version.version_number, 2)
+
+    def test_copies(self):
+        """Test that copies look up versions like the original."""
+        asset = make_asset(1, 3)
+
+        self.assertEqual(copy.copy(asset).latest_version.version_number, 3)
+        self.assertEqual(copy.deepcopy(asset).latest_version.version_number, 3)
+
+    def test_asdict_has_only_fields(self):
+        """Test that the version bookkeeping is not part of the dataclass fields."""
+        asset = make_asset(1)
+
+        self.assertEqual(set(dataclasses.asdict(asset)),
+                         {field.name for field in dataclasses.fields(Asset)})
+        self.assertFalse(any(field.name.startswith("_") for field in dataclasses.fields(Asset)))
+
+
+class TestAssemblyComponents(unittest.TestCase):
+    """Test the components of assembly assets."""
+
+    def setUp(self):
+        """Create an environment assembly."""
+        self.asset = Asset(id="env1", name="Forest", asset_type=AssetType.ENVIRONMENT)
+
+    def test_add_and_remove_components(self):
+        """Test that components are added in order and removed by asset ID."""
+        self.asset.add_component("tree", {"translate": [0, 0, 0]})
+        self.asset.add_component("rock")
+        self.asset.add_component("tree", {"translate": [5, 0, 0]})
+        components = self.asset.contained_assets
+
+        self.assertEqual(self.asset.get_all_component_ids(), ["tree", "rock", "tree"])
+        self.assertTrue(self.asset.remove_component("tree"))
+        self.assertFalse(self.asset.remove_component("tree"))
+        self.assertEqual(self.asset.get_all_component_ids(), ["rock"])
+        self.assertIs(self.asset.contained_assets, components)
+
+    def test_remove_component_keeps_order(self):
+        """Test that every match is removed and the other components keep their order."""
+        for asset_id in ("tree", "rock", "tree", "bush", "tree", "log"):
+            self.asset.add_component(asset_id)
+        kept = [c for c in self.asset.contained_assets if c.asset_id != "tree"]
+
+        self.assertTrue(self.asset.remove_component("tree"))
+
+        self.assertEqual(self.asset.contained_assets, kept)
+        self.assertEqual(self.asset.get_all_component_ids(), ["rock", "bush", "log"])
+
+    def test_remove_missing_component(self):
+        """Test that removing an unknown component changes nothing."""
+        self.asset.add_component("rock")
+        modified_at = self.asset.modified_at
+
+        self.assertFalse(self.asset.remove_component("tree"))
+
+        self.assertEqual(self.asset.get_all_component_ids(), ["rock"])
+        self.assertEqual(self.asset.modified_at, modified_at)
+
+    def test_components_are_a_list(self):
+        """Test that contained_assets behaves as a list of AssemblyComponent objects."""
+        self.asset.contained_assets.append(AssemblyComponent(asset_id="tree"))
+        self.asset.add_component("rock")
+
+        self.asset.contained_assets[0].override_parameters["scale"] = 2
+
+        self.assertEqual([c.asset_id for c in self.asset.contained_assets], ["tree", "rock"])
+        self.assertEqual(self.asset.contained_assets[0].override_parameters, {"scale": 2})
+        self.assertEqual(dataclasses.asdict(self.asset)["contained_assets"], [
+            {"asset_id": "tree", "transform": None, "override_parameters": {"scale": 2}},
+            {"asset_id": "rock", "transform": {}, "override_parameters": {}},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
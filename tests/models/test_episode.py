@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# test_episode.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the msgspec Episode models.
+"""
+
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import msgspec
+
+from bifrost.models.episode import Episode, EpisodeCreate, EpisodeStatus, EpisodeUpdate
+
+
+SERIES_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def episode_data(**overrides):
+    """Return the fields of an episode as they would arrive from the API."""
+    data = {
+        "series_id": str(SERIES_ID),
+        "name": "Pilot",
+        "code": "ep001",
+        "created_by": "lead",
+        "frame_start": 1001,
+        "frame_end": 1100,
+    }
+    data.update(overrides)
+    return data
+
+
+class TestEpisodeValidation(unittest.TestCase):
+    """Test building episodes from plain data."""
+
+    def test_from_dict_coerces_types(self):
+        """Test that UUIDs, enums and datetimes are converted from their JSON forms."""
+        episode = Episode.from_dict(episode_data(
+            status="production", created_at="2025-04-14T09:00:00"))
+
+        self.assertEqual(episode.series_id, SERIES_ID)
+        self.assertIs(episode.status, EpisodeStatus.PRODUCTION)
+        self.assertEqual(episode.created_at, datetime(2025, 4, 14, 9, 0, 0))
+        self.assertIsInstance(episode.id, UUID)
+        self.assertEqual(episode.duration, 100)
+        self.assertIsNone(episode.global_duration)
+
+    def test_from_dict_rejects_bad_values(self):
+        """Test that wrong types, unknown statuses and missing fields are rejected."""
+        with self.assertRaises(msgspec.ValidationError):
+            Episode.from_dict(episode_data(frame_start="first"))
+        with self.assertRaises(msgspec.ValidationError):
+            Episode.from_dict(episode_data(status="shipped"))
+        with self.assertRaises(msgspec.ValidationError):
+            Episode.from_dict({"name": "Pilot", "code": "ep001"})
+
+    def test_frame_ranges_validated(self):
+        """Test that ranges ending before they start are rejected."""
+        with self.assertRaises(msgspec.ValidationError):
+            Episode.from_dict(episode_data(frame_start=1100, frame_end=1001))
+        with self.assertRaises(ValueError):
+            EpisodeCreate(series_id=SERIES_ID, name="Pilot", code="ep001",
+                          global_frame_start=2000, global_frame_end=1000)
+
+    def test_from_orm(self):
+        """Test that an episode is built from an object's attributes."""
+        row = SimpleNamespace(id=uuid4(), series_id=SERIES_ID, name="Pilot", code="ep001",
+                              created_by="lead", frame_start=1001, frame_end=1048)
+
+        episode = Episode.from_orm(row)
+
+        self.assertEqual(episode.id, row.id)
+        self.assertEqual(episode.duration, 48)
+
+
+class TestEpisodeSerialization(unittest.TestCase):
+    """Test converting episodes back to plain data."""
+
+    def test_json_round_trip(self):
+        """Test that an episode survives encoding to JSON and validating it again."""
+        episode = Episode.from_dict(episode_data(metadata={"network": "pbs"}))
+
+        decoded = Episode.from_dict(json.loads(episode.json()))
+
+        self.assertEqual(decoded, episode)
+
+    def test_dict(self):
+        """Test that dict returns the field values unconverted."""
+        episode = Episode.from_dict(episode_data())
+
+        data = episode.dict()
+
+        self.assertEqual(data["series_id"], SERIES_ID)
+        self.assertIs(data["status"], EpisodeStatus.PLANNING)
+        self.assertEqual(set(data), set(Episode.__struct_fields__))
+
+    def test_update_omits_unset_fields(self):
+        """Test that an update serializes only the fields it sets."""
+        update = EpisodeUpdate.from_dict({"name": "Pilot (recut)", "status": "post"})
+
+        self.assertEqual(json.loads(update.json()), {"name": "Pilot (recut)", "status": "post"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# test_folder_structure.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the folder structure templates and workflows.
+"""
+
+import copy
+import dataclasses
+import unittest
+
+from bifrost.models.folder_structure.core import FolderTemplate
+from bifrost.models.folder_structure.workflow import Workflow
+
+
+class TestFolderTemplate(unittest.TestCase):
+    """Test formatting folder templates."""
+
+    def assertFormatsLikeStr(self, template, **kwargs):
+        """Assert that a template formats the same as str.format."""
+        folder_template = FolderTemplate(template)
+        self.assertEqual(folder_template.format(**kwargs), template.format(**kwargs))
+        self.assertEqual(folder_template.format_map(kwargs), template.format_map(kwargs))
+
+    def test_plain_fields(self):
+        """Test templates with plain named fields."""
+        self.assertFormatsLikeStr("{project}/assets/{asset_type}/{asset}",
+                                  project="show", asset_type="char", asset="hero")
+
+    def test_format_spec_and_conversion(self):
+        """Test fields with format specs and conversions."""
+        self.assertFormatsLikeStr("{shot}/v{version:03d}/{name!r}_{scale:.2f}",
+                                  shot="sh010", version=7, name="anim", scale=1.5)
+
+    def test_literals(self):
+        """Test literal text that needs escaping in generated code."""
+        self.assertFormatsLikeStr("C:\\show\\{{escaped}}\\\"{name}\"\n'", name="hero")
+        self.assertFormatsLikeStr("static/path")
+        self.assertFormatsLikeStr("")
+
+    def test_fallback_templates(self):
+        """Test templates that fall back to str.format."""
+        self.assertFormatsLikeStr("{entity.name}/{parts[0]}", entity=type("E", (), {"name": "hero"}),
+                                  parts=["a"])
+        self.assertFormatsLikeStr("{version:{width}d}", version=7, width=4)
+
+    def test_missing_variable(self):
+        """Test that a missing variable raises KeyError like str.format."""
+        with self.assertRaises(KeyError):
+            FolderTemplate("{project}/{asset}").format(project="show")
+
+    def test_field_names(self):
+        """Test that the template's field names are collected."""
+        template = FolderTemplate("{project}/{asset}/v{version:03d}/{asset}")
+
+        self.assertEqual(template.field_names, frozenset({"project", "asset", "version"}))
+
+    def test_equality_ignores_compiled_state(self):
+        """Test that templates compare and print by their template and variables."""
+        template = FolderTemplate("{project}", ["project"])
+
+        self.assertEqual(template, FolderTemplate("{project}", ["project"]))
+        self.assertEqual(repr(template), "FolderTemplate(template='{project}', variables=['project'])")
+
+    def test_reassigned_template(self):
+        """Test that a reassigned template is compiled again."""
+        template = FolderTemplate("{project}/{asset}")
+        self.assertEqual(template.format(project="show", asset="hero"), "show/hero")
+
+        template.template = "{project}/shots/{shot}"
+
+        self.assertEqual(template.format(project="show", shot="sh010"), "show/shots/sh010")
+        self.assertEqual(template.field_names, frozenset({"project", "shot"}))
+
+    def test_copies(self):
+        """Test that copies format like the original."""
+        template = FolderTemplate("{project}/{asset}")
+        template.format(project="show", asset="hero")
+
+        self.assertEqual(copy.copy(template).format(project="show", asset="prop"), "show/prop")
+        self.assertEqual(copy.deepcopy(template).field_names, frozenset({"project", "asset"}))
+
+    def test_asdict_has_only_fields(self):
+        """Test that the compiled template is not part of the dataclass fields."""
+        template = FolderTemplate("{project}", ["project"])
+        template.format(project="show")
+
+        self.assertEqual(dataclasses.asdict(template), {"template": "{project}", "variables": ["project"]})
+
+
+def make_workflow():
+    """Create a workflow with one asset type and one shot type."""
+    return Workflow(
+        name="default",
+        asset_types={"character": {"sequence": ["model", "rig", "lookdev"]}},
+        shot_types={"standard": {"sequence": ["layout", "anim", "light"]}},
+    )
+
+
+class TestWorkflow(unittest.TestCase):
+    """Test looking up department sequences in a workflow."""
+
+    def test_stages(self):
+        """Test the sequence and neighbouring departments of a type."""
+        workflow = make_workflow()
+
+        self.assertEqual(workflow.stages_for("asset", "character"), ["model", "rig", "lookdev"])
+        self.assertEqual(workflow.next_stages("shot", "standard", "layout"), ["anim"])
+        self.assertEqual(workflow.previous_stages("shot", "standard", "layout"), [])
+        self.assertEqual(workflow.previous_stages("asset", "character", "lookdev"), ["rig"])
+
+    def test_unknown_types(self):
+        """Test that unknown kinds and types have no departments."""
+        workflow = make_workflow()
+
+        self.assertEqual(workflow.stages_for("shot", "character"), [])
+        self.assertEqual(workflow.stages_for("sequence", "standard"), [])
+        self.assertEqual(workflow.next_stages("asset", "prop", "model"), [])
+
+    def test_edited_types(self):
+        """Test that edits to the type definitions are seen by later lookups."""
+        workflow = make_workflow()
+        self.assertEqual(workflow.next_stages("asset", "character", "rig"), ["lookdev"])
+
+        workflow.asset_types["character"]["sequence"].insert(2, "groom")
+        workflow.shot_types["fx"] = {"sequence": ["anim", "fx"]}
+
+        self.assertEqual(workflow.next_stages("asset", "character", "rig"), ["groom"])
+        self.assertEqual(workflow.stages_for("shot", "fx"), ["anim", "fx"])
+
+        workflow.shot_types = {}
+
+        self.assertEqual(workflow.stages_for("shot", "standard"), [])
+
+    def test_copies(self):
+        """Test that copies look up departments like the original."""
+        workflow = make_workflow()
+        workflow.stages_for("asset", "character")
+
+        self.assertEqual(copy.copy(workflow).stages_for("asset", "character"), ["model", "rig", "lookdev"])
+        self.assertEqual(copy.deepcopy(workflow).next_stages("shot", "standard", "anim"), ["light"])
+
+    def test_asdict_has_only_fields(self):
+        """Test that the department index is not part of the dataclass fields."""
+        workflow = make_workflow()
+        workflow.stages_for("asset", "character")
+
+        self.assertEqual(dataclasses.asdict(workflow),
+                         {"name": "default",
+                          "asset_types": {"character": {"sequence": ["model", "rig", "lookdev"]}},
+                          "shot_types": {"standard": {"sequence": ["layout", "anim", "light"]}}})
+        self.assertEqual(repr(workflow).count("_stage"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
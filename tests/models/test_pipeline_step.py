@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# test_pipeline_step.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the pipeline step and workflow models.
+"""
+
+import unittest
+
+from bifrost.models.pipeline_step import (
+    AssetWorkflow, DepartmentDependency, FileFormat, PipelineWorkflow, ShotWorkflow,
+    intern_config
+)
+
+
+def make_workflow(asset_sequences=(), shot_sequences=()):
+    """Create a workflow from department ID sequences."""
+    return PipelineWorkflow(
+        name="Feature",
+        created_by="lead",
+        asset_workflows=[AssetWorkflow(asset_type=f"type{i}", sequence=sequence)
+                         for i, sequence in enumerate(asset_sequences)],
+        shot_workflows=[ShotWorkflow(shot_type=f"type{i}", sequence=sequence)
+                        for i, sequence in enumerate(shot_sequences)])
+
+
+class TestTopologicalOrder(unittest.TestCase):
+    """Test ordering the departments of a workflow."""
+
+    def assertBefore(self, order, before, after):
+        """Assert that department before comes earlier in order than after."""
+        self.assertLess(order.index(before), order.index(after), order)
+
+    def test_single_sequence(self):
+        """Test that a single sequence keeps its order."""
+        workflow = make_workflow([("modeling", "texture", "shading")])
+
+        self.assertEqual(workflow.topological_order, ["modeling", "texture", "shading"])
+
+    def test_merged_sequences(self):
+        """Test that every department comes before those following it in any sequence."""
+        workflow = make_workflow(
+            [("modeling", "rigging"), ("modeling", "texture", "shading")],
+            [("layout", "animation", "lighting"), ("rigging", "animation"), ("shading", "lighting")])
+
+        order = workflow.topological_order
+
+        self.assertEqual(sorted(order), sorted(set(order)))
+        self.assertEqual(set(order), {"modeling", "rigging", "texture", "shading",
+                                      "layout", "animation", "lighting"})
+        for before, after in [("modeling", "rigging"), ("modeling", "texture"),
+                              ("texture", "shading"), ("layout", "animation"),
+                              ("animation", "lighting"), ("rigging", "animation"),
+                              ("shading", "lighting")]:
+            self.assertBefore(order, before, after)
+
+    def test_independent_sequences_keep_order(self):
+        """Test that unconnected sequences are listed in the order they are declared."""
+        workflow = make_workflow([("modeling", "rigging")], [("layout", "animation")])
+
+        self.assertEqual(workflow.topological_order, ["modeling", "rigging", "layout", "animation"])
+
+    def test_cycle(self):
+        """Test that a cycle still lists every department once."""
+        workflow = make_workflow([("modeling", "rigging"), ("rigging", "modeling")])
+
+        self.assertEqual(sorted(workflow.topological_order), ["modeling", "rigging"])
+
+    def test_empty(self):
+        """Test that a workflow without sequences has no departments."""
+        self.assertEqual(make_workflow().topological_order, [])
+
+
+class TestInternConfig(unittest.TestCase):
+    """Test sharing instances of the frozen configuration models."""
+
+    def test_equal_values_share_an_instance(self):
+        """Test that equal values return the instance interned first."""
+        first = intern_config(FileFormat(type="cache", formats=("abc", "usd"), location="cache"))
+        second = intern_config(FileFormat(type="cache", formats=("abc", "usd"), location="cache"))
+
+        self.assertIs(first, second)
+
+    def test_different_values_kept_apart(self):
+        """Test that values that differ are not merged."""
+        approved = intern_config(DepartmentDependency(department="modeling"))
+        review = intern_config(DepartmentDependency(department="modeling", status="review"))
+        workflow = intern_config(AssetWorkflow(asset_type="prop", sequence=("modeling",)))
+
+        self.assertIsNot(approved, review)
+        self.assertEqual(review.status, "review")
+        self.assertEqual(workflow.sequence, ("modeling",))
+
+
+class TestTrustedConstruction(unittest.TestCase):
+    """Test building models from trusted data."""
+
+    def test_from_trusted_dict(self):
+        """Test that models are built without validation and derived state is computed."""
+        asset_workflow = AssetWorkflow(asset_type="prop", sequence=("modeling", "texture"))
+
+        workflow = PipelineWorkflow.from_trusted_dict(
+            {"name": "Feature", "created_by": "lead", "asset_workflows": [asset_workflow]})
+
+        self.assertIsInstance(workflow, PipelineWorkflow)
+        self.assertEqual(workflow.topological_order, ["modeling", "texture"])
+        self.assertTrue(workflow.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
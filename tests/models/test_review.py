@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# test_review.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the Review model.
+"""
+
+import copy
+import dataclasses
+import unittest
+
+from bifrost.models.review import Review, ReviewItem, ReviewNote
+
+
+def make_item(item_id):
+    """Create a review item for a shot."""
+    return ReviewItem(id=f"i-{item_id}", review_id="r1", item_id=item_id,
+                      item_type="shot", version_id="v001")
+
+
+def make_note(content="Fix the hand pose"):
+    """Create a review note."""
+    return ReviewNote(id="n1", review_id="r1", item_id="", author="lead", content=content)
+
+
+def make_review(*item_ids):
+    """Create a review with items for the given shot IDs."""
+    return Review(id="r1", name="Dailies", items=[make_item(item_id) for item_id in item_ids])
+
+
+class TestReviewNotes(unittest.TestCase):
+    """Test adding notes to review items."""
+
+    def test_add_note(self):
+        """Test that notes go to the first item with the item ID."""
+        review = make_review("sh010", "sh020", "sh020")
+
+        self.assertTrue(review.add_note("sh020", make_note()))
+
+        self.assertEqual([len(item.notes) for item in review.items], [0, 1, 0])
+        self.assertFalse(review.add_note("sh030", make_note()))
+
+    def test_add_item(self):
+        """Test that added items can take notes."""
+        review = make_review("sh010")
+        review.add_note("sh010", make_note())
+
+        review.add_item(make_item("sh020"))
+
+        self.assertTrue(review.add_note("sh020", make_note()))
+        self.assertEqual(len(review.items[1].notes), 1)
+
+    def test_replaced_item(self):
+        """Test that a note goes to an item that replaced another in place."""
+        review = make_review("sh010", "sh020")
+        review.add_note("sh010", make_note())
+
+        review.items[0] = make_item("sh030")
+
+        self.assertTrue(review.add_note("sh030", make_note()))
+        self.assertEqual(len(review.items[0].notes), 1)
+        self.assertFalse(review.add_note("sh010", make_note()))
+
+    def test_replaced_item_with_same_id(self):
+        """Test that a note goes to the new item rather than the detached old one."""
+        review = make_review("sh010", "sh020")
+        review.add_note("sh010", make_note())
+
+        review.items[0] = make_item("sh010")
+        review.add_note("sh010", make_note("second"))
+
+        self.assertEqual([note.content for note in review.items[0].notes], ["second"])
+
+    def test_modified_items(self):
+        """Test lookups after items are removed, reordered or reassigned."""
+        review = make_review("sh010", "sh020", "sh030")
+        review.add_note("sh030", make_note())
+
+        del review.items[0]
+        review.items.reverse()
+        self.assertTrue(review.add_note("sh020", make_note()))
+        self.assertEqual(len(review.items[1].notes), 1)
+
+        review.items = [make_item("sh040")]
+        self.assertFalse(review.add_note("sh020", make_note()))
+        self.assertTrue(review.add_note("sh040", make_note()))
+
+    def test_copies(self):
+        """Test that a deep copy adds notes to its own items."""
+        review = make_review("sh010")
+        review.add_note("sh010", make_note())
+
+        review_copy = copy.deepcopy(review)
+        review_copy.add_note("sh010", make_note())
+
+        self.assertEqual(len(review.items[0].notes), 1)
+        self.assertEqual(len(review_copy.items[0].notes), 2)
+
+    def test_asdict_has_only_fields(self):
+        """Test that the item index is not part of the dataclass fields."""
+        review = make_review("sh010")
+        review.add_note("sh010", make_note())
+
+        self.assertEqual(set(dataclasses.asdict(review)),
+                         {field.name for field in dataclasses.fields(Review)})
+        self.assertFalse(any(field.name.startswith("_") for field in dataclasses.fields(Review)))
+
+
+if __name__ == "__main__":
+    unittest.main()
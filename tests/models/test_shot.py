@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# test_shot.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the Shot model.
+"""
+
+import copy
+import dataclasses
+import unittest
+from datetime import datetime
+
+from bifrost.models.shot import Shot, ShotStatus, ShotVersion
+
+
+def make_shot(*version_numbers, **kwargs):
+    """Create a shot with versions numbered as given."""
+    return Shot(id="s1", code="sq010_sh010", sequence_id="sq010",
+                versions=[ShotVersion(number) for number in version_numbers], **kwargs)
+
+
+class TestShotVersions(unittest.TestCase):
+    """Test looking up the latest versions of a shot."""
+
+    def test_latest_version(self):
+        """Test that the highest numbered version is the latest."""
+        shot = make_shot(2, 3, 1)
+
+        self.assertEqual(shot.latest_version.version_number, 3)
+        self.assertIsNone(make_shot().latest_version)
+
+    def test_add_version_keeps_order(self):
+        """Test that added versions are inserted by version number."""
+        shot = make_shot(1, 4)
+
+        shot.add_version(ShotVersion(2))
+
+        self.assertEqual([v.version_number for v in shot.versions], [1, 2, 4])
+
+    def test_reassigned_versions(self):
+        """Test that a reassigned list of the same length is scanned, not trusted or sorted."""
+        shot = make_shot(1, 2)
+        self.assertEqual(shot.latest_version.version_number, 2)
+
+        versions = [ShotVersion(3), ShotVersion(1)]
+        shot.versions = versions
+
+        self.assertEqual(shot.latest_version.version_number, 3)
+        self.assertEqual([v.version_number for v in versions], [3, 1])
+
+    def test_replaced_version(self):
+        """Test that a version replaced in place is seen."""
+        shot = make_shot(1, 2)
+        self.assertEqual(shot.latest_version.version_number, 2)
+
+        shot.versions[0] = ShotVersion(9)
+
+        self.assertEqual(shot.latest_version.version_number, 9)
+
+    def test_renumbered_latest_version(self):
+        """Test that renumbering the latest version in place is seen."""
+        shot = make_shot(1, 2, 3)
+        shot.versions[-1].status = ShotStatus.APPROVED
+        shot.versions[0].status = ShotStatus.APPROVED
+
+        shot.versions[-1].version_number = 0
+
+        self.assertEqual(shot.latest_version.version_number, 2)
+        self.assertEqual(shot.latest_approved_version.version_number, 1)
+
+    def test_latest_approved_version(self):
+        """Test that status changes made in place are seen."""
+        shot = make_shot(1, 2, 3)
+        self.assertIsNone(shot.latest_approved_version)
+
+        shot.versions[1].status = ShotStatus.APPROVED
+
+        self.assertEqual(shot.latest_approved_version.version_number, 2)
+
+    def test_copies(self):
+        """Test that copies look up versions and durations like the original."""
+        shot = make_shot(1, 3, frame_range=(1001, 1100))
+
+        shot_copy = copy.copy(shot)
+
+        self.assertEqual(shot_copy.latest_version.version_number, 3)
+        self.assertEqual(shot_copy.duration, 100)
+
+    def test_asdict_has_only_fields(self):
+        """Test that cached values are not part of the dataclass fields."""
+        shot = make_shot(1)
+
+        self.assertEqual(set(dataclasses.asdict(shot)),
+                         {field.name for field in dataclasses.fields(Shot)})
+        self.assertFalse(any(field.name.startswith("_") for field in dataclasses.fields(Shot)))
+
+
+class TestShotDurations(unittest.TestCase):
+    """Test shot duration calculations."""
+
+    def test_durations_follow_range_changes(self):
+        """Test that durations are recomputed when the ranges are replaced."""
+        shot = make_shot(frame_range=(1001, 1100), handle_range=(8, 8))
+        self.assertEqual(shot.duration, 100)
+        self.assertEqual(shot.duration_with_handles, 116)
+
+        shot.frame_range = (1001, 1050)
+        shot.handle_range = (0, 0)
+
+        self.assertEqual(shot.duration, 50)
+        self.assertEqual(shot.duration_with_handles, 50)
+
+
+class TestShotArrays(unittest.TestCase):
+    """Test the packed frame and version arrays used for bulk reports."""
+
+    def test_pack_frame_arrays(self):
+        """Test that frame ranges are packed into start and end arrays."""
+        shots = [make_shot(frame_range=(1001, 1100)), make_shot(frame_range=(1, 24))]
+
+        starts, ends = Shot.pack_frame_arrays(shots)
+
+        self.assertEqual(list(starts), [1001, 1])
+        self.assertEqual(list(ends), [1100, 24])
+
+    def test_total_duration(self):
+        """Test that durations are summed, counting inverted ranges as no frames."""
+        shots = [make_shot(frame_range=(1001, 1100)), make_shot(frame_range=(1, 24)),
+                 make_shot(frame_range=(50, 10))]
+
+        self.assertEqual(Shot.total_duration(shots), 124)
+        self.assertEqual(Shot.total_duration([]), 0)
+
+    def test_pack_version_arrays(self):
+        """Test that version numbers, status codes and creation times are packed."""
+        versions = [ShotVersion(1, created_at=datetime(1970, 1, 1, 0, 0, 1)),
+                    ShotVersion(2, created_at=datetime(1970, 1, 1), status=ShotStatus.FINAL)]
+
+        numbers, statuses, ctimes = Shot.pack_version_arrays(versions)
+
+        self.assertEqual(list(numbers), [1, 2])
+        self.assertEqual(list(statuses), [list(ShotStatus).index(ShotStatus.IN_PROGRESS),
+                                          list(ShotStatus).index(ShotStatus.FINAL)])
+        self.assertEqual(list(ctimes), [1_000_000_000, 0])
+
+    def test_approved_versions(self):
+        """Test that approved and final versions are collected in shot order."""
+        first, second = make_shot(1, 2, 3), make_shot(1, 2)
+        first.versions[0].status = ShotStatus.APPROVED
+        first.versions[2].status = ShotStatus.FINAL
+        second.versions[1].status = ShotStatus.APPROVED
+
+        approved = Shot.approved_versions([first, second])
+
+        self.assertEqual(approved, [first.versions[0], first.versions[2], second.versions[1]])
+        self.assertEqual(Shot.approved_versions([make_shot(1)]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
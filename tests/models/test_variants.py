@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# test_variants.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the generated Create and Update models.
+"""
+
+import unittest
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from bifrost.models.project import Project, ProjectCreate, ProjectUpdate
+from bifrost.models.sequence import SequenceCreate, SequenceUpdate
+from bifrost.models.task import Task, TaskCreate, TaskPriority, TaskUpdate
+
+
+class TestCreateVariants(unittest.TestCase):
+    """Test the models for creating domain objects."""
+
+    def test_fields_exclude_system_fields(self):
+        """Test that fields set by the system are left out and the rest are kept."""
+        self.assertEqual(set(TaskCreate.model_fields),
+                         set(Task.model_fields) - {'id', 'created_at', 'created_by'})
+        self.assertEqual(set(ProjectCreate.model_fields),
+                         set(Project.model_fields)
+                         - {'id', 'created_at', 'created_by', 'updated_at', 'updated_by'})
+        self.assertEqual(TaskCreate.__name__, 'TaskCreate')
+        self.assertEqual(TaskCreate.__doc__, "Model for creating a new task.")
+        self.assertEqual(TaskCreate.__module__, 'bifrost.models.task')
+
+    def test_defaults_and_required_fields(self):
+        """Test that defaults and required fields match the domain model."""
+        task = TaskCreate(name="Block shot", description="")
+
+        self.assertIs(task.priority, TaskPriority.MEDIUM)
+        self.assertEqual(task.tags, [])
+        with self.assertRaises(ValidationError):
+            TaskCreate(name="Block shot")
+
+    def test_constraints(self):
+        """Test that field constraints are kept."""
+        with self.assertRaises(ValidationError):
+            TaskCreate(name="ab", description="")
+        with self.assertRaises(ValidationError):
+            TaskCreate(name="Block shot", description="", estimated_hours=-1)
+        with self.assertRaises(ValidationError):
+            ProjectCreate(project_code="x", name="Show")
+
+    def test_validators(self):
+        """Test that attached validators run."""
+        with self.assertRaises(ValidationError):
+            SequenceCreate(name="Opening", code="sq010", frame_start=1100, frame_end=1001)
+
+        sequence = SequenceCreate(name="Opening", code="sq010", frame_start=1001, frame_end=1100)
+
+        self.assertEqual(sequence.frame_end, 1100)
+
+
+class TestUpdateVariants(unittest.TestCase):
+    """Test the models for partially updating domain objects."""
+
+    def test_every_field_optional(self):
+        """Test that an empty update is valid and sets nothing."""
+        update = TaskUpdate()
+
+        self.assertIsNone(update.name)
+        self.assertEqual(update.model_dump(exclude_unset=True), {})
+        self.assertNotIn('id', TaskUpdate.model_fields)
+
+    def test_only_given_fields_set(self):
+        """Test that only the fields given are part of the update."""
+        assignee_id = uuid4()
+        update = TaskUpdate(priority="high", assignee_id=str(assignee_id))
+
+        self.assertEqual(update.model_dump(exclude_unset=True),
+                         {'priority': TaskPriority.HIGH, 'assignee_id': assignee_id})
+
+    def test_constraints_apply_to_given_values(self):
+        """Test that constraints still apply to values that are given."""
+        with self.assertRaises(ValidationError):
+            TaskUpdate(name="ab")
+        with self.assertRaises(ValidationError):
+            TaskUpdate(estimated_hours=-1)
+        with self.assertRaises(ValidationError):
+            ProjectUpdate(project_code="x")
+
+    def test_validators(self):
+        """Test that validators compare against fields given in the same update."""
+        with self.assertRaises(ValidationError):
+            SequenceUpdate(frame_start=1100, frame_end=1001)
+
+        self.assertEqual(SequenceUpdate(frame_end=1001).frame_end, 1001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# test_review_repository.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the review repository, against a temporary SQLite database.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# psycopg2 is only needed for PostgreSQL connections
+with patch.dict('sys.modules', {
+    'psycopg2': MagicMock(),
+    'psycopg2.extras': MagicMock(),
+}):
+    from bifrost.core.database import DatabaseManager
+    from bifrost.repositories import review_repository
+    from bifrost.repositories.review_repository import ReviewRepository
+
+from bifrost.models.review import Review, ReviewItem, ReviewNote, ReviewStatus
+
+
+T0 = datetime(2025, 4, 14, 9, 0, 0)
+
+
+def make_note(note_id, content, timestamp=T0):
+    """Create a review note."""
+    return ReviewNote(id=note_id, review_id="", item_id="", author="lead",
+                      content=content, timestamp=timestamp)
+
+
+def make_item(item_id, shot_id, notes=None):
+    """Create a review item for a shot."""
+    return ReviewItem(id=item_id, review_id="", item_id=shot_id, item_type="shot",
+                      version_id="v001", notes=notes or [])
+
+
+class ReviewRepositoryTestCase(unittest.TestCase):
+    """Base test case with a repository on an empty temporary database."""
+
+    def setUp(self):
+        """Create the database and repository."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        # Bypass the singleton so each test gets its own database
+        database = object.__new__(DatabaseManager)
+        database.db_type = 'sqlite'
+        database._db_path = Path(temp_dir.name) / 'bifrost.db'
+        database._initialize_database()
+        database._initialized = True
+
+        patcher = patch.object(review_repository, 'db', database)
+        self.db = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.repository = ReviewRepository()
+
+
+class TestReviewQueries(ReviewRepositoryTestCase):
+    """Test loading reviews with their items and notes."""
+
+    def test_items_and_notes_keep_insertion_order(self):
+        """Test that items and notes come back in the order they were added."""
+        # Item IDs sort in the opposite order to insertion
+        items = [
+            make_item("z-item", "sh010", [make_note("n-b", "first"), make_note("n-a", "second")]),
+            make_item("a-item", "sh020", [make_note("n-c", "third")]),
+        ]
+        self.repository.create_review(Review(id="r1", name="Dailies", created_at=T0, items=items))
+
+        review = self.repository.get_review("r1")
+
+        self.assertEqual([item.item_id for item in review.items], ["sh010", "sh020"])
+        self.assertEqual([note.content for note in review.items[0].notes], ["first", "second"])
+        self.assertEqual([note.content for note in review.items[1].notes], ["third"])
+
+    def test_notes_ordered_by_timestamp(self):
+        """Test that notes are ordered by timestamp before insertion order."""
+        notes = [make_note("n1", "later", T0 + timedelta(minutes=5)), make_note("n2", "earlier", T0)]
+        self.repository.create_review(Review(id="r1", name="Dailies", created_at=T0,
+                                             items=[make_item("i1", "sh010", notes)]))
+
+        review = self.repository.get_review("r1")
+
+        self.assertEqual([note.content for note in review.items[0].notes], ["earlier", "later"])
+
+    def test_get_review_fields(self):
+        """Test that review, item and note fields round-trip."""
+        note = make_note("n1", "Fix the hand pose")
+        note.frame = 1012
+        note.attachments = [Path("/show/notes/n1.png")]
+        self.repository.create_review(Review(
+            id="r1", name="Dailies", description="Anim dailies", created_at=T0,
+            created_by="lead", status=ReviewStatus.IN_PROGRESS, metadata={"round": 2},
+            items=[make_item("i1", "sh010", [note])]))
+
+        review = self.repository.get_review("r1")
+
+        self.assertEqual(review.name, "Dailies")
+        self.assertEqual(review.description, "Anim dailies")
+        self.assertEqual(review.created_at, T0)
+        self.assertEqual(review.status, ReviewStatus.IN_PROGRESS)
+        self.assertEqual(review.metadata, {"round": 2})
+        self.assertEqual(review.items[0].version_id, "v001")
+        loaded_note = review.items[0].notes[0]
+        self.assertEqual(loaded_note.frame, 1012)
+        self.assertEqual(loaded_note.timestamp, T0)
+        self.assertEqual([str(path) for path in loaded_note.attachments], ["/show/notes/n1.png"])
+
+    def test_get_missing_review(self):
+        """Test that an unknown review ID returns None."""
+        self.assertIsNone(self.repository.get_review("missing"))
+
+    def test_review_without_items(self):
+        """Test that reviews without items are still returned."""
+        self.repository.create_review(Review(id="r1", name="Empty", created_at=T0))
+
+        review = self.repository.get_review("r1")
+
+        self.assertEqual(review.items, [])
+
+    def test_list_reviews_paginates_reviews(self):
+        """Test that limit and offset count reviews rather than joined rows."""
+        for index in range(4):
+            items = [make_item(f"i{index}{n}", f"sh0{n}0", [make_note(f"n{index}{n}", "note")])
+                     for n in range(3)]
+            self.repository.create_review(Review(id=f"r{index}", name=f"Review {index}",
+                                                 created_at=T0 + timedelta(hours=index), items=items))
+
+        reviews = self.repository.list_reviews(limit=2, offset=1)
+
+        self.assertEqual([review.id for review in reviews], ["r2", "r1"])
+        self.assertTrue(all(len(review.items) == 3 for review in reviews))
+
+    def test_get_item_reviews(self):
+        """Test that reviews containing an item are returned once each, newest first."""
+        self.repository.create_review(Review(id="r1", name="Old", created_at=T0,
+                                             items=[make_item("i1", "sh010"), make_item("i2", "sh020")]))
+        self.repository.create_review(Review(id="r2", name="New", created_at=T0 + timedelta(days=1),
+                                             items=[make_item("i3", "sh010")]))
+        self.repository.create_review(Review(id="r3", name="Other", created_at=T0,
+                                             items=[make_item("i4", "sh030")]))
+
+        reviews = self.repository.get_item_reviews("sh010")
+
+        self.assertEqual([review.id for review in reviews], ["r2", "r1"])
+        self.assertEqual(len(reviews[1].items), 2)
+        self.assertEqual(self.repository.get_item_reviews("sh010", item_type="asset"), [])
+
+    def test_query_portable_to_postgresql(self):
+        """Test that the joined query uses no SQLite-specific columns on PostgreSQL."""
+        with patch.object(self.db, 'db_type', 'postgresql'), \
+                patch.object(self.db, 'execute', return_value=[]) as execute:
+            self.assertIsNone(self.repository.get_review("r1"))
+
+        query = execute.call_args[0][0]
+        self.assertNotIn("rowid", query)
+        self.assertIn("i.id", query)
+
+
+class TestReviewCache(ReviewRepositoryTestCase):
+    """Test caching of review rows in get_review."""
+
+    def setUp(self):
+        """Create a review and count the queries made for it."""
+        super().setUp()
+        self.repository.create_review(Review(id="r1", name="Dailies", created_at=T0,
+                                             items=[make_item("i1", "sh010")]))
+        query = patch.object(self.repository, '_query_review_rows',
+                             wraps=self.repository._query_review_rows)
+        self.query = query.start()
+        self.addCleanup(query.stop)
+
+    def test_repeated_lookups_use_cache(self):
+        """Test that a second lookup reuses the cached rows but builds a new Review."""
+        first = self.repository.get_review("r1")
+        second = self.repository.get_review("r1")
+
+        self.assertEqual(self.query.call_count, 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.items[0].item_id, second.items[0].item_id)
+
+    def test_changes_invalidate_cache(self):
+        """Test that changes through the repository are seen by the next lookup."""
+        self.repository.get_review("r1")
+
+        self.repository.add_note("r1", "sh010", make_note("n1", "Fix the hand pose"))
+        review = self.repository.get_review("r1")
+
+        self.assertEqual([note.content for note in review.items[0].notes], ["Fix the hand pose"])
+
+        review.name = "Renamed"
+        self.repository.update_review(review)
+
+        self.assertEqual(self.repository.get_review("r1").name, "Renamed")
+
+        self.repository.update_note_status("n1", "resolved")
+
+        self.assertEqual(self.repository.get_review("r1").items[0].notes[0].status, "resolved")
+
+        self.repository.delete_review("r1")
+
+        self.assertIsNone(self.repository.get_review("r1"))
+
+    def test_cache_expires(self):
+        """Test that rows changed outside the repository are read again after the TTL."""
+        self.repository.get_review("r1")
+        self.db.execute("UPDATE reviews SET name = ? WHERE id = ?", ("Changed elsewhere", "r1"))
+
+        self.assertEqual(self.repository.get_review("r1").name, "Dailies")
+
+        with patch.object(review_repository.time, 'monotonic',
+                          return_value=review_repository.time.monotonic() + 31):
+            self.assertEqual(self.repository.get_review("r1").name, "Changed elsewhere")
+
+    def test_cache_is_bounded(self):
+        """Test that only the most recently read reviews are kept."""
+        repository = ReviewRepository(cache_size=2)
+        for review_id in ("r1", "r2", "r3"):
+            repository.get_review(review_id)
+
+        self.assertEqual(list(repository._review_rows), ["r2", "r3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
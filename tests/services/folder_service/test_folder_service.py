@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# test_folder_service.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for loading the folder service configuration files.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# psycopg2 is only needed for PostgreSQL connections
+with patch.dict('sys.modules', {
+    'psycopg2': MagicMock(),
+    'psycopg2.extras': MagicMock(),
+}):
+    from bifrost.services.folder_service import folder_service
+    from bifrost.services.folder_service.folder_service import FolderService
+
+
+SERIES_YAML = """
+series:
+  name: "Cosmic Adventures"
+  code: "CA"
+  numbering:
+    shot_pattern: "SH{number:04d}"
+  episodes:
+    - id: "E01"
+      name: "Pilot"
+      sequences:
+        - id: "SQ001"
+          name: "Opening"
+          shot_count: 12
+"""
+
+
+class TestFolderServiceYamlCache(unittest.TestCase):
+    """Test sharing parsed configuration files between folder services."""
+
+    def setUp(self):
+        """Write a series file and point the configuration at it."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.series_file = Path(temp_dir.name) / "series_metadata.yaml"
+        self.series_file.write_text(SERIES_YAML)
+
+        config = {
+            "folder_structure.mappings_file": str(Path(temp_dir.name) / "missing_mapping.yaml"),
+            "folder_structure.dependencies_file": str(Path(temp_dir.name) / "missing_deps.yaml"),
+            "folder_structure.series_file": str(self.series_file),
+        }
+        patcher = patch.object(folder_service, "get_config",
+                               side_effect=lambda key, default=None: config.get(key, default))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        folder_service._parse_yaml.cache_clear()
+        self.addCleanup(folder_service._parse_yaml.cache_clear)
+
+    def test_file_parsed_once(self):
+        """Test that services share the parse of an unchanged file."""
+        FolderService()
+        FolderService()
+
+        info = folder_service._parse_yaml.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_services_do_not_share_data(self):
+        """Test that edits to one service's series data are not seen by another."""
+        first = FolderService()
+        first.get_sequence_info("E01", "SQ001")["shot_count"] = 99
+        first.series_info.numbering["shot_pattern"] = "X{number}"
+        first.series_info.episodes[0].sequences.clear()
+
+        second = FolderService()
+
+        self.assertEqual(second.get_sequence_info("E01", "SQ001")["shot_count"], 12)
+        self.assertEqual(second.generate_shot_id("E01", "SQ001", 10), "SH0010")
+        self.assertEqual(len(second.series_info.episodes[0].sequences), 1)
+
+    def test_changed_file_reparsed(self):
+        """Test that a file is parsed again when its modification time changes."""
+        FolderService()
+        self.series_file.write_text(SERIES_YAML.replace("shot_count: 12", "shot_count: 20"))
+        stat = self.series_file.stat()
+        os.utime(self.series_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        service = FolderService()
+
+        self.assertEqual(service.get_sequence_info("E01", "SQ001")["shot_count"], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
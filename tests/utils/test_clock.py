@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# test_clock.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the cached clock utilities.
+"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from bifrost.utils import clock
+from bifrost.utils.clock import cached_utcnow, now_isoformat
+
+
+class TestCachedUtcnow(unittest.TestCase):
+    """Test sharing clock reads between timestamps."""
+
+    def setUp(self):
+        """Start every test with a cold cache."""
+        patcher = patch.object(clock, '_last_utcnow', (float('-inf'), datetime.min))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cold_cache_reads_clock(self):
+        """Test that the first call returns the current time."""
+        before = datetime.utcnow()
+
+        now = cached_utcnow()
+
+        self.assertLessEqual(before, now)
+        self.assertLess(now - before, timedelta(seconds=1))
+
+    def test_reuse_within_resolution(self):
+        """Test that the timestamp is reused until it is resolution seconds old."""
+        with patch.object(clock.time, 'monotonic', return_value=100.0):
+            first = cached_utcnow()
+        with patch.object(clock.time, 'monotonic', return_value=100.004):
+            self.assertIs(cached_utcnow(), first)
+        with patch.object(clock.time, 'monotonic', return_value=100.004):
+            self.assertIsNot(cached_utcnow(resolution=0.001), first)
+        with patch.object(clock.time, 'monotonic', return_value=101.0):
+            self.assertIsNot(cached_utcnow(), first)
+
+    def test_concurrent_calls_on_cold_cache(self):
+        """Test that threads racing on a cold cache all get the current time."""
+        before = datetime.utcnow()
+        results = []
+        for _ in range(50):
+            clock._last_utcnow = (float('-inf'), datetime.min)
+            barrier = threading.Barrier(8)
+
+            def read():
+                barrier.wait()
+                results.append(cached_utcnow())
+
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(results), 400)
+        self.assertTrue(all(result >= before for result in results))
+
+
+class TestNowIsoformat(unittest.TestCase):
+    """Test formatting the current time."""
+
+    def test_second_precision(self):
+        """Test that the current local time is formatted to the second."""
+        with patch.object(clock.time, 'time', return_value=1744621530.75):
+            self.assertEqual(now_isoformat(),
+                             datetime.fromtimestamp(1744621530).isoformat(timespec='seconds'))
+
+
+if __name__ == "__main__":
+    unittest.main()
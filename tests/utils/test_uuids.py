@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# test_uuids.py
+# Part of the Bifrost Animation Asset Management System
+#
+# Created: 2025-04-14
+
+"""
+Tests for the pooled UUID generator.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from bifrost.utils import uuids
+from bifrost.utils.uuids import fast_uuid4
+
+
+class TestFastUUID4(unittest.TestCase):
+    """Test generating random UUIDs from the pool."""
+
+    def test_version_and_variant(self):
+        """Test that UUIDs are version 4 RFC 4122 UUIDs and compare like uuid.UUID."""
+        uuid = fast_uuid4()
+
+        self.assertEqual(uuid.version, 4)
+        self.assertEqual(uuid.variant, "specified in RFC 4122")
+        self.assertEqual(uuid, type(uuid)(str(uuid)))
+
+    def test_unique_across_refills(self):
+        """Test that UUIDs stay unique across several pool refills."""
+        values = [fast_uuid4() for _ in range(uuids._POOL_SIZE * 3)]
+
+        self.assertEqual(len(set(values)), len(values))
+
+    def test_pool_discarded_when_pid_changes(self):
+        """Test that a pool filled by another process is not used."""
+        fast_uuid4()
+        inherited = set(uuids._pool)
+
+        with patch.object(uuids.os, 'getpid', return_value=uuids._pool_pid + 1):
+            uuid = fast_uuid4()
+
+        self.assertNotIn(uuid.int, inherited)
+        self.assertTrue(inherited.isdisjoint(uuids._pool))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_forked_child_generates_new_uuids(self):
+        """Test that a forked child does not repeat the UUIDs its parent generates next."""
+        fast_uuid4()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                os.write(write_fd, b"".join(fast_uuid4().bytes for _ in range(8)))
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as f:
+            data = f.read()
+        os.waitpid(pid, 0)
+
+        child = {data[i:i + 16] for i in range(0, len(data), 16)}
+        parent = {fast_uuid4().bytes for _ in range(8)}
+
+        self.assertEqual(len(child), 8)
+        self.assertTrue(child.isdisjoint(parent))
+
+
+if __name__ == "__main__":
+    unittest.main()